@@ -18,11 +18,19 @@ from src.expense_tracker.business.service import ExpenseService
 from src.expense_tracker.data.repository import InMemoryExpenseRepository
 from src.expense_tracker.presentation.routes import create_expense_blueprint
 from src.sejfa.core.admin_auth import AdminAuthService
+from src.sejfa.integrations.jira_client import get_jira_client
+from src.sejfa.integrations.jira_webhook import (
+    JiraWebhookProcessor,
+    create_jira_webhook_blueprint,
+)
+from src.sejfa.monitor.event_store import open_event_store
 from src.sejfa.monitor.monitor_routes import (
     create_monitor_blueprint,
     init_socketio_events,
+    publish_node_update,
 )
 from src.sejfa.monitor.monitor_service import MonitorService
+from src.sejfa.monitor.state_backend import SqliteStateBackend
 from src.sejfa.newsflash.business.subscription_service import SubscriptionService
 from src.sejfa.newsflash.data.models import db
 from src.sejfa.newsflash.data.subscriber_repository import SubscriberRepository
@@ -66,18 +74,103 @@ def create_app(config: dict | None = None) -> Flask:
     with app.app_context():
         db.create_all()
 
+    # Monitor state shared across gunicorn workers: SQLite (WAL) file for state,
+    # message queue (e.g. redis://) so every worker broadcasts every update
+    app.config.setdefault("MONITOR_STATE_DB", os.environ.get("MONITOR_STATE_DB"))
+    app.config.setdefault(
+        "SOCKETIO_MESSAGE_QUEUE", os.environ.get("SOCKETIO_MESSAGE_QUEUE")
+    )
+
+    # Optional durable monitor event history (append-only segment files)
+    app.config.setdefault(
+        "MONITOR_EVENT_STORE_DIR", os.environ.get("MONITOR_EVENT_STORE_DIR")
+    )
+
+    # Socket.IO async mode (threading, gevent or eventlet). Production sets it
+    # through gunicorn.conf.py so it matches the gunicorn worker class; None
+    # lets Flask-SocketIO pick from what is installed.
+    app.config.setdefault(
+        "SOCKETIO_ASYNC_MODE", os.environ.get("SOCKETIO_ASYNC_MODE") or None
+    )
+
     # Initialize SocketIO for real-time monitoring
-    socketio = SocketIO(app, cors_allowed_origins="*")
+    socketio = SocketIO(
+        app,
+        cors_allowed_origins="*",
+        message_queue=app.config["SOCKETIO_MESSAGE_QUEUE"],
+        async_mode=app.config["SOCKETIO_ASYNC_MODE"],
+    )
 
     # Initialize monitoring service
-    monitor_service = MonitorService()
+    # Reads check MONITOR_STATE_DB for other workers' state at most this often
+    app.config.setdefault(
+        "MONITOR_STATE_REFRESH_INTERVAL",
+        os.environ.get("MONITOR_STATE_REFRESH_INTERVAL", 0.1),
+    )
+    state_db = app.config["MONITOR_STATE_DB"]
+    event_store_dir = app.config["MONITOR_EVENT_STORE_DIR"]
+    monitor_service = MonitorService(
+        backend=SqliteStateBackend(state_db) if state_db else None,
+        event_store=open_event_store(event_store_dir) if event_store_dir else None,
+        refresh_interval=float(app.config["MONITOR_STATE_REFRESH_INTERVAL"]),
+    )
 
     # Create and register monitoring blueprint
-    monitor_blueprint = create_monitor_blueprint(monitor_service, socketio)
+    for name, default in (
+        ("MONITOR_COALESCE_WINDOW_MS", 50),
+        ("MONITOR_COALESCE_MAX_BATCH", 50),
+        ("MONITOR_MAX_SESSIONS", 1000),
+        ("MONITOR_SESSION_IDLE_TTL", 3600.0),
+    ):
+        app.config.setdefault(name, os.environ.get(name, default))
+    monitor_blueprint = create_monitor_blueprint(
+        monitor_service,
+        socketio,
+        coalesce_window=float(app.config["MONITOR_COALESCE_WINDOW_MS"]) / 1000,
+        coalesce_max_batch=int(app.config["MONITOR_COALESCE_MAX_BATCH"]),
+        max_sessions=int(app.config["MONITOR_MAX_SESSIONS"]),
+        session_idle_ttl=float(app.config["MONITOR_SESSION_IDLE_TTL"]),
+    )
     app.register_blueprint(monitor_blueprint)
 
-    # Initialize SocketIO event handlers
-    init_socketio_events()
+    # Initialize SocketIO event handlers (periodic snapshot resync for dashboards)
+    app.config.setdefault(
+        "MONITOR_RESYNC_INTERVAL", os.environ.get("MONITOR_RESYNC_INTERVAL", 30.0)
+    )
+    init_socketio_events(resync_interval=float(app.config["MONITOR_RESYNC_INTERVAL"]))
+
+    # Jira webhooks push issue changes (only enabled with a shared secret)
+    app.config.setdefault("JIRA_WEBHOOK_SECRET", os.environ.get("JIRA_WEBHOOK_SECRET"))
+    app.config.setdefault("JIRA_WEBHOOK_RECORD", os.environ.get("JIRA_WEBHOOK_RECORD"))
+    app.config.setdefault("JIRA_CACHE_PATH", os.environ.get("JIRA_CACHE_PATH"))
+    if app.config["JIRA_WEBHOOK_SECRET"]:
+        jira_client = None
+        if not app.config["JIRA_CACHE_PATH"]:
+            # A memory cache would only be seen by this process, not the
+            # agent loop, so pushed issues are not cached at all
+            app.logger.warning(
+                "JIRA_CACHE_PATH is not set: Jira webhooks only update the "
+                "monitor and do not refresh the agent loop's Jira cache"
+            )
+        else:
+            try:
+                jira_client = get_jira_client(app.config["JIRA_CACHE_PATH"])
+            except ValueError:
+                # No Jira credentials: still forward transitions to the monitor
+                pass
+        webhook_processor = JiraWebhookProcessor(
+            client=jira_client,
+            notify=lambda state, message: publish_node_update("jira", state, message),
+        )
+        webhook_processor.start()
+        app.extensions["jira_webhook"] = webhook_processor
+        app.register_blueprint(
+            create_jira_webhook_blueprint(
+                webhook_processor,
+                app.config["JIRA_WEBHOOK_SECRET"],
+                record_path=app.config["JIRA_WEBHOOK_RECORD"],
+            )
+        )
 
     # Register News Flash blueprint at root with DI
     subscriber_repository = SubscriberRepository()
@@ -0,0 +1,62 @@
+"""
+Gunicorn configuration for the production container.
+
+The worker class follows SOCKETIO_ASYNC_MODE, so long-lived Socket.IO and
+WebSocket connections are served by a matching server:
+
+- threading (default): gthread workers, WebSockets through simple-websocket,
+  one thread per open connection (GUNICORN_THREADS)
+- gevent: gevent workers, one greenlet per connection (pip install gevent)
+- eventlet: eventlet workers, one green thread per connection
+  (pip install eventlet)
+
+The same variable selects Flask-SocketIO's async_mode in app.py, so the
+server and the application always agree.
+
+Socket.IO long-polling needs sticky sessions, so one worker is the default.
+Run more workers (GUNICORN_WORKERS) only with websocket-only clients or a
+sticky load balancer, and with SOCKETIO_MESSAGE_QUEUE and MONITOR_STATE_DB
+set so every worker sees and broadcasts every update. Without a message
+queue each worker would only broadcast its own updates, so GUNICORN_WORKERS
+is then capped at one and a warning is logged.
+"""
+
+import os
+
+WORKER_CLASSES = {
+    "threading": "gthread",
+    "gevent": "gevent",
+    "eventlet": "eventlet",
+}
+
+async_mode = os.environ.setdefault("SOCKETIO_ASYNC_MODE", "threading")
+if async_mode not in WORKER_CLASSES:
+    raise ValueError(
+        f"SOCKETIO_ASYNC_MODE must be one of {sorted(WORKER_CLASSES)}, "
+        f"got {async_mode!r}"
+    )
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+requested_workers = workers
+if workers > 1 and not os.environ.get("SOCKETIO_MESSAGE_QUEUE"):
+    workers = 1
+worker_class = WORKER_CLASSES[async_mode]
+# gthread: threads per worker; each open WebSocket holds one, so this must
+# exceed the number of dashboards or HTTP requests starve
+threads = int(os.environ.get("GUNICORN_THREADS", "1000"))
+# gevent/eventlet: concurrent connections per worker
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", "10000"))
+timeout = 120
+accesslog = "-"
+
+
+def when_ready(server):
+    """Log why GUNICORN_WORKERS was not honoured."""
+    if requested_workers != workers:
+        server.log.warning(
+            "GUNICORN_WORKERS=%d ignored: running 1 worker because "
+            "SOCKETIO_MESSAGE_QUEUE is not set, so other workers' monitor "
+            "updates would not reach this worker's WebSocket clients",
+            requested_workers,
+        )
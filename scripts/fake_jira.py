@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Jira Cloud REST API.
+
+FakeJiraServer serves the endpoints JiraClient uses from in-memory state,
+so the client (and scripts built on it) can be exercised and benchmarked
+without a Jira site:
+
+- GET  /rest/api/3/myself, /rest/api/3/project
+- GET  /rest/api/3/issue/{key} (ETag, ``fields`` and ``expand=transitions``)
+- POST /rest/api/3/issue, /rest/api/3/issue/bulk
+- POST /rest/api/3/search (a small JQL subset, see FakeJira.search)
+- POST /rest/api/3/issue/{key}/comment
+- GET/POST /rest/api/3/issue/{key}/transitions
+
+FaultProfile adds latency and injects 503s and 429s (with Retry-After).
+
+Run standalone::
+
+    python scripts/fake_jira.py --port 8089 --latency 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import shlex
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.sejfa.integrations.jira_client import JiraConfig  # noqa: E402
+
+API = "/rest/api/3"
+
+# Status -> transitions out of it; each transition is named after its target
+DEFAULT_WORKFLOW: dict[str, list[str]] = {
+    "To Do": ["In Progress"],
+    "In Progress": ["In Review", "To Do"],
+    "In Review": ["Done", "In Progress"],
+    "Done": ["To Do"],
+}
+
+# Status -> status category; JQL statusCategory matches the name or the key
+DEFAULT_CATEGORIES: dict[str, str] = {
+    "To Do": "To Do",
+    "In Progress": "In Progress",
+    "In Review": "In Progress",
+    "Done": "Done",
+}
+CATEGORY_KEYS = {"To Do": "new", "In Progress": "indeterminate", "Done": "done"}
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failures injected into every request.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Up to this many extra seconds, uniformly random
+        error_rate: Fraction of requests answered 503
+        throttle_rate: Fraction of requests answered 429
+        retry_after: Retry-After seconds sent with 429s
+        seed: Seed for the fault dice (default: unseeded)
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    seed: int | None = None
+
+
+class FakeJira:
+    """In-memory Jira state: projects, issues, comments and a workflow."""
+
+    def __init__(
+        self,
+        projects: tuple[str, ...] = ("GE",),
+        workflow: dict[str, list[str]] | None = None,
+        categories: dict[str, str] | None = None,
+    ):
+        """Initialize empty projects.
+
+        Args:
+            projects: Project keys that accept new issues
+            workflow: Status -> reachable statuses (default: DEFAULT_WORKFLOW)
+            categories: Status -> "To Do", "In Progress" or "Done"; statuses
+                not listed are "In Progress" (default: DEFAULT_CATEGORIES)
+        """
+        self.projects = list(projects)
+        self.workflow = workflow or DEFAULT_WORKFLOW
+        self.statuses = list(self.workflow)
+        self.categories = categories or DEFAULT_CATEGORIES
+        self._lock = threading.RLock()
+        self._issues: dict[str, dict[str, Any]] = {}
+        self._versions: dict[str, int] = {}
+        self._next_id = dict.fromkeys(projects, 1)
+        self.comments: dict[str, list[dict[str, Any]]] = {}
+
+    def _transition_id(self, status: str) -> str:
+        return str((self.statuses.index(status) + 1) * 10 + 1)
+
+    def _status(self, name: str) -> dict[str, Any]:
+        """Status field of an issue in status name."""
+        category = self.categories.get(name, "In Progress")
+        return {
+            "name": name,
+            "statusCategory": {"key": CATEGORY_KEYS[category], "name": category},
+        }
+
+    def create(self, fields: dict[str, Any]) -> tuple[dict[str, Any] | None, dict]:
+        """Create an issue from create-issue fields.
+
+        Returns:
+            (created reference, field errors); the reference is None on errors
+        """
+        project = (fields.get("project") or {}).get("key")
+        errors: dict[str, str] = {}
+        if project not in self.projects:
+            errors["project"] = "valid project is required"
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        if not (fields.get("issuetype") or {}).get("name"):
+            errors["issuetype"] = "valid issue type is required"
+        parent = (fields.get("parent") or {}).get("key")
+        with self._lock:
+            # Check the parent in the same critical section as the insert
+            if parent and parent not in self._issues:
+                errors["parent"] = f"Issue '{parent}' does not exist"
+            if errors:
+                return None, errors
+
+            number = self._next_id[project]
+            self._next_id[project] += 1
+            key = f"{project}-{number}"
+            stored = {
+                "summary": fields["summary"],
+                "description": fields.get("description"),
+                "issuetype": {"name": fields["issuetype"]["name"]},
+                "status": self._status(self.statuses[0]),
+                "project": {"key": project},
+                "labels": list(fields.get("labels") or []),
+                "priority": {"name": "Medium"},
+                "assignee": None,
+                "reporter": {"displayName": "Fake Jira"},
+            }
+            if parent:
+                stored["parent"] = {"key": parent}
+            self._issues[key] = stored
+            self._versions[key] = 1
+            self.comments[key] = []
+            if parent:
+                self._versions[parent] += 1
+            issue_id = str(10000 + len(self._issues))
+        return {"id": issue_id, "key": key, "self": f"{API}/issue/{issue_id}"}, {}
+
+    def issue(
+        self, key: str, fields: list[str] | None = None, expand: bool = False
+    ) -> dict[str, Any] | None:
+        """Issue JSON as Jira returns it, or None if it does not exist."""
+        with self._lock:
+            stored = self._issues.get(key)
+            if stored is None:
+                return None
+            selected = {
+                name: value
+                for name, value in stored.items()
+                if fields is None or name in fields
+            }
+            data: dict[str, Any] = {
+                "key": key,
+                "fields": json.loads(json.dumps(selected)),
+            }
+            if expand:
+                data["transitions"] = self.transitions(key)
+            return data
+
+    def etag(self, key: str) -> str:
+        """ETag of the current version of an issue."""
+        with self._lock:
+            version = self._versions.get(key, 0)
+        return '"' + hashlib.sha1(f"{key}:{version}".encode()).hexdigest()[:16] + '"'
+
+    def transitions(self, key: str) -> list[dict[str, Any]]:
+        """Transitions available from the issue's current status."""
+        with self._lock:
+            status = self._issues[key]["status"]["name"]
+        return [
+            {
+                "id": self._transition_id(target),
+                "name": target,
+                "to": {"name": target},
+            }
+            for target in self.workflow.get(status, [])
+        ]
+
+    def transition(self, key: str, transition_id: str) -> bool:
+        """Move an issue along a transition valid from its current status."""
+        with self._lock:
+            for transition in self.transitions(key):
+                if transition["id"] == transition_id:
+                    self._issues[key]["status"] = self._status(transition["name"])
+                    self._versions[key] += 1
+                    return True
+        return False
+
+    def add_comment(self, key: str, body: Any) -> dict[str, Any]:
+        """Append a comment and return it."""
+        with self._lock:
+            comment = {"id": str(len(self.comments[key]) + 1), "body": body}
+            self.comments[key].append(comment)
+            self._versions[key] += 1
+            return comment
+
+    def exists(self, key: str) -> bool:
+        """Whether an issue exists."""
+        with self._lock:
+            return key in self._issues
+
+    def search(self, jql: str) -> list[str]:
+        """Keys of the issues matching a JQL query, in creation order.
+
+        Supports clauses joined by AND of the form ``field = value``,
+        ``field != value`` and ``field in (v1, v2)`` on project, key,
+        status, statusCategory, issuetype (or type) and labels, plus a
+        trailing ORDER BY (ignored).
+
+        Raises:
+            ValueError: On JQL outside that subset
+        """
+        query = re.split(r"\s+order\s+by\s+", jql.strip(), flags=re.IGNORECASE)[0]
+        clauses = [c for c in re.split(r"\s+and\s+", query, flags=re.IGNORECASE) if c]
+        parsed = [_parse_clause(clause) for clause in clauses]
+        with self._lock:
+            return [
+                key
+                for key, fields in self._issues.items()
+                if all(_matches(key, fields, *clause) for clause in parsed)
+            ]
+
+
+_JQL_FIELDS = ("project", "key", "status", "statuscategory", "issuetype", "labels")
+
+_CLAUSE = re.compile(
+    r"^\s*(?P<field>\w+)\s*(?P<op>!=|=|\bin\b)\s*(?P<value>.+?)\s*$", re.IGNORECASE
+)
+
+
+def _parse_clause(clause: str) -> tuple[str, str, set[str]]:
+    """Parse one JQL clause into (field, operator, values)."""
+    match = _CLAUSE.match(clause)
+    if match is None:
+        raise ValueError(f"Unsupported JQL clause: {clause!r}")
+    field = match["field"].lower()
+    if field == "type":
+        field = "issuetype"
+    if field not in _JQL_FIELDS:
+        raise ValueError(f"Unsupported JQL field: {match['field']!r}")
+    op = match["op"].lower()
+    value = match["value"]
+    if op == "in":
+        if not (value.startswith("(") and value.endswith(")")):
+            raise ValueError(f"Expected a list after IN: {clause!r}")
+        lexer = shlex.shlex(value[1:-1], posix=True)
+        lexer.whitespace += ","
+        lexer.whitespace_split = True
+        values = set(lexer)
+    else:
+        values = {shlex.split(value)[0] if value[0] in "\"'" else value}
+    return field, op, {v.lower() for v in values}
+
+
+def _matches(key: str, fields: dict[str, Any], field: str, op: str, values) -> bool:
+    """Whether an issue satisfies one parsed clause."""
+    if field == "key":
+        actual = {key.lower()}
+    elif field == "labels":
+        actual = {label.lower() for label in fields.get("labels", [])}
+    elif field == "statuscategory":
+        category = fields["status"]["statusCategory"]
+        actual = {category["name"].lower(), category["key"]}
+    else:
+        actual = {str(fields[field]["name" if field != "project" else "key"]).lower()}
+    hit = bool(actual & values)
+    return not hit if op == "!=" else hit
+
+
+class _FakeJiraHandler(BaseHTTPRequestHandler):
+    """Routes REST calls to the server's FakeJira."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_FakeJiraHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(
+        self,
+        status: int,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str) -> None:
+        self._reply(status, {"errorMessages": [message], "errors": {}})
+
+    def _json_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def _handle(self, method: str) -> None:
+        server = self.server
+        parts = urlsplit(self.path)
+        route = _route_name(method, parts.path)
+        server.count(route)
+
+        # Read the body even when failing, or keep-alive would break
+        try:
+            data = self._json_body() if method == "POST" else {}
+        except ValueError:
+            self._error(400, "Invalid JSON body")
+            return
+
+        server.delay()
+        fault = server.roll_fault()
+        if fault == 429:
+            self._reply(
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                {"Retry-After": str(server.faults.retry_after)},
+            )
+            return
+        if fault == 503:
+            self._error(503, "Service unavailable")
+            return
+
+        if not self.headers.get("Authorization", "").startswith("Basic "):
+            self._error(401, "Authentication required")
+            return
+
+        handler = getattr(self, f"_{route}", None)
+        if handler is None:
+            self._error(404, f"No fake for {method} {parts.path}")
+            return
+        handler(parts.path, parse_qs(parts.query), data)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._handle("POST")
+
+    # Routes -------------------------------------------------------------
+
+    def _myself(self, path: str, query: dict, data: Any) -> None:
+        self._reply(
+            200,
+            {
+                "accountId": "fake-account",
+                "emailAddress": "fake@example.com",
+                "displayName": "Fake Jira",
+            },
+        )
+
+    def _projects(self, path: str, query: dict, data: Any) -> None:
+        jira = self.server.jira
+        self._reply(200, [{"key": key, "name": key} for key in jira.projects])
+
+    def _get_issue(self, path: str, query: dict, data: Any) -> None:
+        jira = self.server.jira
+        key = path.rsplit("/", 1)[1]
+        fields = query.get("fields", [None])[0]
+        expand = "transitions" in query.get("expand", [""])[0].split(",")
+        issue = jira.issue(key, fields.split(",") if fields else None, expand)
+        if issue is None:
+            self._error(404, "Issue does not exist or you do not have permission")
+            return
+        etag = jira.etag(key)
+        if self.headers.get("If-None-Match") == etag:
+            self._reply(304, None, {"ETag": etag})
+            return
+        self._reply(200, issue, {"ETag": etag})
+
+    def _create_issue(self, path: str, query: dict, data: Any) -> None:
+        created, errors = self.server.jira.create(data.get("fields") or {})
+        if errors:
+            self._reply(400, {"errorMessages": [], "errors": errors})
+            return
+        self._reply(201, created)
+
+    def _bulk_create(self, path: str, query: dict, data: Any) -> None:
+        issues: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for index, update in enumerate(data.get("issueUpdates") or []):
+            created, field_errors = self.server.jira.create(update.get("fields") or {})
+            if created is None:
+                errors.append(
+                    {
+                        "status": 400,
+                        "failedElementNumber": index,
+                        "elementErrors": {"errorMessages": [], "errors": field_errors},
+                    }
+                )
+            else:
+                issues.append(created)
+        status = 400 if errors and not issues else 201
+        self._reply(status, {"issues": issues, "errors": errors})
+
+    def _search(self, path: str, query: dict, data: Any) -> None:
+        jira = self.server.jira
+        try:
+            keys = jira.search(data.get("jql", ""))
+        except ValueError as e:
+            self._error(400, str(e))
+            return
+        start = int(data.get("startAt", 0))
+        size = min(int(data.get("maxResults", 50)), 100)
+        fields = data.get("fields")
+        page = [jira.issue(key, fields) for key in keys[start : start + size]]
+        self._reply(
+            200,
+            {
+                "startAt": start,
+                "maxResults": size,
+                "total": len(keys),
+                "issues": [issue for issue in page if issue is not None],
+            },
+        )
+
+    def _issue_key(self, path: str) -> str | None:
+        key = path.split("/")[5]
+        if not self.server.jira.exists(key):
+            self._error(404, "Issue does not exist or you do not have permission")
+            return None
+        return key
+
+    def _comment(self, path: str, query: dict, data: Any) -> None:
+        key = self._issue_key(path)
+        if key is None:
+            return
+        if not data.get("body"):
+            self._reply(400, {"errorMessages": [], "errors": {"comment": "required"}})
+            return
+        self._reply(201, self.server.jira.add_comment(key, data["body"]))
+
+    def _get_transitions(self, path: str, query: dict, data: Any) -> None:
+        key = self._issue_key(path)
+        if key is None:
+            return
+        self._reply(200, {"transitions": self.server.jira.transitions(key)})
+
+    def _transition(self, path: str, query: dict, data: Any) -> None:
+        key = self._issue_key(path)
+        if key is None:
+            return
+        transition_id = (data.get("transition") or {}).get("id", "")
+        if not self.server.jira.transition(key, transition_id):
+            self._error(400, f"Transition id '{transition_id}' is not valid")
+            return
+        self._reply(204)
+
+
+_ROUTES = [
+    ("GET", re.compile(rf"^{API}/myself$"), "myself"),
+    ("GET", re.compile(rf"^{API}/project$"), "projects"),
+    ("POST", re.compile(rf"^{API}/search$"), "search"),
+    ("POST", re.compile(rf"^{API}/issue$"), "create_issue"),
+    ("POST", re.compile(rf"^{API}/issue/bulk$"), "bulk_create"),
+    ("GET", re.compile(rf"^{API}/issue/[^/]+$"), "get_issue"),
+    ("POST", re.compile(rf"^{API}/issue/[^/]+/comment$"), "comment"),
+    ("GET", re.compile(rf"^{API}/issue/[^/]+/transitions$"), "get_transitions"),
+    ("POST", re.compile(rf"^{API}/issue/[^/]+/transitions$"), "transition"),
+]
+
+
+def _route_name(method: str, path: str) -> str:
+    for route_method, pattern, name in _ROUTES:
+        if route_method == method and pattern.match(path):
+            return name
+    return "unknown"
+
+
+class _FakeJiraHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, jira: FakeJira, faults: FaultProfile):
+        super().__init__(address, _FakeJiraHandler)
+        self.jira = jira
+        self.faults = faults
+        self._random = random.Random(faults.seed)
+        self._lock = threading.Lock()
+        self.requests: dict[str, int] = {}
+        self.injected = {"throttled": 0, "errors": 0}
+
+    def count(self, route: str) -> None:
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def delay(self) -> None:
+        faults = self.faults
+        if faults.latency or faults.jitter:
+            with self._lock:
+                extra = self._random.uniform(0, faults.jitter)
+            time.sleep(faults.latency + extra)
+
+    def roll_fault(self) -> int | None:
+        """Decide whether this request gets an injected 429 or 503."""
+        faults = self.faults
+        with self._lock:
+            roll = self._random.random()
+            if roll < faults.throttle_rate:
+                self.injected["throttled"] += 1
+                return 429
+            if roll < faults.throttle_rate + faults.error_rate:
+                self.injected["errors"] += 1
+                return 503
+        return None
+
+
+class FakeJiraServer:
+    """A FakeJira served over HTTP/1.1 keep-alive from a background thread.
+
+    Usage::
+
+        with FakeJiraServer(faults=FaultProfile(latency=0.02)) as fake:
+            client = JiraClient(fake.config())
+    """
+
+    def __init__(
+        self,
+        jira: FakeJira | None = None,
+        faults: FaultProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Bind the server (port 0 picks a free port).
+
+        Args:
+            jira: State to serve (default: an empty FakeJira())
+            faults: Injected latency and failures (default: none)
+            host: Interface to listen on
+            port: Port to listen on
+        """
+        self.jira = jira or FakeJira()
+        self._server = _FakeJiraHTTPServer(
+            (host, port), self.jira, faults or FaultProfile()
+        )
+        self._thread: threading.Thread | None = None
+
+    @property
+    def faults(self) -> FaultProfile:
+        """Injected latency and failures; may be changed while running."""
+        return self._server.faults
+
+    @faults.setter
+    def faults(self, faults: FaultProfile) -> None:
+        self._server.faults = faults
+
+    @property
+    def url(self) -> str:
+        """Base URL, e.g. http://127.0.0.1:54321."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config(self) -> JiraConfig:
+        """JiraConfig pointing at this server (any credentials are accepted)."""
+        return JiraConfig(url=self.url, email="fake@example.com", api_token="fake")
+
+    def start(self) -> "FakeJiraServer":
+        """Serve requests from a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def __enter__(self) -> "FakeJiraServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Requests per route and injected faults."""
+        with self._server._lock:
+            return {
+                "requests": dict(self._server.requests),
+                **self._server.injected,
+            }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed-issues", type=int, default=0, help="Issues in GE")
+    args = parser.parse_args()
+
+    jira = FakeJira()
+    for i in range(args.seed_issues):
+        jira.create(
+            {
+                "project": {"key": "GE"},
+                "summary": f"Seed issue {i}",
+                "issuetype": {"name": "Task"},
+            }
+        )
+    faults = FaultProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+    )
+    server = FakeJiraServer(jira, faults, host=args.host, port=args.port)
+    print(f"Fake Jira listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
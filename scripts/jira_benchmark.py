@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Benchmark JiraClient and jules_to_jira.py against a local fake Jira.
+
+Starts a FakeJiraServer (scripts/fake_jira.py) with the
+given latency and fault rates, runs each scenario with --threads workers
+sharing one client, and prints calls per second and latency percentiles.
+Latencies include client-side retries, so injected 429s and 503s show up
+in the tail.
+
+Scenarios:
+    myself, get_issue, get_issue_cached, search, comment, transition,
+    create, jules_to_jira (one CI run: parse a review, bulk-create tasks,
+    comment LOW findings; a fresh client per run)
+
+Usage:
+    python scripts/jira_benchmark.py --latency 0.02 --threads 8
+    python scripts/jira_benchmark.py --throttle-rate 0.05 --scenarios get_issue
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.fake_jira import FakeJira, FakeJiraServer, FaultProfile  # noqa: E402
+from scripts.jules_to_jira import (  # noqa: E402
+    add_low_findings_as_comment,
+    create_tasks,
+    parse_findings,
+)
+from src.sejfa.integrations.jira_client import JiraAPIError, JiraClient  # noqa: E402
+from src.sejfa.integrations.response_cache import ResponseCache  # noqa: E402
+
+SCENARIOS = (
+    "myself",
+    "get_issue",
+    "get_issue_cached",
+    "search",
+    "comment",
+    "transition",
+    "create",
+    "jules_to_jira",
+)
+
+HOT_ISSUES = 10
+
+REVIEW_BODY = (
+    "## Jules Review\n\n"
+    "[HIGH] src/app.py:42 — SQL query built from user input\n"
+    "[MEDIUM] src/auth.py:10 — Token compared with ==\n"
+    "[CRITICAL] src/db.py:7 — Hardcoded credentials\n"
+    "[LOW] README.md:1 — Typo in heading\n"
+)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def seed(jira: FakeJira, issues: int) -> list[str]:
+    """Create issues to read, search and transition."""
+    keys = []
+    for i in range(issues):
+        created, _ = jira.create(
+            {
+                "project": {"key": "GE"},
+                "summary": f"Benchmark issue {i}",
+                "description": "x" * 2000,
+                "issuetype": {"name": "Task"},
+                "labels": ["benchmark"],
+            }
+        )
+        keys.append(created["key"])
+    return keys
+
+
+def make_call(
+    name: str, fake: FakeJiraServer, client: JiraClient, keys: list[str]
+) -> Callable[[int], object]:
+    """Return a function performing call number i of a scenario."""
+    if name == "myself":
+        return lambda i: client.test_connection()
+    if name in ("get_issue", "get_issue_cached"):
+        # The agent loop rereads a handful of tickets
+        return lambda i: client.get_issue(keys[i % HOT_ISSUES])
+    if name == "search":
+        return lambda i: client.search_issues(
+            "project = GE AND labels = benchmark",
+            max_results=50,
+            fields=["summary", "status"],
+        )
+    if name == "comment":
+        return lambda i: client.add_comment(keys[i % len(keys)], f"Comment {i}")
+    if name == "transition":
+        # Laps over the issues alternate To Do -> In Progress -> To Do
+        return lambda i: client.transition_issue(
+            keys[i % len(keys)], ("In Progress", "To Do")[i // len(keys) % 2]
+        )
+    if name == "create":
+        return lambda i: client.create_issue("GE", f"Created {i}", issue_type="Task")
+    if name == "jules_to_jira":
+
+        def run(i: int) -> None:
+            with JiraClient(fake.config(), retry_policy=client.retry_policy) as jira:
+                findings = parse_findings(REVIEW_BODY)
+                create_tasks(jira, keys[i % len(keys)], findings, str(i))
+                add_low_findings_as_comment(jira, keys[i % len(keys)], findings)
+
+        return run
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+def run_scenario(
+    name: str, fake: FakeJiraServer, calls: int, threads: int, keys: list[str]
+) -> dict:
+    """Run one scenario and collect per-call latencies."""
+    cache = ResponseCache(ttl=30) if name == "get_issue_cached" else None
+    client = JiraClient(fake.config(), cache=cache)
+    call = make_call(name, fake, client, keys)
+    latencies: list[float] = []
+    errors = 0
+
+    def timed(i: int) -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            call(i)
+        except JiraAPIError:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+
+    # jules_to_jira logs GitHub annotations to stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(timed, range(calls)))
+        elapsed = time.perf_counter() - started
+    client.close()
+
+    stats = client.stats()
+    return {
+        "calls": calls,
+        "errors": errors,
+        "retries": stats["retries"],
+        "calls_per_s": calls / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def print_report(results: dict[str, dict]) -> None:
+    """Print one result row per scenario."""
+    header = (
+        f"{'scenario':<18}{'calls':>7}{'errors':>8}{'retries':>9}{'calls/s':>10}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(
+            f"{name:<18}{r['calls']:>7}{r['errors']:>8}{r['retries']:>9}"
+            f"{r['calls_per_s']:>10.1f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+            f"{r['p99_ms']:>9.1f}{r['max_ms']:>9.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help="Comma-separated scenarios to run",
+    )
+    parser.add_argument("--calls", type=int, default=200, help="Calls per scenario")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--issues", type=int, default=200, help="Issues to seed")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--retry-after", type=int, default=0, help="Retry-After seconds on 429"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Fault dice seed")
+    args = parser.parse_args()
+
+    faults = FaultProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    jira = FakeJira()
+    keys = seed(jira, args.issues)
+
+    results: dict[str, dict] = {}
+    with FakeJiraServer(jira, faults) as fake:
+        for name in args.scenarios.split(","):
+            results[name] = run_scenario(name, fake, args.calls, args.threads, keys)
+        injected = fake.stats()
+    print_report(results)
+    print(
+        f"\nInjected: {injected['throttled']} x 429, {injected['errors']} x 503 "
+        f"over {sum(injected['requests'].values())} requests"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Replay recorded Jira webhook payloads against the app.
+
+Reads payloads recorded with JIRA_WEBHOOK_RECORD (JSONL, one payload per
+line), a JSON array of payloads or a single payload, signs each one with
+the shared secret and POSTs it to the webhook endpoint, in file order.
+
+Usage:
+    python scripts/jira_webhook_replay.py instance/jira_webhooks.jsonl
+    python scripts/jira_webhook_replay.py payload.json \\
+        --url https://example.com/api/jira/webhook --delay 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.sejfa.integrations.jira_webhook import (  # noqa: E402
+    SIGNATURE_HEADER,
+    WEBHOOK_PATH,
+    sign,
+)
+
+DEFAULT_URL = "http://localhost:5000" + WEBHOOK_PATH
+
+
+def load_payloads(path: str) -> list[dict]:
+    """Load payloads from a JSONL file, a JSON array or a single JSON object."""
+    text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return data if isinstance(data, list) else [data]
+
+
+def build_request(payload: dict, url: str, secret: str) -> urllib.request.Request:
+    """Build a signed webhook POST for a payload."""
+    body = json.dumps(payload).encode()
+    return urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            SIGNATURE_HEADER: sign(secret, body),
+        },
+    )
+
+
+def replay(
+    payloads: list[dict], url: str, secret: str, delay: float = 0.0
+) -> dict[int, int]:
+    """
+    Send payloads one by one.
+
+    Args:
+        payloads: Webhook payloads in send order
+        url: Webhook endpoint
+        secret: Shared webhook secret
+        delay: Seconds to wait between payloads
+
+    Returns:
+        Number of responses per status code
+    """
+    statuses: dict[int, int] = {}
+    for i, payload in enumerate(payloads):
+        if i and delay:
+            time.sleep(delay)
+        try:
+            with urllib.request.urlopen(build_request(payload, url, secret)) as resp:
+                status = resp.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        statuses[status] = statuses.get(status, 0) + 1
+    return statuses
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="JSONL, JSON array or single JSON payload")
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument(
+        "--secret",
+        default=os.environ.get("JIRA_WEBHOOK_SECRET"),
+        help="Shared secret (default: $JIRA_WEBHOOK_SECRET)",
+    )
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds")
+    args = parser.parse_args()
+
+    if not args.secret:
+        parser.error("--secret or JIRA_WEBHOOK_SECRET is required")
+
+    payloads = load_payloads(args.path)
+    statuses = replay(payloads, args.url, args.secret, args.delay)
+    print(f"Sent {len(payloads)} payloads: {statuses}")
+    return 0 if set(statuses) <= {200, 202} else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,6 +21,7 @@ Environment variables:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
@@ -32,12 +33,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.sejfa.integrations.jira_client import (
+    CircuitOpenError,
     JiraAPIError,
     JiraClient,
     JiraConfig,
 )
 
 MAX_TASKS = 3
+TASK_LABELS = ["jules-review", "automated"]
+# Label carrying a finding's fingerprint, e.g. jules-fp-3f2a9c0d1e4b5a67
+FINGERPRINT_LABEL_PREFIX = "jules-fp-"
+# Line/column suffixes dropped from locations (a.py:12, a.py:12:5, a.py#L12-L20)
+_LINE_SUFFIX = re.compile(r"(?::\d+(?:[-:]\d+)*|#L\d+(?:-L?\d+)?)$")
 # Patterns tried in order — first match wins per line
 SEVERITY_PATTERNS: list[re.Pattern[str]] = [
     # Original: [SEVERITY] file:line — description
@@ -84,6 +91,26 @@ SEVERITY_PATTERNS: list[re.Pattern[str]] = [
 ]
 TICKET_KEY_PATTERN = re.compile(r"([A-Z]+-\d+)")
 
+
+def _normalize_location(location: str) -> str:
+    """Normalize a finding location for fingerprinting.
+
+    Line numbers are dropped because they shift whenever code above the
+    finding changes between review runs.
+    """
+    location = location.strip().strip("`'\"()[],;").replace("\\", "/")
+    location = _LINE_SUFFIX.sub("", location).lower()
+    while location.startswith("./"):
+        location = location[2:]
+    return location
+
+
+def _normalize_description(description: str) -> str:
+    """Normalize a finding description for fingerprinting."""
+    text = re.sub(r"[`*_]", "", description).lower()
+    return " ".join(text.split()).rstrip(" .;:")
+
+
 # Indicators that review_body is an error/timeout, not actual findings
 _ERROR_INDICATORS = (
     "\u23f1\ufe0f",  # ⏱️ timer emoji (timeout)
@@ -106,6 +133,28 @@ class Finding:
     location: str
     description: str
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable ID of the finding across review runs.
+
+        Derived from severity, normalized location and normalized
+        description, so reruns that only reword whitespace or markdown or
+        move the code to other lines give the same fingerprint.
+        """
+        key = "|".join(
+            (
+                self.severity.upper(),
+                _normalize_location(self.location),
+                _normalize_description(self.description),
+            )
+        )
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    @property
+    def label(self) -> str:
+        """Jira label storing the fingerprint on the finding's task."""
+        return FINGERPRINT_LABEL_PREFIX + self.fingerprint
+
     @property
     def summary(self) -> str:
         """Generate Jira-friendly summary (max 255 chars)."""
@@ -119,6 +168,7 @@ class Finding:
             f"Description: {self.description}",
             "",
             "Source: Automated Jules code review",
+            f"Fingerprint: {self.fingerprint}",
         ]
         if origin_key or pr_number:
             lines.append("")
@@ -309,6 +359,45 @@ def extract_project_key(parent_key: str) -> str:
     return parent_key.split("-")[0]
 
 
+def find_existing_fingerprints(
+    client: JiraClient, project_key: str, findings: list[Finding]
+) -> set[str]:
+    """Look up which findings already have an open task.
+
+    All fingerprints are checked with a single JQL query on their labels,
+    instead of one query (or one duplicate task) per finding. Tasks in the
+    Done status category (Done, but also e.g. Closed or Won't Do) do not
+    count, so a finding that comes back gets a new task.
+
+    Args:
+        client: Jira client
+        project_key: Project the tasks are created in
+        findings: Findings to check
+
+    Returns:
+        Fingerprints that already have an open task
+
+    Raises:
+        JiraAPIError: If the search fails
+    """
+    labels = sorted({finding.label for finding in findings})
+    if not labels:
+        return set()
+    jql = (
+        f"project = {project_key} AND statusCategory != Done AND labels in ("
+        + ", ".join(f'"{label}"' for label in labels)
+        + ")"
+    )
+    existing: set[str] = set()
+    for issue in client.iter_issues(jql, fields=["labels"]):
+        existing.update(
+            label[len(FINGERPRINT_LABEL_PREFIX) :]
+            for label in issue.labels
+            if label.startswith(FINGERPRINT_LABEL_PREFIX)
+        )
+    return existing
+
+
 def create_tasks(
     client: JiraClient,
     origin_key: str,
@@ -320,6 +409,10 @@ def create_tasks(
     Standalone Tasks (not Sub-tasks) avoid the race condition where
     the parent ticket is already Done when Jules finishes its async
     review. The origin ticket is referenced in the description only.
+
+    Each task is labelled with its finding's fingerprint. Findings that
+    already have an open task (e.g. when the review workflow is rerun)
+    are skipped before the MAX_TASKS cap is applied.
     """
     project_key = extract_project_key(origin_key)
     actionable = ("HIGH", "CRITICAL", "MEDIUM")
@@ -329,28 +422,63 @@ def create_tasks(
         _log("No HIGH/CRITICAL/MEDIUM findings — skipping task creation")
         return []
 
-    to_create = high_findings[:MAX_TASKS]
-    if len(high_findings) > MAX_TASKS:
+    # The same finding may be reported on several lines of one review
+    unique: dict[str, Finding] = {}
+    for finding in high_findings:
+        unique.setdefault(finding.fingerprint, finding)
+
+    try:
+        existing = find_existing_fingerprints(
+            client, project_key, list(unique.values())
+        )
+    except CircuitOpenError as exc:
+        _log(f"Jira unavailable, skipping task creation: {exc}", "warning")
+        return []
+    except JiraAPIError as exc:
+        # Skipped findings come back with the next review; duplicates stay
+        _log(f"Duplicate check failed, skipping task creation: {exc}", "warning")
+        return []
+
+    new_findings = [f for fp, f in unique.items() if fp not in existing]
+    if existing:
+        _log(f"Skipping {len(unique) - len(new_findings)} findings with open tasks")
+    if not new_findings:
+        return []
+
+    to_create = new_findings[:MAX_TASKS]
+    if len(new_findings) > MAX_TASKS:
         _log(
-            f"Found {len(high_findings)} actionable findings, "
+            f"Found {len(new_findings)} new actionable findings, "
             f"capping at {MAX_TASKS} tasks"
         )
 
     created_keys: list[str] = []
 
-    for finding in to_create:
-        try:
-            issue = client.create_issue(
-                project_key=project_key,
-                summary=finding.summary,
-                description=finding.body(origin_key, pr_number),
-                issue_type="Task",
-                labels=["jules-review", "automated"],
-            )
+    # One bulk request instead of a create + fetch per finding
+    try:
+        result = client.create_issues_bulk(
+            [
+                {
+                    "project_key": project_key,
+                    "summary": finding.summary,
+                    "description": finding.body(origin_key, pr_number),
+                    "issue_type": "Task",
+                    "labels": [*TASK_LABELS, finding.label],
+                }
+                for finding in to_create
+            ]
+        )
+    except CircuitOpenError as exc:
+        _log(f"Jira unavailable, skipping task creation: {exc}", "warning")
+        return created_keys
+
+    for index, finding in enumerate(to_create):
+        issue = result.issues.get(index)
+        if issue is not None:
             created_keys.append(issue.key)
             _log(f"Created {issue.key}: {finding.summary[:80]}")
-        except JiraAPIError as exc:
-            _log(f"Failed to create task: {exc}", "warning")
+    for error in result.errors:
+        _log(f"Failed to create task: {error.message}", "warning")
 
     return created_keys
 
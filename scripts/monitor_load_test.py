@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Load-test Socket.IO broadcast latency of the monitor dashboard API.
+
+Opens many dashboard connections to the /monitor namespace, posts node
+updates at a fixed rate and measures how long each update takes to reach
+every connected dashboard (post time -> state_delta received).
+
+With --modes, a gunicorn server is started for each Socket.IO async mode
+(using gunicorn.conf.py) and the results are printed side by side;
+otherwise an already running server at --url is tested.
+
+Requires the asyncio Socket.IO client:
+    pip install "python-socketio[asyncio_client]"
+
+Usage:
+    python scripts/monitor_load_test.py --modes threading,gevent --clients 2000
+    python scripts/monitor_load_test.py --url http://localhost:5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import aiohttp
+import socketio
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NODES = ("jira", "claude", "github", "jules", "actions")
+MESSAGE_PREFIX = "loadtest"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_healthy(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become healthy")
+
+
+def start_server(mode: str, clients: int) -> tuple[subprocess.Popen, str]:
+    """Start gunicorn with gunicorn.conf.py in the given async mode."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "SOCKETIO_ASYNC_MODE": mode,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        # gthread holds one thread per WebSocket; leave room for the POSTs
+        "GUNICORN_THREADS": str(clients + 100),
+        # Measure fan-out, not the shared-state backend
+        "MONITOR_STATE_DB": "",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "app:app"],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_healthy(url)
+    except RuntimeError:
+        process.terminate()
+        raise
+    return process, url
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    """Stop a server started by start_server."""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_load(
+    url: str, clients: int, updates: int, rate: float, drain: float
+) -> dict:
+    """Connect dashboards, post updates and collect delivery latencies."""
+    latencies: list[float] = []
+
+    def on_delta(delta: dict) -> None:
+        received = time.time()
+        for event in delta.get("events", []):
+            parts = event.get("message", "").split()
+            if len(parts) == 3 and parts[0] == MESSAGE_PREFIX:
+                latencies.append(received - float(parts[2]))
+
+    connect_limit = asyncio.Semaphore(200)
+
+    async def connect() -> socketio.AsyncClient | None:
+        client = socketio.AsyncClient(reconnection=False)
+        client.on("state_delta", on_delta, namespace="/monitor")
+        async with connect_limit:
+            try:
+                await client.connect(
+                    url, namespaces=["/monitor"], transports=["websocket"]
+                )
+            except (socketio.exceptions.ConnectionError, OSError):
+                await client.disconnect()
+                return None
+        return client
+
+    started = time.monotonic()
+    connected = await asyncio.gather(*(connect() for _ in range(clients)))
+    dashboards = [c for c in connected if c is not None]
+    connect_seconds = time.monotonic() - started
+
+    async with aiohttp.ClientSession() as http:
+        for i in range(updates):
+            payload = {
+                "node": NODES[i % len(NODES)],
+                "state": "active",
+                "message": f"{MESSAGE_PREFIX} {i} {time.time():.6f}",
+            }
+            async with http.post(f"{url}/api/monitor/state", json=payload) as resp:
+                await resp.read()
+            await asyncio.sleep(1 / rate)
+
+    await asyncio.sleep(drain)
+    await asyncio.gather(*(c.disconnect() for c in dashboards))
+
+    expected = len(dashboards) * updates
+    return {
+        "connected": len(dashboards),
+        "connect_seconds": connect_seconds,
+        "delivered": len(latencies),
+        "expected": expected,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "p95_ms": _percentile(latencies, 0.95) * 1000 if latencies else None,
+        "p99_ms": _percentile(latencies, 0.99) * 1000 if latencies else None,
+        "max_ms": max(latencies) * 1000 if latencies else None,
+    }
+
+
+def _format(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_report(results: dict[str, dict]) -> None:
+    """Print one result row per mode."""
+    header = (
+        f"{'mode':<12}{'clients':>9}{'connect s':>11}{'delivered':>12}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for mode, r in results.items():
+        delivered = f"{r['delivered']}/{r['expected']}"
+        print(
+            f"{mode:<12}{r['connected']:>9}{r['connect_seconds']:>11.1f}"
+            f"{delivered:>12}{_format(r['p50_ms']):>9}{_format(r['p95_ms']):>9}"
+            f"{_format(r['p99_ms']):>9}{_format(r['max_ms']):>9}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Test a running server instead of --modes")
+    parser.add_argument(
+        "--modes",
+        default="threading",
+        help="Comma-separated async modes to start and test (threading,gevent,...)",
+    )
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=20.0, help="Updates per second")
+    parser.add_argument("--drain", type=float, default=3.0, help="Seconds to wait")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    if args.url:
+        results["external"] = asyncio.run(
+            run_load(args.url, args.clients, args.updates, args.rate, args.drain)
+        )
+    else:
+        for mode in args.modes.split(","):
+            process, url = start_server(mode, args.clients)
+            try:
+                results[mode] = asyncio.run(
+                    run_load(url, args.clients, args.updates, args.rate, args.drain)
+                )
+            finally:
+                stop_server(process)
+    print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,376 @@
+"""Asyncio Jira REST API client for fan-out workloads.
+
+AsyncJiraClient mirrors JiraClient method for method, but every call is a
+coroutine, so a batch of tickets can be read or updated concurrently::
+
+    async with AsyncJiraClient(config, max_concurrency=10) as jira:
+        issues = await jira.gather(jira.get_issue(key) for key in keys)
+
+All calls share one aiohttp connection pool, and a semaphore bounds the
+number of requests in flight so Jira is not flooded. Retries, the circuit
+breaker, the caches and error semantics (JiraAPIError) come from
+JiraClientBase, which the synchronous client shares; this module only sends
+requests and waits with asyncio.
+
+Requires the optional ``aiohttp`` package (``pip install .[async]``).
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from typing import Any, TypeVar
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from src.sejfa.integrations.http_pool import PooledResponse
+from src.sejfa.integrations.jira_client import (
+    BULK_CREATE_ENDPOINT,
+    BULK_CREATE_MAX,
+    ISSUE_ENDPOINT,
+    SEARCH_ENDPOINT,
+    SEARCH_MAX_PAGE_SIZE,
+    BulkCreateResult,
+    CircuitOpenError,
+    JiraAPIError,
+    JiraClientBase,
+    JiraConfig,
+    JiraIssue,
+    PreparedRequest,
+    SearchPages,
+    adf_document,
+    bulk_create_chunks,
+    bulk_create_payload,
+    issue_fields,
+    issue_transitions_query,
+)
+from src.sejfa.integrations.response_cache import ResponseCache
+from src.sejfa.integrations.retry import CircuitBreaker, RetryPolicy
+
+T = TypeVar("T")
+
+
+class AsyncJiraClient(JiraClientBase):
+    """Asyncio Jira REST API client with bounded concurrency."""
+
+    def __init__(
+        self,
+        config: JiraConfig | None = None,
+        max_concurrency: int = 10,
+        session: "aiohttp.ClientSession | None" = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        """Initialize client with config or load from environment.
+
+        Args:
+            config: Jira configuration (default: from environment)
+            max_concurrency: Most requests in flight at once
+            session: aiohttp session to share between clients (default: a
+                private session, created on first use and closed by close())
+            retry_policy: Retry policy (default: RetryPolicy())
+            breaker: Circuit breaker (default: a private CircuitBreaker())
+            cache: Response cache for get_issue and get_projects
+                (default: no caching)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncJiraClient requires aiohttp (pip install .[async])")
+        super().__init__(config, retry_policy, breaker, cache)
+        self.max_concurrency = max_concurrency
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the private aiohttp session (shared sessions are left open)."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def gather(
+        self, calls: Iterable[Awaitable[T]], return_exceptions: bool = True
+    ) -> list[T | BaseException]:
+        """Run client calls concurrently, bounded by max_concurrency.
+
+        Args:
+            calls: Coroutines from this client, e.g.
+                ``(jira.get_issue(key) for key in keys)``
+            return_exceptions: Return failures (usually JiraAPIError) in
+                place of results instead of raising the first one
+
+        Returns:
+            Results in the order of calls
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
+    ) -> Any:
+        """Make authenticated request to Jira API (see JiraClient._request).
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            JiraAPIError: On API errors once retries are exhausted
+        """
+        try:
+            response = await self._call(method, endpoint, data, idempotent)
+        finally:
+            self.forget_written(method, endpoint, data)
+        return self.parse_body(response)
+
+    async def _call(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> PooledResponse:
+        """Send a request with retries (see JiraClient._call)."""
+        request = self.prepare_request(
+            method, endpoint, data, idempotent, extra_headers
+        )
+        deadline = time.monotonic() + self.retry_policy.budget
+
+        attempt = 0
+        while True:
+            try:
+                return await self._send(request)
+            except JiraAPIError as e:
+                delay = self.retry_delay(e, attempt, request, deadline)
+                if delay is None:
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get_cached(self, endpoint: str) -> Any:
+        """GET an endpoint through the response cache (see JiraClient)."""
+        if self.cache is None:
+            return await self._request("GET", endpoint)
+
+        key = self.cache_key(endpoint)
+        entry, fresh = self.cache.lookup(key)
+        if not fresh:
+            response = await self._call(
+                "GET", endpoint, extra_headers=self.cache.validators(entry)
+            )
+            body = self.cache.update(
+                key, entry, response.status, response.headers, response.body.decode()
+            )
+        else:
+            body = entry.body
+        return json.loads(body) if body else {}
+
+    async def _send(self, request: PreparedRequest) -> PooledResponse:
+        """Send one attempt through the breaker and concurrency limit."""
+        self.admit()
+        try:
+            async with self._semaphore:
+                async with self._get_session().request(
+                    request.method,
+                    request.url,
+                    data=request.body,
+                    headers=request.headers,
+                ) as response:
+                    result = PooledResponse(
+                        status=response.status,
+                        reason=response.reason or "",
+                        headers=response.headers,
+                        body=await response.read(),
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            raise self.connection_error(e) from e
+        except BaseException:
+            # Cancelled or unexpected: no verdict on Jira's health
+            self.breaker.release()
+            raise
+        return self.check_response(result)
+
+    async def get_issue(self, issue_key: str) -> JiraIssue:
+        """Fetch a Jira issue by key (see JiraClient.get_issue)."""
+        data = await self._get_cached(ISSUE_ENDPOINT + issue_key)
+        return self.issue_from_response(data)
+
+    async def search_issues(
+        self,
+        jql: str,
+        max_results: int = 50,
+        fields: Iterable[str] | None = None,
+        keep_raw: bool = False,
+    ) -> list[JiraIssue]:
+        """Search for issues using JQL (see JiraClient.search_issues)."""
+        return [
+            issue
+            async for issue in self.iter_issues(
+                jql,
+                fields=fields,
+                page_size=max_results,
+                limit=max_results,
+                keep_raw=keep_raw,
+            )
+        ]
+
+    async def iter_issues(
+        self,
+        jql: str,
+        fields: Iterable[str] | None = None,
+        page_size: int = SEARCH_MAX_PAGE_SIZE,
+        limit: int | None = None,
+        prefetch: bool = False,
+        keep_raw: bool = False,
+    ) -> AsyncIterator[JiraIssue]:
+        """Iterate over all issues matching a JQL query, page by page.
+
+        See JiraClient.iter_issues; with prefetch the next page is
+        requested as a task while the caller processes the current one.
+        """
+        pages = SearchPages(jql, fields, page_size, limit)
+
+        async def fetch(start_at: int) -> dict[str, Any]:
+            return await self._request(
+                "POST", SEARCH_ENDPOINT, data=pages.payload(start_at), idempotent=True
+            )
+
+        pending: asyncio.Task | None = None
+        try:
+            page = await fetch(0)
+            while True:
+                issues, more = pages.advance(page)
+                if more and prefetch:
+                    pending = asyncio.ensure_future(fetch(pages.start_at))
+
+                for issue_data in issues:
+                    yield JiraIssue.from_api_response(issue_data, keep_raw)
+
+                if not more:
+                    return
+                if pending is not None:
+                    page, pending = await pending, None
+                else:
+                    page = await fetch(pages.start_at)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def add_comment(self, issue_key: str, body: str) -> dict[str, Any]:
+        """Add a comment to an issue (see JiraClient.add_comment)."""
+        return await self._request(
+            "POST",
+            f"/rest/api/3/issue/{issue_key}/comment",
+            data={"body": adf_document(body)},
+        )
+
+    async def transition_issue(self, issue_key: str, transition_name: str) -> bool:
+        """Transition an issue to a new status (see JiraClient.transition_issue)."""
+        endpoint = f"/rest/api/3/issue/{issue_key}/transitions"
+
+        cached = self.cached_transition(issue_key, transition_name)
+        if cached is not None:
+            transition_id, to_status = cached
+            try:
+                await self._request(
+                    "POST", endpoint, data={"transition": {"id": transition_id}}
+                )
+            except JiraAPIError as e:
+                if not self.cached_transition_rejected(issue_key, e):
+                    raise
+            else:
+                self.transition_done(issue_key, None, to_status)
+                return True
+
+        transitions_data = await self._request(
+            "GET", issue_transitions_query(issue_key)
+        )
+        transition_id, issue_type, to_status = self.transitions.select(
+            issue_key, transition_name, transitions_data
+        )
+        await self._request(
+            "POST", endpoint, data={"transition": {"id": transition_id}}
+        )
+        self.transition_done(issue_key, issue_type, to_status)
+        return True
+
+    async def create_issue(
+        self,
+        project_key: str,
+        summary: str,
+        description: str = "",
+        issue_type: str = "Sub-task",
+        parent_key: str | None = None,
+        labels: list[str] | None = None,
+    ) -> JiraIssue:
+        """Create a new Jira issue (see JiraClient.create_issue)."""
+        fields = issue_fields(
+            project_key, summary, description, issue_type, parent_key, labels
+        )
+        data = await self._request("POST", "/rest/api/3/issue", data={"fields": fields})
+        created_key = data.get("key", "")
+        if created_key:
+            return await self.get_issue(created_key)
+        return JiraIssue.from_api_response(data)
+
+    async def create_issues_bulk(
+        self,
+        issues: Iterable[dict[str, Any]],
+        chunk_size: int = BULK_CREATE_MAX,
+    ) -> BulkCreateResult:
+        """Create many issues (see JiraClient.create_issues_bulk).
+
+        Chunks are sent concurrently.
+        """
+        chunks = bulk_create_chunks(issues, chunk_size)
+        responses = await self.gather(
+            self._request("POST", BULK_CREATE_ENDPOINT, data=bulk_create_payload(chunk))
+            for _, chunk in chunks
+        )
+
+        result = BulkCreateResult(issues={}, errors=[])
+        for (offset, chunk), response in zip(chunks, responses, strict=True):
+            if isinstance(response, CircuitOpenError):
+                raise response
+            if isinstance(response, JiraAPIError):
+                result.add_failed_chunk(offset, chunk, response)
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                result.add_chunk(offset, chunk, response)
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    async def get_projects(self) -> list[dict[str, Any]]:
+        """Get all accessible projects."""
+        return await self._get_cached("/rest/api/3/project")
+
+    async def test_connection(self) -> bool:
+        """Test the Jira connection."""
+        try:
+            await self._request("GET", "/rest/api/3/myself")
+            return True
+        except JiraAPIError:
+            return False
@@ -0,0 +1,194 @@
+"""Keep-alive HTTP/1.1 connection pool for the Jira client.
+
+``urllib.request.urlopen`` opens a new connection (DNS, TCP and TLS
+handshake) for every call. The pool keeps idle ``http.client`` connections
+per host and reuses them, so consecutive API calls only pay for the request
+itself. Checkout and checkin are thread-safe; a connection is only ever used
+by one thread at a time.
+"""
+
+import http.client
+import ssl
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+# Errors meaning the server closed an idle keep-alive connection. Raised
+# while sending, the request never reached the server. Raised while reading
+# the response, the server may already have handled it. See
+# ConnectionPool.request for when a request is resent.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+# Methods that are safe to send twice
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class PooledResponse:
+    """A fully read HTTP response."""
+
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections, keyed by scheme/host/port."""
+
+    def __init__(
+        self,
+        max_per_host: int = 10,
+        timeout: float = 30.0,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            max_per_host: Idle connections kept per host; extra connections
+                opened under concurrency are closed when returned
+            timeout: Socket timeout in seconds for connect and read
+            ssl_context: TLS context for https (default: system defaults)
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        # Loading the system CA bundle takes tens of milliseconds, so the
+        # default context is only created for the first https connection
+        self._ssl_context = ssl_context
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """TLS context for https connections."""
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return self._ssl_context
+
+    def _new_connection(
+        self, scheme: str, host: str, port: int
+    ) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _checkout(
+        self, key: tuple[str, str, int]
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection for key, or open a new one.
+
+        Returns:
+            (connection, reused)
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.connections_reused += 1
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _checkin(
+        self, key: tuple[str, str, int], conn: http.client.HTTPConnection
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> PooledResponse:
+        """Send a request over a pooled connection.
+
+        If a reused idle connection turns out to be closed, the request is
+        resent once on a new connection when it failed while being sent
+        (the server never got it), or when the method is idempotent. A POST
+        that fails while its response is read is not resent: the server may
+        have handled it, so the error goes to the caller's retry policy.
+
+        Args:
+            method: HTTP method
+            url: Absolute http or https URL
+            body: Optional request body
+            headers: Optional request headers
+
+        Returns:
+            The response with its body fully read
+
+        Raises:
+            OSError, http.client.HTTPException: On connection failures
+            ValueError: If the URL scheme is not http or https
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname or "", port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        idempotent = method.upper() in _IDEMPOTENT_METHODS
+        while True:
+            conn, reused = self._checkout(key)
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and (idempotent or not sent):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return PooledResponse(
+                status=response.status,
+                reason=response.reason,
+                headers=response.headers,
+                body=data,
+            )
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict[str, int]:
+        """Connection counters for diagnostics and benchmarks."""
+        with self._lock:
+            return {
+                "opened": self.connections_opened,
+                "reused": self.connections_reused,
+                "idle": sum(len(conns) for conns in self._idle.values()),
+            }
@@ -5,12 +5,39 @@ Credentials are loaded from environment variables.
 """
 
 import base64
+import http.client
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+from src.sejfa.integrations.http_pool import ConnectionPool, PooledResponse
+from src.sejfa.integrations.response_cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SqliteCacheBackend,
+)
+from src.sejfa.integrations.retry import (
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+# Largest page Jira returns from /search, whatever maxResults asks for
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Most issues Jira accepts in one /issue/bulk request
+BULK_CREATE_MAX = 50
+
+ISSUE_ENDPOINT = "/rest/api/3/issue/"
+SEARCH_ENDPOINT = "/rest/api/3/search"
+BULK_CREATE_ENDPOINT = "/rest/api/3/issue/bulk"
 
 
 @dataclass
@@ -58,105 +85,915 @@ class JiraConfig:
         return f"Basic {encoded}"
 
 
-@dataclass
+# Fields JiraIssue decodes on access, and the one key of each it reads
+# (None: the whole value); all it keeps when raw is discarded
+_LAZY_FIELDS = {
+    "description": None,
+    "labels": None,
+    "priority": "name",
+    "assignee": "displayName",
+    "reporter": "displayName",
+}
+
+
 class JiraIssue:
-    """Represents a Jira issue."""
-
-    key: str
-    summary: str
-    description: str | None
-    issue_type: str
-    status: str
-    priority: str | None
-    assignee: str | None
-    reporter: str | None
-    labels: list[str]
-    raw: dict[str, Any]
+    """Represents a Jira issue.
+
+    key, summary, issue_type and status are decoded when the issue is
+    built; description, priority, assignee, reporter and labels are read
+    from the response fields when accessed. Built with keep_raw=False, the
+    issue holds only those fields instead of the whole API response, which
+    for large searches is most of the memory.
+    """
+
+    __slots__ = ("key", "summary", "issue_type", "status", "_fields", "_raw")
+
+    def __init__(
+        self,
+        key: str,
+        summary: str,
+        issue_type: str,
+        status: str,
+        fields: dict[str, Any] | None = None,
+        raw: dict[str, Any] | None = None,
+    ):
+        """Initialize an issue.
+
+        Args:
+            key: Issue key (e.g., PROJ-123)
+            summary: Summary line
+            issue_type: Issue type name
+            status: Status name
+            fields: API "fields" object holding the lazily decoded fields
+            raw: Full API response, if kept
+        """
+        self.key = key
+        self.summary = summary
+        self.issue_type = issue_type
+        self.status = status
+        self._fields = fields if fields is not None else {}
+        self._raw = raw
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any]) -> "JiraIssue":
-        """Create JiraIssue from API response."""
-        fields = data.get("fields", {})
+    def from_api_response(
+        cls, data: dict[str, Any], keep_raw: bool = True
+    ) -> "JiraIssue":
+        """Create JiraIssue from API response.
+
+        Args:
+            data: Issue JSON from the Jira API
+            keep_raw: Keep the full response as raw; if False, raw is None
+                and only the fields the attributes need are retained
+        """
+        fields = data.get("fields") or {}
+        kept = fields
+        if not keep_raw:
+            kept = {}
+            for name, subkey in _LAZY_FIELDS.items():
+                value = fields.get(name)
+                if value and subkey is not None:
+                    value = {subkey: value.get(subkey)}
+                if value is not None:
+                    kept[name] = value
 
         return cls(
             key=data.get("key", ""),
             summary=fields.get("summary", ""),
-            description=fields.get("description"),
-            issue_type=fields.get("issuetype", {}).get("name", "Unknown"),
-            status=fields.get("status", {}).get("name", "Unknown"),
-            priority=(
-                fields.get("priority", {}).get("name")
-                if fields.get("priority")
-                else None
-            ),
-            assignee=(
-                fields.get("assignee", {}).get("displayName")
-                if fields.get("assignee")
-                else None
-            ),
-            reporter=(
-                fields.get("reporter", {}).get("displayName")
-                if fields.get("reporter")
-                else None
-            ),
-            labels=fields.get("labels", []),
-            raw=data,
+            issue_type=(fields.get("issuetype") or {}).get("name", "Unknown"),
+            status=(fields.get("status") or {}).get("name", "Unknown"),
+            fields=kept,
+            raw=data if keep_raw else None,
         )
 
+    @property
+    def raw(self) -> dict[str, Any] | None:
+        """Full API response, or None if it was discarded."""
+        return self._raw
+
+    @property
+    def description(self) -> Any:
+        """Description (Atlassian Document Format or plain text), or None."""
+        return self._fields.get("description")
+
+    @property
+    def priority(self) -> str | None:
+        """Priority name, or None."""
+        return (self._fields.get("priority") or {}).get("name")
 
-class JiraClient:
-    """Simple Jira REST API client."""
+    @property
+    def assignee(self) -> str | None:
+        """Assignee display name, or None."""
+        return (self._fields.get("assignee") or {}).get("displayName")
+
+    @property
+    def reporter(self) -> str | None:
+        """Reporter display name, or None."""
+        return (self._fields.get("reporter") or {}).get("displayName")
 
-    def __init__(self, config: JiraConfig | None = None):
-        """Initialize client with config or load from environment."""
+    @property
+    def labels(self) -> list[str]:
+        """Labels."""
+        return self._fields.get("labels") or []
+
+    def _values(self) -> tuple[Any, ...]:
+        return (
+            self.key,
+            self.summary,
+            self.issue_type,
+            self.status,
+            self.description,
+            self.priority,
+            self.assignee,
+            self.reporter,
+            self.labels,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JiraIssue):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"JiraIssue(key={self.key!r}, summary={self.summary!r}, "
+            f"issue_type={self.issue_type!r}, status={self.status!r})"
+        )
+
+
+def adf_document(text: str) -> dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format doc."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}],
+            }
+        ],
+    }
+
+
+def issue_fields(
+    project_key: str,
+    summary: str,
+    description: str = "",
+    issue_type: str = "Sub-task",
+    parent_key: str | None = None,
+    labels: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build the create-issue fields payload (see JiraClient.create_issue)."""
+    summary = summary[:255]
+
+    fields: dict[str, Any] = {
+        "project": {"key": project_key},
+        "summary": summary,
+        "issuetype": {"name": issue_type},
+        "description": adf_document(description or summary),
+    }
+
+    if parent_key:
+        fields["parent"] = {"key": parent_key}
+
+    if labels:
+        fields["labels"] = labels
+
+    return fields
+
+
+def issue_transitions_query(issue_key: str) -> str:
+    """Endpoint returning an issue's type, status and transitions in one GET."""
+    return f"{ISSUE_ENDPOINT}{issue_key}?fields=status,issuetype&expand=transitions"
+
+
+class TransitionCache:
+    """Workflow transition IDs and last known issue states.
+
+    Transition IDs depend only on the workflow position, so they are cached
+    per (project, issue type, status) as {transition name: (id, target
+    status)}. The last known (issue type, status) of recently seen issues
+    lets transition_issue pick the cached ID without asking Jira first.
+    """
+
+    def __init__(self, max_issues: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            max_issues: Issue states remembered (least recently used first
+                out)
+        """
+        self.max_issues = max_issues
+        self._transitions: dict[tuple[str, str, str], dict[str, tuple[str, str]]] = {}
+        self._issues: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def remember_issue(self, issue_key: str, issue_type: str, status: str) -> None:
+        """Record an issue's current type and status."""
+        with self._lock:
+            self._issues[issue_key] = (issue_type, status)
+            self._issues.move_to_end(issue_key)
+            while len(self._issues) > self.max_issues:
+                self._issues.popitem(last=False)
+
+    def issue_state(self, issue_key: str) -> tuple[str, str] | None:
+        """Last known (issue type, status) of an issue, if any."""
+        with self._lock:
+            return self._issues.get(issue_key)
+
+    def store(
+        self,
+        project: str,
+        issue_type: str,
+        status: str,
+        transitions: list[dict[str, Any]],
+    ) -> None:
+        """Cache the transitions available from a workflow status."""
+        mapping = {
+            t.get("name", "").lower(): (t.get("id"), t.get("to", {}).get("name", ""))
+            for t in transitions
+            if t.get("id")
+        }
+        with self._lock:
+            self._transitions[(project, issue_type, status)] = mapping
+
+    def lookup(
+        self, project: str, issue_type: str, status: str, transition_name: str
+    ) -> tuple[str, str] | None:
+        """Cached (transition ID, target status), or None."""
+        with self._lock:
+            cached = self._transitions.get((project, issue_type, status), {}).get(
+                transition_name.lower()
+            )
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return cached
+
+    def select(
+        self, issue_key: str, transition_name: str, issue_data: dict[str, Any]
+    ) -> tuple[str, str | None, str | None]:
+        """Cache the transitions in an issue response and pick one by name.
+
+        Args:
+            issue_key: The issue key
+            transition_name: Name of the transition
+            issue_data: GET issue response with fields=status,issuetype and
+                expand=transitions
+
+        Returns:
+            (transition ID, issue type, target status)
+
+        Raises:
+            JiraAPIError: If no transition has that name
+        """
+        transitions = issue_data.get("transitions", [])
+        fields = issue_data.get("fields", {})
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        status = (fields.get("status") or {}).get("name")
+        if issue_type and status:
+            self.store(issue_key.rsplit("-", 1)[0], issue_type, status, transitions)
+
+        for transition in transitions:
+            if transition.get("name", "").lower() == transition_name.lower():
+                if transition.get("id"):
+                    to_status = (transition.get("to") or {}).get("name")
+                    return transition["id"], issue_type, to_status
+                break
+
+        available = [t.get("name") for t in transitions]
+        raise JiraAPIError(
+            f"Transition '{transition_name}' not found. Available: {available}"
+        )
+
+    def invalidate(self, project: str, issue_type: str, status: str) -> None:
+        """Forget the transitions of a workflow status."""
+        with self._lock:
+            if self._transitions.pop((project, issue_type, status), None):
+                self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and invalidation counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "statuses": len(self._transitions),
+                "issues": len(self._issues),
+            }
+
+
+@dataclass
+class BulkCreateError:
+    """One issue that could not be created by create_issues_bulk."""
+
+    index: int
+    message: str
+    status_code: int | None = None
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of create_issues_bulk.
+
+    Attributes:
+        issues: Created issues by input index
+        errors: Failed items, in input order
+    """
+
+    issues: dict[int, JiraIssue]
+    errors: list[BulkCreateError]
+
+    def add_chunk(
+        self, offset: int, chunk: list[dict[str, Any]], data: dict[str, Any]
+    ) -> None:
+        """Record the bulk create response for the chunk starting at offset."""
+        failed: set[int] = set()
+        for error in data.get("errors", []):
+            index = error.get("failedElementNumber")
+            if index is None:
+                continue
+            failed.add(index)
+            self.errors.append(
+                BulkCreateError(
+                    offset + index, _bulk_error_message(error), error.get("status")
+                )
+            )
+
+        # Created issues come back in submission order, minus failures
+        created = iter(data.get("issues", []))
+        for index, fields in enumerate(chunk):
+            if index in failed:
+                continue
+            response = next(created, None)
+            if response is None:
+                break
+            self.issues[offset + index] = JiraIssue.from_api_response(
+                {**response, "fields": fields}
+            )
+
+    def add_failed_chunk(
+        self, offset: int, chunk: list[dict[str, Any]], error: "JiraAPIError"
+    ) -> None:
+        """Record a bulk create request that failed as a whole."""
+        # Jira answers 400 with per-item errors when nothing was created
+        data = _parse_bulk_error(error)
+        if data is not None:
+            self.add_chunk(offset, chunk, data)
+            return
+        self.errors.extend(
+            BulkCreateError(offset + i, str(error), error.status_code)
+            for i in range(len(chunk))
+        )
+
+
+def bulk_create_chunks(
+    issues: Iterable[dict[str, Any]], chunk_size: int = BULK_CREATE_MAX
+) -> list[tuple[int, list[dict[str, Any]]]]:
+    """Split create_issue keyword arguments into bulk create chunks.
+
+    Args:
+        issues: One dict of create_issue keyword arguments per issue
+        chunk_size: Issues per request (capped at BULK_CREATE_MAX)
+
+    Returns:
+        (offset of the first issue, issue fields) per chunk
+    """
+    chunk_size = max(1, min(chunk_size, BULK_CREATE_MAX))
+    all_fields = [issue_fields(**issue) for issue in issues]
+    return [
+        (offset, all_fields[offset : offset + chunk_size])
+        for offset in range(0, len(all_fields), chunk_size)
+    ]
+
+
+def bulk_create_payload(chunk: list[dict[str, Any]]) -> dict[str, Any]:
+    """Request body for one bulk create chunk."""
+    return {"issueUpdates": [{"fields": fields} for fields in chunk]}
+
+
+class SearchPages:
+    """Paging through a JQL search, independent of how pages are fetched.
+
+    iter_issues in both clients asks for payload(start_at), feeds each page
+    to advance() and yields the issues it returns.
+    """
+
+    def __init__(
+        self,
+        jql: str,
+        fields: Iterable[str] | None = None,
+        page_size: int = SEARCH_MAX_PAGE_SIZE,
+        limit: int | None = None,
+    ):
+        """Start a search.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (default: all)
+            page_size: Issues per request (capped at SEARCH_MAX_PAGE_SIZE)
+            limit: Stop after this many issues (default: all)
+        """
+        self.jql = jql
+        self.fields = list(fields) if fields is not None else None
+        self.page_size = max(1, min(page_size, SEARCH_MAX_PAGE_SIZE))
+        self.limit = limit
+        self.start_at = 0
+        self.yielded = 0
+
+    def payload(self, start_at: int) -> dict[str, Any]:
+        """Request body for the page starting at start_at."""
+        payload: dict[str, Any] = {
+            "jql": self.jql,
+            "startAt": start_at,
+            "maxResults": self.page_size,
+        }
+        if self.fields is not None:
+            payload["fields"] = self.fields
+        return payload
+
+    def advance(self, page: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+        """Take in a search response.
+
+        Args:
+            page: Response for the page starting at start_at
+
+        Returns:
+            (issue JSON to yield, whether another page follows at the new
+            start_at)
+        """
+        issues = page.get("issues", [])
+        self.start_at += len(issues)
+        total = page.get("total")
+        more = bool(issues) and (
+            self.start_at < total
+            if total is not None
+            else len(issues) >= self.page_size
+        )
+        if self.limit is not None and self.yielded + len(issues) >= self.limit:
+            more = False
+            issues = issues[: self.limit - self.yielded]
+        self.yielded += len(issues)
+        return issues, more
+
+
+@dataclass
+class PreparedRequest:
+    """A Jira API request ready to be sent by either client."""
+
+    method: str
+    url: str
+    body: bytes | None
+    headers: dict[str, str]
+    idempotent: bool
+
+
+class JiraClientBase:
+    """State and decisions shared by JiraClient and AsyncJiraClient.
+
+    Everything that does not depend on how a request is sent lives here:
+    building requests, judging responses and connection errors, retry
+    delays, circuit breaker bookkeeping, response cache upkeep and the
+    transition cache. The subclasses only send requests and wait, blocking
+    or with asyncio.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        """Initialize client with config or load from environment.
+
+        Args:
+            config: Jira configuration (default: from environment)
+            retry_policy: Retry policy (default: RetryPolicy())
+            breaker: Circuit breaker, may be shared between clients
+                (default: a private CircuitBreaker())
+            cache: Response cache for get_issue and get_projects, may be
+                shared between clients (default: no caching)
+        """
         self.config = config or JiraConfig.from_env()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.cache = cache
+        self.transitions = TransitionCache()
+        self._counters = {"retries": 0, "gave_up": 0, "breaker_rejections": 0}
+        self._counters_lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._counters_lock:
+            self._counters[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Retry and circuit breaker counters.
+
+        Returns:
+            Dict with retries, gave_up (retryable failures that ran out of
+            attempts or budget), breaker_rejections, breaker_trips,
+            breaker_state and, with a response cache, cache (see
+            ResponseCache.stats)
+        """
+        with self._counters_lock:
+            counters = dict(self._counters)
+        stats: dict[str, Any] = {
+            **counters,
+            "breaker_trips": self.breaker.trips,
+            "breaker_state": self.breaker.state,
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def prepare_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> PreparedRequest:
+        """Build an authenticated request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (e.g., /rest/api/3/issue/PROJ-123)
+            data: Optional JSON body
+            idempotent: Whether the call may be repeated after a lost
+                connection or 5xx (default: by method; read-only POSTs
+                such as search pass True)
+            extra_headers: Headers to add, e.g. conditional request headers
+
+        Returns:
+            The request
+        """
+        headers = {
+            "Authorization": self.config.auth_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            **(extra_headers or {}),
+        }
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return PreparedRequest(
+            method=method,
+            url=f"{self.config.url}{endpoint}",
+            body=json.dumps(data).encode() if data else None,
+            headers=headers,
+            idempotent=idempotent,
+        )
+
+    def admit(self) -> None:
+        """Claim a call from the circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+        """
+        if not self.breaker.allow():
+            self._count("breaker_rejections")
+            raise CircuitOpenError(
+                "Jira circuit breaker is open after repeated failures"
+            )
+
+    def connection_error(self, error: BaseException) -> "JiraAPIError":
+        """Record a failed connection with the breaker.
+
+        Args:
+            error: The transport's exception
+
+        Returns:
+            The JiraAPIError to raise in its place
+        """
+        self.breaker.record_failure()
+        return JiraAPIError(f"Connection error: {error}")
+
+    def check_response(self, response: PooledResponse) -> PooledResponse:
+        """Record a response with the breaker and reject error statuses.
+
+        Returns:
+            The response, if its status is below 400
+
+        Raises:
+            JiraAPIError: For status 400 and above
+        """
+        # 429 and client errors mean Jira is up; only 5xx count as failures
+        if response.status >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        if response.status >= 400:
+            raise JiraAPIError(
+                f"Jira API error {response.status}: {response.reason}",
+                status_code=response.status,
+                response=response.body.decode(),
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+        return response
+
+    def retry_delay(
+        self,
+        error: "JiraAPIError",
+        attempt: int,
+        request: PreparedRequest,
+        deadline: float,
+    ) -> float | None:
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            error: Error from the attempt
+            attempt: Zero-based number of the attempt that failed
+            request: The request
+            deadline: time.monotonic() by which retries must be done
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if isinstance(error, CircuitOpenError):
+            return None
+        delay = self.retry_policy.next_delay(
+            attempt,
+            error.status_code,
+            request.idempotent,
+            retry_after=error.retry_after,
+            remaining=deadline - time.monotonic(),
+        )
+        if delay is None:
+            if error.status_code is None or error.status_code in (
+                self.retry_policy.retry_statuses
+            ):
+                self._count("gave_up")
+            return None
+        self._count("retries")
+        return delay
+
+    def cache_key(self, endpoint: str) -> str:
+        """Cache key for an endpoint; per account, as the cache may be shared."""
+        return f"{self.config.email} {self.config.url}{endpoint}"
+
+    def forget_written(
+        self, method: str, endpoint: str, data: dict[str, Any] | None
+    ) -> None:
+        """Drop the cached reads of the issues a write touches.
+
+        Called after every request, failed or not: a failed write may
+        still have been applied.
+        """
+        if self.cache is not None and method.upper() != "GET":
+            for issue_key in written_issue_keys(endpoint, data):
+                self.forget_issue(issue_key)
+
+    @staticmethod
+    def parse_body(response: PooledResponse) -> Any:
+        """Decode a JSON response body ({} when empty)."""
+        response_data = response.body.decode()
+        if response_data:
+            return json.loads(response_data)
+        return {}
+
+    def issue_from_response(
+        self, data: dict[str, Any], keep_raw: bool = True
+    ) -> JiraIssue:
+        """Build an issue and remember its workflow state for transitions."""
+        issue = JiraIssue.from_api_response(data, keep_raw)
+        if issue.status != "Unknown" and issue.issue_type != "Unknown":
+            self.transitions.remember_issue(issue.key, issue.issue_type, issue.status)
+        return issue
+
+    def prime_issue(self, data: dict[str, Any]) -> JiraIssue:
+        """Take in an issue delivered without a request, e.g. by a webhook.
+
+        The issue's workflow state is remembered for transition_issue and,
+        with a response cache whose ttl is above 0, the issue is cached as
+        if get_issue had fetched it (see ResponseCache.put).
+
+        Args:
+            data: Issue JSON in the shape get_issue receives
+
+        Returns:
+            The issue
+        """
+        issue = self.issue_from_response(data, keep_raw=False)
+        if self.cache is not None and issue.key:
+            self.cache.put(self.cache_key(ISSUE_ENDPOINT + issue.key), json.dumps(data))
+        return issue
+
+    def forget_issue(self, issue_key: str) -> None:
+        """Drop cached responses for an issue, e.g. after it was deleted."""
+        if self.cache is not None:
+            self.cache.invalidate(self.cache_key(ISSUE_ENDPOINT + issue_key))
+
+    def cached_transition(
+        self, issue_key: str, transition_name: str
+    ) -> tuple[str, str] | None:
+        """Cached (transition ID, target status) for the issue's known state.
+
+        Returns:
+            The cached transition, or None if the issue's type and status
+            or the transitions of that status are not cached
+        """
+        state = self.transitions.issue_state(issue_key)
+        if state is None:
+            return None
+        return self.transitions.lookup(
+            issue_key.rsplit("-", 1)[0], *state, transition_name
+        )
+
+    def cached_transition_rejected(self, issue_key: str, error: "JiraAPIError") -> bool:
+        """Handle an error from POSTing a cached transition ID.
+
+        Returns:
+            True if Jira rejected the ID (400/409: not a valid transition
+            from the real status); its cache entry is dropped and the
+            transitions should be fetched again. False for other errors,
+            which the caller re-raises.
+        """
+        if error.status_code not in (400, 409):
+            return False
+        state = self.transitions.issue_state(issue_key)
+        if state is not None:
+            self.transitions.invalidate(issue_key.rsplit("-", 1)[0], *state)
+        return True
+
+    def transition_done(
+        self, issue_key: str, issue_type: str | None, to_status: str | None
+    ) -> None:
+        """Remember an issue's state after a successful transition."""
+        if issue_type is None:
+            state = self.transitions.issue_state(issue_key)
+            issue_type = state[0] if state else None
+        if issue_type and to_status:
+            self.transitions.remember_issue(issue_key, issue_type, to_status)
+
+
+class JiraClient(JiraClientBase):
+    """Simple Jira REST API client.
+
+    Requests go over pooled HTTP/1.1 keep-alive connections, so only the
+    first call to a host pays for DNS, TCP and TLS setup. The client is
+    thread-safe; call close() (or use it as a context manager) to release
+    idle connections.
+
+    Throttled (429) and unavailable (502/503/504) responses are retried
+    according to the RetryPolicy, honoring Retry-After. Repeated server or
+    connection failures open the CircuitBreaker, after which calls raise
+    CircuitOpenError immediately until Jira has had time to recover.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig | None = None,
+        pool: ConnectionPool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        """Initialize client with config or load from environment.
+
+        Args:
+            config: Jira configuration (default: from environment)
+            pool: Connection pool to use (default: a private pool)
+            retry_policy: Retry policy (default: RetryPolicy())
+            breaker: Circuit breaker, may be shared between clients
+                (default: a private CircuitBreaker())
+            cache: Response cache for get_issue and get_projects, may be
+                shared between clients (default: no caching)
+        """
+        super().__init__(config, retry_policy, breaker, cache)
+        self.pool = pool or ConnectionPool(timeout=30)
+
+    def close(self) -> None:
+        """Close idle pooled connections."""
+        self.pool.close()
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _request(
         self,
         method: str,
         endpoint: str,
         data: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
     ) -> dict[str, Any]:
         """Make authenticated request to Jira API.
 
+        Writes through this client drop the cached reads of the issues
+        they touch (see ResponseCache).
+
         Args:
             method: HTTP method (GET, POST, PUT, etc.)
             endpoint: API endpoint (e.g., /rest/api/3/issue/PROJ-123)
             data: Optional JSON data for POST/PUT requests
+            idempotent: See JiraClientBase.prepare_request
 
         Returns:
             Parsed JSON response
 
         Raises:
-            JiraAPIError: On API errors
+            CircuitOpenError: If the circuit breaker is open
+            JiraAPIError: On API errors once retries are exhausted
         """
-        url = f"{self.config.url}{endpoint}"
+        try:
+            response = self._call(method, endpoint, data, idempotent)
+        finally:
+            self.forget_written(method, endpoint, data)
+        return self.parse_body(response)
 
-        headers = {
-            "Authorization": self.config.auth_header,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+    def _call(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> PooledResponse:
+        """Send a request, retrying according to the retry policy.
 
-        body = json.dumps(data).encode() if data else None
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Optional JSON body
+            idempotent: See JiraClientBase.prepare_request
+            extra_headers: Headers to add, e.g. conditional request headers
+
+        Returns:
+            The successful (status below 400) response
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            JiraAPIError: On API errors once retries are exhausted
+        """
+        request = self.prepare_request(
+            method, endpoint, data, idempotent, extra_headers
+        )
+        deadline = time.monotonic() + self.retry_policy.budget
+
+        attempt = 0
+        while True:
+            try:
+                return self._send(request)
+            except JiraAPIError as e:
+                delay = self.retry_delay(e, attempt, request, deadline)
+                if delay is None:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+    def _get_cached(self, endpoint: str) -> Any:
+        """GET an endpoint through the response cache, if one is configured.
+
+        Returns:
+            Parsed JSON response
+        """
+        if self.cache is None:
+            return self._request("GET", endpoint)
+
+        key = self.cache_key(endpoint)
+        entry, fresh = self.cache.lookup(key)
+        if not fresh:
+            response = self._call(
+                "GET", endpoint, extra_headers=self.cache.validators(entry)
+            )
+            body = self.cache.update(
+                key, entry, response.status, response.headers, response.body.decode()
+            )
+        else:
+            body = entry.body
+        return json.loads(body) if body else {}
 
-        request = Request(url, data=body, headers=headers, method=method)
+    def _send(self, request: PreparedRequest) -> PooledResponse:
+        """Send one attempt through the circuit breaker.
 
+        Returns:
+            The response, if its status is below 400
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            JiraAPIError: On connection errors and error statuses
+        """
+        self.admit()
         try:
-            with urlopen(request, timeout=30) as response:
-                response_data = response.read().decode()
-                if response_data:
-                    return json.loads(response_data)
-                return {}
-        except HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-            raise JiraAPIError(
-                f"Jira API error {e.code}: {e.reason}",
-                status_code=e.code,
-                response=error_body,
-            ) from e
-        except URLError as e:
-            raise JiraAPIError(f"Connection error: {e.reason}") from e
+            response = self.pool.request(
+                request.method, request.url, body=request.body, headers=request.headers
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise self.connection_error(e) from e
+        except BaseException:
+            self.breaker.release()
+            raise
+        return self.check_response(response)
 
     def get_issue(self, issue_key: str) -> JiraIssue:
         """Fetch a Jira issue by key.
@@ -167,32 +1004,94 @@ class JiraClient:
         Returns:
             JiraIssue object with issue details
         """
-        endpoint = f"/rest/api/3/issue/{issue_key}"
-        data = self._request("GET", endpoint)
-        return JiraIssue.from_api_response(data)
+        return self.issue_from_response(self._get_cached(ISSUE_ENDPOINT + issue_key))
 
-    def search_issues(self, jql: str, max_results: int = 50) -> list[JiraIssue]:
+    def search_issues(
+        self,
+        jql: str,
+        max_results: int = 50,
+        fields: Iterable[str] | None = None,
+        keep_raw: bool = False,
+    ) -> list[JiraIssue]:
         """Search for issues using JQL.
 
         Args:
             jql: JQL query string
-            max_results: Maximum number of results
+            max_results: Maximum number of results (fetched over as many
+                pages as needed)
+            fields: Fields to return (default: all)
+            keep_raw: Also keep each issue's full API response as raw
+                (default: only what the JiraIssue attributes need)
 
         Returns:
             List of JiraIssue objects
         """
-        endpoint = "/rest/api/3/search"
-        data = self._request(
-            "POST",
-            endpoint,
-            data={"jql": jql, "maxResults": max_results},
+        return list(
+            self.iter_issues(
+                jql,
+                fields=fields,
+                page_size=max_results,
+                limit=max_results,
+                keep_raw=keep_raw,
+            )
         )
 
-        issues = []
-        for issue_data in data.get("issues", []):
-            issues.append(JiraIssue.from_api_response(issue_data))
+    def iter_issues(
+        self,
+        jql: str,
+        fields: Iterable[str] | None = None,
+        page_size: int = SEARCH_MAX_PAGE_SIZE,
+        limit: int | None = None,
+        prefetch: bool = False,
+        keep_raw: bool = False,
+    ) -> Iterator[JiraIssue]:
+        """Iterate over all issues matching a JQL query, page by page.
+
+        Pages are requested lazily, so at most one page (two with
+        prefetch) is held in memory however large the result is.
 
-        return issues
+        Args:
+            jql: JQL query string
+            fields: Fields to return, e.g. ["summary", "status"]; projecting
+                only what the caller needs shrinks every page considerably
+                (default: all fields)
+            page_size: Issues per request (capped at SEARCH_MAX_PAGE_SIZE)
+            limit: Stop after this many issues (default: all)
+            prefetch: Fetch the next page in a background thread while
+                the caller processes the current one
+            keep_raw: Also keep each issue's full API response as raw
+                (default: only what the JiraIssue attributes need)
+
+        Yields:
+            JiraIssue objects in result order
+        """
+        pages = SearchPages(jql, fields, page_size, limit)
+
+        def fetch(start_at: int) -> dict[str, Any]:
+            return self._request(
+                "POST", SEARCH_ENDPOINT, data=pages.payload(start_at), idempotent=True
+            )
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch(0)
+            while True:
+                issues, more = pages.advance(page)
+                pending = (
+                    executor.submit(fetch, pages.start_at)
+                    if more and executor
+                    else None
+                )
+
+                for issue_data in issues:
+                    yield JiraIssue.from_api_response(issue_data, keep_raw)
+
+                if not more:
+                    return
+                page = pending.result() if pending else fetch(pages.start_at)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     def add_comment(self, issue_key: str, body: str) -> dict[str, Any]:
         """Add a comment to an issue.
@@ -207,20 +1106,7 @@ class JiraClient:
         endpoint = f"/rest/api/3/issue/{issue_key}/comment"
 
         # Use Atlassian Document Format for the comment
-        comment_data = {
-            "body": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": body}],
-                    }
-                ],
-            }
-        }
-
-        return self._request("POST", endpoint, data=comment_data)
+        return self._request("POST", endpoint, data={"body": adf_document(body)})
 
     def transition_issue(self, issue_key: str, transition_name: str) -> bool:
         """Transition an issue to a new status.
@@ -231,31 +1117,39 @@ class JiraClient:
 
         Returns:
             True if transition was successful
+
+        When the issue's type and status are known (from get_issue or an
+        earlier transition) and the transition ID for that workflow status
+        is cached, the transition is POSTed directly: one request. If Jira
+        rejects the cached ID, the cache entry is dropped and the
+        transitions are fetched again.
         """
-        # First, get available transitions
         endpoint = f"/rest/api/3/issue/{issue_key}/transitions"
-        transitions_data = self._request("GET", endpoint)
-
-        # Find the transition by name
-        transition_id = None
-        for transition in transitions_data.get("transitions", []):
-            if transition.get("name", "").lower() == transition_name.lower():
-                transition_id = transition.get("id")
-                break
 
-        if not transition_id:
-            available = [t.get("name") for t in transitions_data.get("transitions", [])]
-            raise JiraAPIError(
-                f"Transition '{transition_name}' not found. Available: {available}"
-            )
+        cached = self.cached_transition(issue_key, transition_name)
+        if cached is not None:
+            transition_id, to_status = cached
+            try:
+                self._request(
+                    "POST", endpoint, data={"transition": {"id": transition_id}}
+                )
+            except JiraAPIError as e:
+                if not self.cached_transition_rejected(issue_key, e):
+                    raise
+            else:
+                self.transition_done(issue_key, None, to_status)
+                return True
+
+        # Get the issue's type, status and available transitions in one call
+        transitions_data = self._request("GET", issue_transitions_query(issue_key))
+        transition_id, issue_type, to_status = self.transitions.select(
+            issue_key, transition_name, transitions_data
+        )
 
         # Perform the transition
-        self._request(
-            "POST",
-            endpoint,
-            data={"transition": {"id": transition_id}},
-        )
+        self._request("POST", endpoint, data={"transition": {"id": transition_id}})
 
+        self.transition_done(issue_key, issue_type, to_status)
         return True
 
     def create_issue(
@@ -283,33 +1177,9 @@ class JiraClient:
         Raises:
             JiraAPIError: On API errors or validation failure
         """
-        summary = summary[:255]
-
-        # Build ADF description
-        desc_content = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": description or summary}],
-                }
-            ],
-        }
-
-        fields: dict[str, Any] = {
-            "project": {"key": project_key},
-            "summary": summary,
-            "issuetype": {"name": issue_type},
-            "description": desc_content,
-        }
-
-        if parent_key:
-            fields["parent"] = {"key": parent_key}
-
-        if labels:
-            fields["labels"] = labels
-
+        fields = issue_fields(
+            project_key, summary, description, issue_type, parent_key, labels
+        )
         data = self._request("POST", "/rest/api/3/issue", data={"fields": fields})
 
         # Fetch the created issue to return full JiraIssue
@@ -319,14 +1189,54 @@ class JiraClient:
 
         return JiraIssue.from_api_response(data)
 
+    def create_issues_bulk(
+        self,
+        issues: Iterable[dict[str, Any]],
+        chunk_size: int = BULK_CREATE_MAX,
+    ) -> BulkCreateResult:
+        """Create many issues with one request per chunk.
+
+        Uses Jira's bulk create endpoint and builds each JiraIssue from the
+        create response and the submitted fields, without fetching it
+        again. Issues Jira rejects are reported per item; the rest of the
+        chunk is still created. The returned issues have status "Unknown"
+        (Jira does not return it on create).
+
+        Args:
+            issues: One dict of create_issue keyword arguments per issue
+                (project_key, summary, description, issue_type, ...)
+            chunk_size: Issues per request (capped at BULK_CREATE_MAX)
+
+        Returns:
+            BulkCreateResult with created issues and errors by input index
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+        """
+        result = BulkCreateResult(issues={}, errors=[])
+
+        for offset, chunk in bulk_create_chunks(issues, chunk_size):
+            try:
+                data = self._request(
+                    "POST", BULK_CREATE_ENDPOINT, data=bulk_create_payload(chunk)
+                )
+            except CircuitOpenError:
+                raise
+            except JiraAPIError as e:
+                result.add_failed_chunk(offset, chunk, e)
+            else:
+                result.add_chunk(offset, chunk, data)
+
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
     def get_projects(self) -> list[dict[str, Any]]:
         """Get all accessible projects.
 
         Returns:
             List of project data
         """
-        endpoint = "/rest/api/3/project"
-        return self._request("GET", endpoint)
+        return self._get_cached("/rest/api/3/project")
 
     def test_connection(self) -> bool:
         """Test the Jira connection.
@@ -349,17 +1259,71 @@ class JiraAPIError(Exception):
         message: str,
         status_code: int | None = None,
         response: str | None = None,
+        retry_after: float | None = None,
     ):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        self.retry_after = retry_after
+
 
+class CircuitOpenError(JiraAPIError):
+    """Raised without calling Jira while the circuit breaker is open."""
 
-def get_jira_client() -> JiraClient:
+
+def _parse_bulk_error(error: JiraAPIError) -> dict[str, Any] | None:
+    """Per-item errors from a failed bulk create response, if present."""
+    try:
+        data = json.loads(error.response or "")
+    except ValueError:
+        return None
+    if isinstance(data, dict) and data.get("errors"):
+        return data
+    return None
+
+
+def _bulk_error_message(error: dict[str, Any]) -> str:
+    """Readable message for one bulk create error element."""
+    element = error.get("elementErrors", {})
+    messages = list(element.get("errorMessages", []))
+    messages += [f"{field}: {msg}" for field, msg in element.get("errors", {}).items()]
+    return "; ".join(messages) or f"Jira API error {error.get('status')}"
+
+
+def written_issue_keys(endpoint: str, data: dict[str, Any] | None) -> set[str]:
+    """Keys of the issues a write request changes.
+
+    That is the issue in the endpoint (comment, transition, edit) and the
+    parent of any sub-task being created.
+    """
+    keys: set[str] = set()
+    if endpoint.startswith(ISSUE_ENDPOINT):
+        key = endpoint[len(ISSUE_ENDPOINT) :].split("/", 1)[0].split("?", 1)[0]
+        if key and key != "bulk":
+            keys.add(key)
+    if data:
+        for update in data.get("issueUpdates") or [data]:
+            fields = update.get("fields")
+            # Search sends "fields" as a list of names
+            parent = fields.get("parent") if isinstance(fields, dict) else None
+            if parent and parent.get("key"):
+                keys.add(parent["key"])
+    return keys
+
+
+def get_jira_client(cache_path: str | None = None) -> JiraClient:
     """Get a configured Jira client.
 
     This is the main entry point for getting a Jira client.
-    It loads credentials from environment variables.
+    It loads credentials from environment variables. Reads are cached in
+    the SQLite database at JIRA_CACHE_PATH if set so that CLI invocations
+    share the cache, otherwise in memory. By default every read is
+    revalidated with Jira (a 304 when unchanged), so the cache never serves
+    a stale ticket; JIRA_CACHE_TTL sets the seconds an entry is instead
+    served without asking.
+
+    Args:
+        cache_path: SQLite cache database (default: JIRA_CACHE_PATH)
 
     Returns:
         Configured JiraClient instance
@@ -367,7 +1331,10 @@ def get_jira_client() -> JiraClient:
     Raises:
         ValueError: If environment variables are not set
     """
-    return JiraClient()
+    ttl = float(os.getenv("JIRA_CACHE_TTL", "0"))
+    path = cache_path or os.getenv("JIRA_CACHE_PATH")
+    backend = SqliteCacheBackend(path) if path else MemoryCacheBackend()
+    return JiraClient(cache=ResponseCache(backend, ttl=ttl))
 
 
 # CLI helper for testing
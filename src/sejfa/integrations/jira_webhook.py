@@ -0,0 +1,288 @@
+"""Jira webhook receiver.
+
+Jira pushes issue events to ``POST /api/jira/webhook`` instead of the app
+polling for them. The route verifies the shared-secret signature Jira sends
+in ``X-Hub-Signature`` (``sha256=<hex HMAC of the body>``), queues the
+payload and answers 202 at once; JiraWebhookProcessor handles the queue on
+a worker thread:
+
+- created/updated issues are put into the JiraClient's response cache (see
+  JiraClient.prime_issue) and deleted issues are dropped from it. This only
+  reaches the agent loop, which runs in other processes, through a cache
+  they share: create_app hands the processor a client only when
+  JIRA_CACHE_PATH names a SQLite cache;
+- status changes are forwarded as ``jira`` node updates to the monitor.
+
+Jira does not guarantee delivery order, so an event older than the last
+one handled for the same issue is skipped.
+
+With a record path every queued payload is appended to a JSONL file, which
+scripts/jira_webhook_replay.py can send again.
+
+``GET /api/jira/webhook/stats`` is signed the same way; its body is empty,
+so the header is ``sign(secret, b"")``.
+"""
+
+import hashlib
+import hmac
+import json
+import queue
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from flask import Blueprint, jsonify, request
+
+from src.sejfa.integrations.jira_client import JiraClient
+
+SIGNATURE_HEADER = "X-Hub-Signature"
+WEBHOOK_PATH = "/api/jira/webhook"
+
+ISSUE_DELETED = "jira:issue_deleted"
+
+# Issues whose last event timestamp is remembered for the ordering check
+MAX_TRACKED_ISSUES = 4096
+
+
+def sign(secret: str, body: bytes) -> str:
+    """
+    Compute the signature header value Jira sends for a body.
+
+    Args:
+        secret: Shared webhook secret
+        body: Raw request body
+
+    Returns:
+        "sha256=<hex digest>"
+    """
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, body: bytes, header: str | None) -> bool:
+    """
+    Check a signature header against the body.
+
+    Args:
+        secret: Shared webhook secret
+        body: Raw request body
+        header: Value of the X-Hub-Signature header
+
+    Returns:
+        True if the header is the body's signature
+    """
+    if not header:
+        return False
+    return hmac.compare_digest(sign(secret, body), header.strip())
+
+
+def status_changes(payload: dict[str, Any]) -> list[tuple[str, str]]:
+    """
+    Extract the status changes from a webhook payload's changelog.
+
+    Args:
+        payload: Webhook payload
+
+    Returns:
+        (from status, to status) pairs
+    """
+    items = (payload.get("changelog") or {}).get("items") or []
+    return [
+        (item.get("fromString") or "", item.get("toString") or "")
+        for item in items
+        if item.get("field") == "status"
+    ]
+
+
+class JiraWebhookProcessor:
+    """Handles queued webhook payloads on a worker thread."""
+
+    def __init__(
+        self,
+        client: JiraClient | None = None,
+        notify: Callable[[str, str], object] | None = None,
+        max_queue: int = 1000,
+    ):
+        """
+        Initialize the processor (call start() to begin handling).
+
+        Args:
+            client: Client whose cache receives pushed issues; it should
+                use a cache shared with the readers, e.g. SqliteCacheBackend
+                (optional)
+            notify: Called with (state, message) for each status change,
+                e.g. to update the monitor's jira node (optional)
+            max_queue: Most payloads waiting; submit() refuses more
+        """
+        self.client = client
+        self.notify = notify
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._last_seen: OrderedDict[str, int] = OrderedDict()
+        self._thread: threading.Thread | None = None
+        self._counters = {
+            "received": 0,
+            "processed": 0,
+            "stale": 0,
+            "dropped": 0,
+            "failed": 0,
+            "transitions": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="jira-webhook", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Handle the payloads already queued, then stop the worker."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def join(self) -> None:
+        """Wait until every queued payload has been handled."""
+        self._queue.join()
+
+    def submit(self, payload: dict[str, Any]) -> bool:
+        """
+        Queue a payload.
+
+        Args:
+            payload: Webhook payload
+
+        Returns:
+            False if the queue is full and the payload was dropped
+        """
+        self._count("received")
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            payload = self._queue.get()
+            try:
+                if payload is None:
+                    return
+                self.process(payload)
+            except Exception:
+                # A bad payload must not stop the worker
+                self._count("failed")
+            finally:
+                self._queue.task_done()
+
+    def _is_stale(self, issue_key: str, timestamp: Any) -> bool:
+        """Record an event's timestamp; True if a newer one was handled."""
+        if not isinstance(timestamp, int):
+            return False
+        with self._lock:
+            last = self._last_seen.get(issue_key)
+            if last is not None and timestamp < last:
+                return True
+            self._last_seen[issue_key] = timestamp
+            self._last_seen.move_to_end(issue_key)
+            while len(self._last_seen) > MAX_TRACKED_ISSUES:
+                self._last_seen.popitem(last=False)
+        return False
+
+    def process(self, payload: dict[str, Any]) -> None:
+        """
+        Handle one payload.
+
+        Args:
+            payload: Webhook payload
+        """
+        issue = payload.get("issue") or {}
+        key = issue.get("key")
+        if not key:
+            # Not an issue event (e.g. project or sprint events)
+            self._count("processed")
+            return
+        if self._is_stale(key, payload.get("timestamp")):
+            self._count("stale")
+            return
+
+        if self.client is not None:
+            if payload.get("webhookEvent") == ISSUE_DELETED:
+                self.client.forget_issue(key)
+            elif issue.get("fields"):
+                self.client.prime_issue(issue)
+
+        category = (
+            ((issue.get("fields") or {}).get("status") or {}).get("statusCategory")
+            or {}
+        ).get("key")
+        for old, new in status_changes(payload):
+            self._count("transitions")
+            if self.notify is not None:
+                state = "inactive" if category == "done" else "active"
+                self.notify(state, f"{key}: {old} → {new}")
+        self._count("processed")
+
+    def stats(self) -> dict[str, int]:
+        """Received, processed, stale, dropped, failed and transition counts."""
+        with self._lock:
+            counters = dict(self._counters)
+        return {**counters, "queued": self._queue.qsize()}
+
+
+def create_jira_webhook_blueprint(
+    processor: JiraWebhookProcessor, secret: str, record_path: str | None = None
+) -> Blueprint:
+    """
+    Create the blueprint receiving Jira webhooks.
+
+    Args:
+        processor: Processor the accepted payloads are queued on
+        secret: Shared secret the signatures are checked against
+        record_path: JSONL file every queued payload is appended to (optional)
+
+    Returns:
+        Blueprint with POST /api/jira/webhook and GET /api/jira/webhook/stats
+    """
+    blueprint = Blueprint("jira_webhook", __name__)
+    record_lock = threading.Lock()
+
+    @blueprint.route(WEBHOOK_PATH, methods=["POST"])
+    def receive_webhook():
+        """Verify, queue and record a webhook payload."""
+        body = request.get_data(cache=False)
+        if not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER)):
+            return jsonify({"error": "Invalid signature"}), 401
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return jsonify({"error": "Invalid JSON"}), 400
+        if not isinstance(payload, dict):
+            return jsonify({"error": "Payload must be a JSON object"}), 400
+
+        if not processor.submit(payload):
+            # Jira delivers it again; recording it now would record it twice
+            return jsonify({"error": "Webhook queue full"}), 503
+        if record_path:
+            with record_lock, open(record_path, "a", encoding="utf-8") as record:
+                record.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        return jsonify({"queued": True}), 202
+
+    @blueprint.route(WEBHOOK_PATH + "/stats", methods=["GET"])
+    def webhook_stats():
+        """Processor counters, for callers that hold the webhook secret."""
+        body = request.get_data(cache=False)
+        if not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER)):
+            return jsonify({"error": "Invalid signature"}), 401
+        return jsonify(processor.stats()), 200
+
+    return blueprint
@@ -0,0 +1,344 @@
+"""Response cache for Jira reads.
+
+The agent loop reads the same ticket several times per run (prompt
+building, status checks, comments). ResponseCache keeps GET responses by
+endpoint: within ``ttl`` seconds an entry is served without a request;
+after that it is revalidated with ``If-None-Match``/``If-Modified-Since``
+when Jira sent an ``ETag`` or ``Last-Modified``, so an unchanged issue
+costs a bodiless 304 instead of the full document.
+
+- MemoryCacheBackend keeps entries in the process (LRU-bounded).
+- SqliteCacheBackend keeps them in a SQLite database so separate CLI
+  invocations share the cache.
+
+The client invalidates an issue's entries after it writes to that issue.
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached GET response.
+
+    Attributes:
+        body: Response body text
+        etag: ETag validator, if Jira sent one
+        last_modified: Last-Modified validator, if Jira sent one
+        stored_at: Epoch time the body was last known to be current
+    """
+
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = 0.0
+
+
+class CacheBackend(ABC):
+    """Interface for storing cached responses by key."""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if nothing is stored under key
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store or replace an entry.
+
+        Args:
+            key: Cache key
+            entry: Response to store
+        """
+
+    @abstractmethod
+    def delete_resource(self, resource: str) -> int:
+        """
+        Delete the entry for a resource and for everything below it.
+
+        Args:
+            resource: Key of the resource, e.g. ".../rest/api/3/issue/GE-1";
+                keys continuing with "/" or "?" are deleted as well
+
+        Returns:
+            Number of entries deleted
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of entries stored."""
+
+
+def _below(key: str, resource: str) -> bool:
+    """Whether key is resource itself or a sub-resource/query of it."""
+    if not key.startswith(resource):
+        return False
+    return len(key) == len(resource) or key[len(resource)] in "/?"
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Keeps entries in this process, evicting the least recently used."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Most entries kept before evicting the oldest
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_resource(self, resource: str) -> int:
+        """Delete the entries of a resource and its sub-resources."""
+        with self._lock:
+            doomed = [key for key in self._entries if _below(key, resource)]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Keeps entries in a SQLite database shared between processes."""
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        # One connection per process, guarded by a lock for thread safety
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jira_responses ("
+            "key TEXT PRIMARY KEY, "
+            "body TEXT NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "stored_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at "
+                "FROM jira_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store or replace an entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jira_responses "
+                "(key, body, etag, last_modified, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, entry.body, entry.etag, entry.last_modified, entry.stored_at),
+            )
+
+    def delete_resource(self, resource: str) -> int:
+        """Delete the entries of a resource and its sub-resources."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jira_responses "
+                "WHERE key = ? OR substr(key, 1, ?) IN (?, ?)",
+                (resource, len(resource) + 1, resource + "/", resource + "?"),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM jira_responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM jira_responses").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """TTL cache with HTTP revalidation for GET responses.
+
+    Counters: ``hits`` (served without a request), ``revalidated`` (a 304
+    confirmed the entry), ``misses`` (the full body was fetched) and
+    ``invalidations`` (entries dropped after a write).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: Where entries are kept (default: MemoryCacheBackend())
+            ttl: Seconds an entry is served without asking Jira; 0 means
+                every read is revalidated
+            clock: Epoch time source; wall-clock time because entries in a
+                SQLite backend outlive the process (injectable for tests)
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "invalidations": 0}
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def lookup(self, key: str) -> tuple[CachedResponse | None, bool]:
+        """Find the entry for a request.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            (entry or None, whether it is fresh enough to use as is)
+        """
+        entry = self.backend.get(key)
+        fresh = entry is not None and self._clock() - entry.stored_at < self.ttl
+        if fresh:
+            self._count("hits")
+        return entry, fresh
+
+    @staticmethod
+    def validators(entry: CachedResponse | None) -> dict[str, str]:
+        """Conditional request headers for revalidating an entry."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(
+        self,
+        key: str,
+        entry: CachedResponse | None,
+        status: int,
+        headers: Mapping[str, str],
+        body: str,
+    ) -> str:
+        """Record the response to a request made after lookup().
+
+        Args:
+            key: Cache key of the request
+            entry: Entry returned by lookup(), if any
+            status: Response status
+            headers: Response headers
+            body: Response body text
+
+        Returns:
+            The body to use: the cached one on 304, otherwise body
+        """
+        now = self._clock()
+        if status == 304 and entry is not None:
+            self._count("revalidated")
+            self.backend.set(key, replace(entry, stored_at=now))
+            return entry.body
+
+        self._count("misses")
+        self.backend.set(
+            key,
+            CachedResponse(
+                body=body,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+                stored_at=now,
+            ),
+        )
+        return body
+
+    def put(self, key: str, body: str) -> None:
+        """Store a body obtained without a request (e.g. from a webhook).
+
+        The entry has no validators, so once stale it is fetched again.
+        With ttl 0 nothing is stored: the entry could never be served, and
+        it would replace one whose validators still allow a 304.
+
+        Args:
+            key: Cache key the GET request would use
+            body: Response body text
+        """
+        if self.ttl <= 0:
+            return
+        self.backend.set(key, CachedResponse(body=body, stored_at=self._clock()))
+
+    def invalidate(self, resource: str) -> None:
+        """Drop the entries of a resource and its sub-resources.
+
+        Args:
+            resource: Cache key of the resource
+        """
+        self._count("invalidations", self.backend.delete_resource(resource))
+
+    def stats(self) -> dict[str, int]:
+        """Hit, revalidation, miss and invalidation counters and entry count."""
+        with self._lock:
+            counters = dict(self._counters)
+        return {**counters, "entries": len(self.backend)}
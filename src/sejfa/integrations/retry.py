@@ -0,0 +1,180 @@
+"""Retry policy and circuit breaker for the Jira client.
+
+Jira Cloud throttles with 429 (and 503 under load), usually with a
+``Retry-After`` header. RetryPolicy decides whether and how long to wait
+before retrying a failed call; CircuitBreaker stops calling Jira for a while
+after repeated server or connection failures so callers fail fast instead of
+each waiting out their own retries.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header (delay seconds or HTTP date).
+
+    Args:
+        value: Header value
+        now: Current epoch time (default: time.time())
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = datetime.now(timezone.utc).timestamp() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to retry failed Jira calls.
+
+    Attributes:
+        max_attempts: Attempts per call, including the first
+        base_delay: Backoff base in seconds (doubles per attempt)
+        max_delay: Cap for a single backoff delay in seconds
+        budget: Total seconds a call may spend waiting and retrying
+        retry_statuses: Statuses worth retrying
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    budget: float = 60.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+
+    def next_delay(
+        self,
+        attempt: int,
+        status: int | None,
+        idempotent: bool,
+        retry_after: float | None = None,
+        remaining: float = float("inf"),
+    ) -> float | None:
+        """Decide whether to retry a failed attempt.
+
+        Non-idempotent calls are only retried on 429, which Jira sends
+        before processing the request; a lost connection or a 5xx may
+        already have created the issue.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            status: HTTP status, or None for a connection error
+            idempotent: Whether repeating the call is safe
+            retry_after: Server-requested delay in seconds, if any
+            remaining: Seconds left of the call's time budget
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if not idempotent and status != 429:
+            return None
+
+        # Full jitter spreads out clients that failed at the same moment
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        delay = backoff if retry_after is None else max(retry_after, backoff)
+        if delay > remaining:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures, then probe with a single call.
+
+    Closed: calls pass. After ``failure_threshold`` consecutive failures the
+    breaker opens and rejects calls for ``reset_timeout`` seconds; then one
+    trial call is let through (half-open). Its success closes the breaker,
+    its failure opens it again. A caller that gets an outcome that is
+    neither (an unexpected exception, a cancellation) calls release(), so a
+    later call can probe instead of the breaker staying half-open forever.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before a trial call
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or (self._clock() - self._opened_at >= self.reset_timeout):
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing:
+                return False
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy server."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release(self) -> None:
+        """End a call that produced no outcome; frees the trial slot if held."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a server or connection failure."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._probing = False
+                self.trips += 1
@@ -0,0 +1,188 @@
+"""
+Broadcast coalescing for bursty monitor updates.
+
+The monitoring wrapper can post dozens of transitions per second. Instead of
+emitting one Socket.IO message per mutation, deltas are collected for a short
+window (or until a batch limit is hit) and merged into a single delta that
+spans the whole range of versions.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+def merge_deltas(older: dict[str, Any], newer: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge two consecutive deltas into one.
+
+    Args:
+        older: Delta covering the earlier versions
+        newer: Delta whose base_version follows older's version
+
+    Returns:
+        Delta from older's base_version to newer's version
+    """
+    if newer["version"] < older["version"]:
+        older, newer = newer, older
+
+    merged: dict[str, Any] = {
+        "session": newer.get("session"),
+        "base_version": older["base_version"],
+        "version": newer["version"],
+        "current_node": newer["current_node"],
+    }
+
+    nodes = {**older.get("nodes", {}), **newer.get("nodes", {})}
+    if nodes:
+        merged["nodes"] = nodes
+
+    events = older.get("events", []) + newer.get("events", [])
+    if events:
+        merged["events"] = events
+
+    task_info = {**older.get("task_info", {}), **newer.get("task_info", {})}
+    if task_info:
+        merged["task_info"] = task_info
+
+    return merged
+
+
+def split_delta(delta: dict[str, Any]) -> list[tuple[str, str, dict[str, Any]]]:
+    """
+    Split a delta into smaller messages for clients watching part of the state.
+
+    A client that only shows the event log, the task or one node subscribes
+    to that channel and receives these messages instead of full deltas.
+
+    Args:
+        delta: Delta (or snapshot-shaped dict) with version and any of
+            nodes, events and task_info
+
+    Returns:
+        (channel, event name, payload) per affected channel: "events" ->
+        monitor_events, "task" -> task_update and "node:<id>" -> node_update
+        (the node's new state plus its events)
+    """
+    header = {"session": delta.get("session"), "version": delta["version"]}
+    events = delta.get("events", [])
+    messages: list[tuple[str, str, dict[str, Any]]] = []
+    if events:
+        messages.append(("events", "monitor_events", {**header, "events": events}))
+    if delta.get("task_info"):
+        messages.append(
+            ("task", "task_update", {**header, "task_info": delta["task_info"]})
+        )
+    for node_id, node in delta.get("nodes", {}).items():
+        node_events = [event for event in events if event["node"] == node_id]
+        messages.append(
+            (
+                f"node:{node_id}",
+                "node_update",
+                {**header, "node": node_id, **node, "events": node_events},
+            )
+        )
+    return messages
+
+
+class BroadcastCoalescer:
+    """Collects deltas over a short window and emits them as one merged update."""
+
+    def __init__(
+        self,
+        emit: Callable[[dict[str, Any]], None],
+        window: float = 0.05,
+        max_batch: int = 50,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            emit: Callback that broadcasts a merged delta
+            window: Seconds to collect updates before emitting; 0 disables
+                coalescing and emits every delta immediately
+            max_batch: Number of pending updates that forces an early emit
+        """
+        self.emit = emit
+        self.window = window
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        # Serializes take-and-emit so merged batches leave in version order
+        self._emit_lock = threading.Lock()
+        self._pending: dict[str, Any] | None = None
+        self._pending_count = 0
+        self._timer: threading.Timer | None = None
+        self.updates_in = 0
+        self.emits_out = 0
+        self.forced_flushes = 0
+
+    def submit(self, delta: dict[str, Any], urgent: bool = False) -> None:
+        """
+        Queue a delta for broadcast.
+
+        Args:
+            delta: Delta returned by a MonitorService mutation
+            urgent: Emit immediately together with anything pending,
+                e.g. for task status changes
+        """
+        with self._lock:
+            self.updates_in += 1
+            if self._pending is None:
+                self._pending = delta
+            else:
+                self._pending = merge_deltas(self._pending, delta)
+            self._pending_count += 1
+
+            flush_now = (
+                urgent
+                or self.window <= 0
+                or self._pending_count >= self.max_batch
+                or "status" in delta.get("task_info", {})
+            )
+            if flush_now:
+                if self.window > 0:
+                    self.forced_flushes += 1
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit whatever is pending right away."""
+        with self._emit_lock:
+            with self._lock:
+                batch = self._take_pending()
+            if batch is None:
+                return
+            self.emit(batch)
+            with self._lock:
+                self.emits_out += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dict with updates received, emits sent, forced flushes and the
+            number of updates still waiting for the window to close
+        """
+        with self._lock:
+            return {
+                "updates_in": self.updates_in,
+                "emits_out": self.emits_out,
+                "forced_flushes": self.forced_flushes,
+                "pending": self._pending_count,
+            }
+
+    def _take_pending(self) -> dict[str, Any] | None:
+        """Detach the pending batch and cancel its timer. Caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._pending
+        self._pending = None
+        self._pending_count = 0
+        return batch
@@ -0,0 +1,156 @@
+"""
+Compact encodings for monitor messages.
+
+Dashboards on slow links can opt in to a compact form of every snapshot,
+delta and channel message instead of the default JSON:
+
+- node IDs are interned as small integers (see NODE_CODES)
+- ISO timestamps become epoch milliseconds
+- keys are single letters and events/nodes are arrays, not objects
+
+Compact messages have these fields (all optional except ``v``):
+
+- ``s``: session ID
+- ``v``: state version; ``b``: base version (deltas)
+- ``c``: code of the current node
+- ``n``: nodes as ``[code, active (0/1), last_active_ms, message]``
+- ``e``: events as ``[ts_ms, node_code, message, seq]`` (seq only when stored)
+- ``t``: task info with ``start_time`` in epoch milliseconds
+
+Two compact encodings exist: ``compact`` is the compact form sent as JSON
+(usable by SSE and any Socket.IO client) and ``msgpack`` is the compact form
+packed with MessagePack and sent as binary (requires the optional
+``msgpack`` package).
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# Interned node IDs, in workflow order
+NODE_CODES = {"jira": 0, "claude": 1, "github": 2, "jules": 3, "actions": 4}
+
+# Encodings a client can negotiate; "json" is the default
+ENCODINGS = ("json", "compact", "msgpack")
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings usable in this process (msgpack needs the msgpack package)."""
+    if msgpack is None:
+        return tuple(e for e in ENCODINGS if e != "msgpack")
+    return ENCODINGS
+
+
+def negotiate(requested: Any, allowed: tuple[str, ...] | None = None) -> str:
+    """
+    Pick the encoding for a client.
+
+    Args:
+        requested: Encoding the client asked for (any value)
+        allowed: Encodings the transport supports (default: all available)
+
+    Returns:
+        The requested encoding if supported, otherwise "json"
+    """
+    allowed = available_encodings() if allowed is None else allowed
+    return requested if requested in allowed else "json"
+
+
+def epoch_ms(timestamp: str | None) -> int | None:
+    """Convert an ISO 8601 UTC timestamp (as produced by the monitor) to ms."""
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp.removesuffix("Z"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def _node_code(node_id: str | None) -> int | str | None:
+    return NODE_CODES.get(node_id, node_id) if node_id is not None else None
+
+
+def _compact_node(node_id: str, node: dict[str, Any]) -> list[Any]:
+    return [
+        _node_code(node_id),
+        1 if node.get("active") else 0,
+        epoch_ms(node.get("last_active")),
+        node.get("message", ""),
+    ]
+
+
+def _compact_event(event: dict[str, Any]) -> list[Any]:
+    compact = [
+        epoch_ms(event.get("timestamp")),
+        _node_code(event.get("node")),
+        event.get("message", ""),
+    ]
+    if "seq" in event:
+        compact.append(event["seq"])
+    return compact
+
+
+def compact_message(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a snapshot, delta or channel message to the compact form.
+
+    Args:
+        payload: Message in the default (verbose) shape
+
+    Returns:
+        Compact message (see module docstring)
+    """
+    compact: dict[str, Any] = {"v": payload.get("version")}
+    if payload.get("session") is not None:
+        compact["s"] = payload["session"]
+    if "base_version" in payload:
+        compact["b"] = payload["base_version"]
+    if "current_node" in payload:
+        compact["c"] = _node_code(payload["current_node"])
+
+    if "nodes" in payload:
+        compact["n"] = [
+            _compact_node(node_id, node) for node_id, node in payload["nodes"].items()
+        ]
+    elif "node" in payload:
+        # node_update channel message
+        compact["n"] = [_compact_node(payload["node"], payload)]
+
+    events = payload.get("events", payload.get("event_log"))
+    if events is not None:
+        compact["e"] = [_compact_event(event) for event in events]
+
+    task_info = payload.get("task_info")
+    if task_info is not None:
+        task = dict(task_info)
+        if "start_time" in task:
+            task["start_time"] = epoch_ms(task["start_time"])
+        compact["t"] = task
+    return compact
+
+
+def encode_message(payload: Any, encoding: str) -> Any:
+    """
+    Encode a message for a client using the given encoding.
+
+    Args:
+        payload: Message in the default shape (dicts), or pre-encoded text
+        encoding: "json", "compact" or "msgpack"
+
+    Returns:
+        The payload unchanged for json (non-dict payloads are never
+        compacted), the compact dict, or MessagePack bytes
+    """
+    if encoding == "json" or not isinstance(payload, dict):
+        return payload
+    compact = compact_message(payload)
+    if encoding == "msgpack":
+        return msgpack.packb(compact)
+    return compact
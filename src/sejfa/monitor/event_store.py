@@ -0,0 +1,492 @@
+"""
+Durable append-only event store for monitor history.
+
+MonitorService only keeps the most recent events in memory. The event store
+appends every event to segmented NDJSON files on disk so the history of each
+agent run survives log rollover and restarts.
+
+Layout of the store directory:
+
+- ``<first_seq>.log``: one JSON record per line; a new segment is started
+  when the active one exceeds ``segment_bytes``.
+- ``<first_seq>.idx``: written once when a segment is sealed. Holds the
+  timestamp, byte offset and task number of every record, so reopening the
+  store does not have to parse sealed segments.
+- ``tasks.json``: task titles, indexed by task number. Rewritten only when a
+  new task title appears.
+
+Each event costs exactly one append to the active segment. fsync is batched:
+the file is synced after ``fsync_every`` appends or when ``fsync_interval``
+seconds have passed since the last sync, and on ``sync()``/``close()``.
+Reads go through mmap and the in-memory index, so paging through history
+never rescans the files.
+
+Sequence numbers and the active segment live in the process that opened the
+store, so only one process may write to a directory. The store takes an
+exclusive ``flock`` on ``writer.lock`` in the directory and raises
+EventStoreLockedError if another process (e.g. a second gunicorn worker)
+already holds it. Within a process, open_event_store() hands every caller
+(e.g. several Flask apps) the same store and closes it at exit.
+
+A complete line that cannot be decoded (e.g. after disk corruption) keeps
+its sequence number but is skipped by reads and counted in
+``corrupt_records``, instead of making the whole store fail to open.
+"""
+
+import atexit
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_right
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# One index entry per record: timestamp (ms), byte offset, task number
+_INDEX_ENTRY = struct.Struct("<qQI")
+
+# Task number recorded for lines that could not be decoded
+_CORRUPT_TASK = 0xFFFFFFFF
+
+# Stores open in this process, by real directory path
+_open_stores: "weakref.WeakValueDictionary[str, EventStore]" = (
+    weakref.WeakValueDictionary()
+)
+_open_stores_lock = threading.Lock()
+
+
+class EventStoreLockedError(RuntimeError):
+    """Raised when another store already writes to the store directory."""
+
+
+class _Segment:
+    """One segment file plus its in-memory index."""
+
+    __slots__ = ("path", "first_seq", "timestamps", "offsets", "tasks", "size", "_map")
+
+    def __init__(self, path: str, first_seq: int):
+        self.path = path
+        self.first_seq = first_seq
+        self.timestamps = array("q")
+        self.offsets = array("Q")
+        self.tasks = array("I")
+        self.size = 0
+        self._map: mmap.mmap | None = None
+
+    @property
+    def count(self) -> int:
+        """Number of records in the segment."""
+        return len(self.offsets)
+
+    def record(self, index: int) -> dict[str, Any] | None:
+        """Decode the record at a position within the segment (None if corrupt)."""
+        if self.tasks[index] == _CORRUPT_TASK:
+            return None
+        if self._map is None or len(self._map) < self.size:
+            self.release()
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start = self.offsets[index]
+        end = self.offsets[index + 1] if index + 1 < self.count else self.size
+        return json.loads(self._map[start:end])
+
+    def release(self) -> None:
+        """Unmap the segment file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class EventStore:
+    """Append-only, segmented on-disk log of monitor events."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 4 * 1024 * 1024,
+        fsync_every: int = 64,
+        fsync_interval: float = 1.0,
+    ):
+        """
+        Open (and create if needed) an event store.
+
+        Args:
+            directory: Directory holding segment and index files
+            segment_bytes: Size after which a new segment is started
+            fsync_every: Appends between fsync calls
+            fsync_interval: Maximum seconds between fsync calls while appending
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._lock = threading.RLock()
+        self._segments: list[_Segment] = []
+        self._first_seqs: list[int] = []
+        self._task_names: list[str] = []
+        self._task_numbers: dict[str, int] = {}
+        self._task_seqs: dict[int, array] = {}
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = False
+        self.corrupt_records = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._key = os.path.realpath(directory)
+        self._lock_fd = self._lock_directory()
+        try:
+            self._load()
+        except BaseException:
+            os.close(self._lock_fd)
+            raise
+        self._fd = os.open(
+            self._segments[-1].path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        _open_stores[self._key] = self
+
+    def _lock_directory(self) -> int:
+        """Take the directory's writer lock and return its file descriptor.
+
+        Raises:
+            EventStoreLockedError: If another store holds the lock
+        """
+        if _open_stores.get(self._key) is not None:
+            raise EventStoreLockedError(
+                f"Event store {self.directory} is already open in this "
+                "process; use open_event_store() to share it"
+            )
+        fd = os.open(
+            os.path.join(self.directory, "writer.lock"), os.O_RDWR | os.O_CREAT
+        )
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                raise EventStoreLockedError(
+                    f"Event store {self.directory} is already open in another "
+                    "process; give each process its own MONITOR_EVENT_STORE_DIR "
+                    "or run a single worker"
+                ) from None
+        return fd
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event (0 when empty)."""
+        with self._lock:
+            segment = self._segments[-1]
+            return segment.first_seq + segment.count - 1
+
+    def append(self, event: dict[str, Any], task: str = "") -> int:
+        """
+        Append an event and assign its sequence number.
+
+        Args:
+            event: Event dict (timestamp, node, message)
+            task: Title of the task the event belongs to
+
+        Returns:
+            Sequence number of the stored event
+        """
+        with self._lock:
+            segment = self._segments[-1]
+            if segment.size >= self.segment_bytes:
+                segment = self._roll_segment()
+
+            seq = segment.first_seq + segment.count
+            ts_ms = int(time.time() * 1000)
+            record = {"seq": seq, "ts": ts_ms, "task": task, **event}
+            line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+            os.write(self._fd, line)
+
+            task_number = self._task_number(task)
+            segment.timestamps.append(ts_ms)
+            segment.offsets.append(segment.size)
+            segment.tasks.append(task_number)
+            segment.size += len(line)
+            self._task_seqs.setdefault(task_number, array("Q")).append(seq)
+
+            self._unsynced += 1
+            now = time.monotonic()
+            if (
+                self._unsynced >= self.fsync_every
+                or now - self._last_sync >= self.fsync_interval
+            ):
+                self._sync(now)
+            return seq
+
+    def get(self, seq: int) -> dict[str, Any] | None:
+        """
+        Fetch a single event by sequence number.
+
+        Args:
+            seq: Sequence number
+
+        Returns:
+            The stored record, or None if it does not exist or is corrupt
+        """
+        with self._lock:
+            located = self._locate(seq)
+            if located is None:
+                return None
+            segment, index = located
+            return segment.record(index)
+
+    def read(
+        self,
+        after_seq: int = 0,
+        limit: int = 100,
+        task: str | None = None,
+        since_ms: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Page through stored events in sequence order.
+
+        Args:
+            after_seq: Return events with a sequence number above this
+            limit: Maximum number of events to return
+            task: Only return events for this task title
+            since_ms: Only return events at or after this epoch-ms timestamp
+
+        Returns:
+            Up to ``limit`` stored records
+        """
+        with self._lock:
+            if since_ms is not None:
+                after_seq = max(after_seq, self._seq_before_time(since_ms))
+
+            if task is not None:
+                seqs = self._task_seqs.get(self._task_numbers.get(task, -1))
+                if not seqs:
+                    return []
+                start = bisect_right(seqs, after_seq)
+                wanted = seqs[start : start + limit]
+            else:
+                first = after_seq + 1
+                wanted = range(first, min(first + limit, self.last_seq + 1))
+
+            records = []
+            for seq in wanted:
+                located = self._locate(seq)
+                if located is not None:
+                    segment, index = located
+                    record = segment.record(index)
+                    if record is not None:
+                        records.append(record)
+            return records
+
+    def tasks(self) -> dict[str, int]:
+        """
+        Count stored events per task.
+
+        Returns:
+            Dict mapping task title to number of stored events
+        """
+        with self._lock:
+            return {
+                name: len(self._task_seqs.get(number, ()))
+                for number, name in enumerate(self._task_names)
+            }
+
+    def sync(self) -> None:
+        """Flush pending appends to disk."""
+        with self._lock:
+            self._sync(time.monotonic())
+
+    def close(self) -> None:
+        """Sync and close the store (closing it again does nothing)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if _open_stores.get(self._key) is self:
+                del _open_stores[self._key]
+            self._sync(time.monotonic())
+            os.close(self._fd)
+            for segment in self._segments:
+                segment.release()
+            # Closing the descriptor releases the flock
+            os.close(self._lock_fd)
+
+    def _sync(self, now: float) -> None:
+        """fsync the active segment. Caller holds the lock."""
+        if self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+        self._last_sync = now
+
+    def _locate(self, seq: int) -> tuple[_Segment, int] | None:
+        """Find the segment and position holding a sequence number."""
+        if seq < 1:
+            return None
+        position = bisect_right(self._first_seqs, seq) - 1
+        if position < 0:
+            return None
+        segment = self._segments[position]
+        index = seq - segment.first_seq
+        if index >= segment.count:
+            return None
+        return segment, index
+
+    def _seq_before_time(self, since_ms: int) -> int:
+        """Sequence number of the last event stored before a timestamp."""
+        for segment in reversed(self._segments):
+            if segment.count and segment.timestamps[0] < since_ms:
+                index = bisect_right(segment.timestamps, since_ms - 1)
+                return segment.first_seq + index - 1
+        return 0
+
+    def _task_number(self, task: str) -> int:
+        """Get (or register) the number of a task title."""
+        number = self._task_numbers.get(task)
+        if number is None:
+            number = len(self._task_names)
+            self._task_names.append(task)
+            self._task_numbers[task] = number
+            self._write_tasks()
+        return number
+
+    def _write_tasks(self) -> None:
+        """Persist the task title table."""
+        path = os.path.join(self.directory, "tasks.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._task_names, f)
+        os.replace(tmp_path, path)
+
+    def _roll_segment(self) -> _Segment:
+        """Seal the active segment and start a new one. Caller holds the lock."""
+        sealed = self._segments[-1]
+        self._sync(time.monotonic())
+        os.close(self._fd)
+        self._write_index(sealed)
+
+        first_seq = sealed.first_seq + sealed.count
+        segment = _Segment(self._segment_path(first_seq), first_seq)
+        self._segments.append(segment)
+        self._first_seqs.append(first_seq)
+        self._fd = os.open(segment.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return segment
+
+    def _write_index(self, segment: _Segment) -> None:
+        """Write the index file of a sealed segment."""
+        path = segment.path[: -len(".log")] + ".idx"
+        with open(path, "wb") as f:
+            for entry in zip(
+                segment.timestamps, segment.offsets, segment.tasks, strict=True
+            ):
+                f.write(_INDEX_ENTRY.pack(*entry))
+
+    def _segment_path(self, first_seq: int) -> str:
+        """Path of the segment starting at a sequence number."""
+        return os.path.join(self.directory, f"{first_seq:020d}.log")
+
+    def _load(self) -> None:
+        """Rebuild the in-memory index from the files on disk."""
+        tasks_path = os.path.join(self.directory, "tasks.json")
+        if os.path.exists(tasks_path):
+            with open(tasks_path) as f:
+                self._task_names = json.load(f)
+            self._task_numbers = {
+                name: number for number, name in enumerate(self._task_names)
+            }
+
+        names = sorted(n for n in os.listdir(self.directory) if n.endswith(".log"))
+        for position, name in enumerate(names):
+            segment = _Segment(os.path.join(self.directory, name), int(name[:-4]))
+            index_path = segment.path[: -len(".log")] + ".idx"
+            is_last = position == len(names) - 1
+            if not is_last and os.path.exists(index_path):
+                self._load_index(segment, index_path)
+            else:
+                self._scan_segment(segment)
+            self._segments.append(segment)
+
+        if not self._segments:
+            self._segments.append(_Segment(self._segment_path(1), 1))
+        self._first_seqs = [segment.first_seq for segment in self._segments]
+
+        for segment in self._segments:
+            for index, task_number in enumerate(segment.tasks):
+                if task_number == _CORRUPT_TASK:
+                    self.corrupt_records += 1
+                    continue
+                self._task_seqs.setdefault(task_number, array("Q")).append(
+                    segment.first_seq + index
+                )
+
+    def _load_index(self, segment: _Segment, index_path: str) -> None:
+        """Load a sealed segment's index file."""
+        with open(index_path, "rb") as f:
+            data = f.read()
+        for ts_ms, offset, task_number in _INDEX_ENTRY.iter_unpack(data):
+            segment.timestamps.append(ts_ms)
+            segment.offsets.append(offset)
+            segment.tasks.append(task_number)
+        segment.size = os.path.getsize(segment.path)
+
+    def _scan_segment(self, segment: _Segment) -> None:
+        """Index a segment by reading it, dropping a torn trailing record.
+
+        A complete line that does not decode keeps its position (so later
+        sequence numbers stay aligned) but is marked corrupt.
+        """
+        size = os.path.getsize(segment.path)
+        if size:
+            with open(segment.path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    offset = 0
+                    while offset < size:
+                        end = data.find(b"\n", offset)
+                        if end == -1:
+                            break
+                        try:
+                            record = json.loads(data[offset:end])
+                            ts_ms = int(record["ts"])
+                            task_number = self._task_number(str(record["task"]))
+                        except (ValueError, KeyError, TypeError):
+                            # Keep timestamps sorted for bisecting by time
+                            ts_ms = segment.timestamps[-1] if segment.count else 0
+                            task_number = _CORRUPT_TASK
+                        segment.timestamps.append(ts_ms)
+                        segment.offsets.append(offset)
+                        segment.tasks.append(task_number)
+                        offset = end + 1
+            if offset < size:
+                # Crash mid-append: truncate the incomplete record
+                os.truncate(segment.path, offset)
+            size = offset
+        segment.size = size
+
+
+def open_event_store(directory: str, **options: Any) -> EventStore:
+    """
+    Get this process's store for a directory, opening it on first use.
+
+    A store opened here stays open for the other callers in the process
+    and is closed when the interpreter exits.
+
+    Args:
+        directory: Directory holding segment and index files
+        **options: EventStore options, used only when the store is opened
+
+    Returns:
+        The open store
+
+    Raises:
+        EventStoreLockedError: If another process writes to the directory
+    """
+    with _open_stores_lock:
+        store = _open_stores.get(os.path.realpath(directory))
+        if store is None:
+            store = EventStore(directory, **options)
+            atexit.register(store.close)
+        return store
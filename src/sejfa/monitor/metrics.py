@@ -0,0 +1,228 @@
+"""
+Workflow timing metrics for the monitored agent loop.
+
+Dwell time (how long the loop stays in a node) and cycle time (time between
+two starts of the loop at its first node) are folded into fixed-bucket
+streaming histograms on every node transition. Memory stays constant no
+matter how many transitions are observed, and reading the metrics never
+rescans the event log.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Histogram bucket upper bounds in seconds (roughly log-spaced up to 1 hour)
+DEFAULT_BUCKETS = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+)
+
+# Workflow order; the loop starts a new cycle each time it enters the first node
+WORKFLOW_ORDER = ("jira", "claude", "github", "jules", "actions")
+
+
+class StreamingHistogram:
+    """Fixed-bucket histogram with count, sum, min, max and quantile estimates."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds; an implicit +Inf bucket follows
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate a quantile by linear interpolation inside its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if nothing has been observed
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower = max(lower, self.min)
+                upper = min(upper, self.max)
+                fraction = (rank - seen) / bucket_count
+                return lower + (upper - lower) * fraction
+            seen += bucket_count
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the histogram for JSON output."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": round(self.min, 6),
+            "max": round(self.max, 6),
+            "mean": round(self.sum / self.count, 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p90": round(self.quantile(0.9), 6),
+            "p99": round(self.quantile(0.99), 6),
+        }
+
+
+class WorkflowMetrics:
+    """Incrementally computed dwell-time and cycle-time statistics."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self._lock = threading.Lock()
+        self.dwell = {node: StreamingHistogram(buckets) for node in WORKFLOW_ORDER}
+        self.cycle = StreamingHistogram(buckets)
+        self.transitions = dict.fromkeys(WORKFLOW_ORDER, 0)
+        self._current: str | None = None
+        self._entered_at = 0.0
+        self._cycle_started_at: float | None = None
+
+    def observe(self, node: str, active: bool, at: float | None = None) -> None:
+        """
+        Fold a node update into the statistics.
+
+        Re-activating the node that is already active continues its dwell;
+        entering another node (or deactivating the current one) closes it.
+
+        Args:
+            node: Node ID from the update
+            active: Whether the update marks the node active
+            at: Monotonic timestamp in seconds (defaults to now)
+        """
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            if active and node == self._current:
+                return
+            if not active and node != self._current:
+                return
+
+            if self._current is not None:
+                self.dwell[self._current].observe(at - self._entered_at)
+
+            if not active:
+                self._current = None
+                return
+
+            self._current = node
+            self._entered_at = at
+            self.transitions[node] += 1
+            if node == WORKFLOW_ORDER[0]:
+                if self._cycle_started_at is not None:
+                    self.cycle.observe(at - self._cycle_started_at)
+                self._cycle_started_at = at
+
+    def reset(self) -> None:
+        """Forget the open dwell and cycle (statistics are kept)."""
+        with self._lock:
+            self._current = None
+            self._cycle_started_at = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the metrics as a JSON-serializable dict.
+
+        Returns:
+            Dict with per-node dwell summaries, cycle summary and transitions
+        """
+        with self._lock:
+            return {
+                "dwell_seconds": {
+                    node: histogram.summary() for node, histogram in self.dwell.items()
+                },
+                "cycle_seconds": self.cycle.summary(),
+                "transitions": dict(self.transitions),
+                "current_node": self._current,
+            }
+
+    def to_prometheus(self, prefix: str = "sejfa_monitor") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text (format version 0.0.4)
+        """
+        with self._lock:
+            lines = [
+                f"# HELP {prefix}_node_dwell_seconds Time spent in a workflow node.",
+                f"# TYPE {prefix}_node_dwell_seconds histogram",
+            ]
+            for node, histogram in self.dwell.items():
+                lines += _histogram_lines(
+                    f"{prefix}_node_dwell_seconds", histogram, f'node="{node}"'
+                )
+            lines += [
+                f"# HELP {prefix}_cycle_seconds Time between loop starts at "
+                f"{WORKFLOW_ORDER[0]}.",
+                f"# TYPE {prefix}_cycle_seconds histogram",
+            ]
+            lines += _histogram_lines(f"{prefix}_cycle_seconds", self.cycle, "")
+            lines += [
+                f"# HELP {prefix}_node_transitions_total Times a node became active.",
+                f"# TYPE {prefix}_node_transitions_total counter",
+            ]
+            for node, count in self.transitions.items():
+                lines.append(
+                    f'{prefix}_node_transitions_total{{node="{node}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name: str, histogram: StreamingHistogram, labels: str) -> list:
+    """Render one histogram as cumulative Prometheus bucket/sum/count lines."""
+    separator = "," if labels else ""
+    lines = []
+    cumulative = 0
+    bounds = [*(repr(bound) for bound in histogram.buckets), "+Inf"]
+    for bound, bucket_count in zip(bounds, histogram.counts, strict=True):
+        cumulative += bucket_count
+        lines.append(f'{name}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {histogram.sum!r}")
+    lines.append(f"{name}_count{suffix} {histogram.count}")
+    return lines
@@ -0,0 +1,349 @@
+"""
+Native Python monitor client for the Claude Code agent loop.
+
+Replaces the per-line bash regex cascade and backgrounded ``curl`` calls of
+``scripts/claude-monitor-wrapper.sh``. Output lines are matched against one
+precompiled pattern, detected transitions go into a bounded queue, and a
+single sender thread posts them in order as NDJSON batches to
+``/api/monitor/batch`` over one persistent keep-alive connection. When the
+queue is full the oldest transitions are dropped, so a fast-scrolling agent
+never blocks on the monitor.
+
+Usage:
+    python -m src.sejfa.monitor.monitor_client [--url URL] -- command [args...]
+    some-command | python -m src.sejfa.monitor.monitor_client [--url URL]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import re
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import IO, Any
+from urllib.parse import quote, urlsplit
+
+DEFAULT_API_URL = "http://localhost:5000/api/monitor/state"
+
+# Node keywords in priority order (first node wins when several match),
+# mirroring the original wrapper's if/elif cascade
+NODE_KEYWORDS: list[tuple[str, list[str]]] = [
+    ("github", ["git commit", "git push", "Committing", "github", "pushing"]),
+    ("actions", ["Running tests", "pytest", "npm test", "Build", "test", "Testing"]),
+    ("claude", ["Writing", "Creating", "Editing", "Edit", "Write", "edit", "create"]),
+    ("jules", ["Reviewing", "Code review", "review", "Review"]),
+    ("jira", ["Reading", "Analyzing", "Fetching", "Analyze", "Fetch"]),
+]
+
+
+class NodeMatcher:
+    """Detects workflow node transitions in agent output lines."""
+
+    def __init__(self, keywords: list[tuple[str, list[str]]] = NODE_KEYWORDS):
+        """
+        Compile all node keywords into one pattern.
+
+        Args:
+            keywords: (node, keywords) pairs in priority order
+        """
+        self._priority = {node: index for index, (node, _) in enumerate(keywords)}
+        alternatives = [
+            f"(?P<{node}>{'|'.join(re.escape(word) for word in words)})"
+            for node, words in keywords
+        ]
+        self._pattern = re.compile("|".join(alternatives))
+
+    def detect(self, line: str) -> str | None:
+        """
+        Find the highest-priority node mentioned in a line.
+
+        Args:
+            line: One line of agent output
+
+        Returns:
+            Node ID, or None if no keyword matches
+        """
+        best: str | None = None
+        for match in self._pattern.finditer(line):
+            node = match.lastgroup
+            if best is None or self._priority[node] < self._priority[best]:
+                best = node
+                if self._priority[best] == 0:
+                    break
+        return best
+
+
+def batch_url(api_url: str) -> str:
+    """Derive the batch endpoint from a monitor API or /state URL."""
+    url = api_url.rstrip("/")
+    if url.endswith("/state"):
+        url = url[: -len("/state")]
+    if not url.endswith("/batch"):
+        url = f"{url}/batch"
+    return url
+
+
+class MonitorClient:
+    """Sends node transitions to the monitor API from a bounded queue."""
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        max_queue: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        timeout: float = 5.0,
+        autostart: bool = True,
+        session: str | None = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_url: Monitor API base, /state or /batch URL
+            max_queue: Queued transitions kept before the oldest are dropped
+            batch_size: Maximum transitions per request
+            flush_interval: Seconds to gather transitions before sending
+            timeout: Socket timeout for the monitor connection
+            autostart: Start the sender thread immediately
+            session: Monitor session ID to report under (None = default)
+        """
+        parts = urlsplit(batch_url(api_url))
+        self._scheme = parts.scheme
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._path = parts.path
+        if session:
+            self._path += f"?session={quote(session, safe='')}"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._queue: deque[dict[str, Any]] = deque(maxlen=max_queue)
+        self._ready = threading.Condition()
+        self._closing = False
+        self._conn: http.client.HTTPConnection | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.requests = 0
+        self.connections = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        """Start the sender thread."""
+        self._thread.start()
+
+    def send(self, node: str, message: str = "", state: str = "active") -> None:
+        """
+        Queue a node transition without blocking.
+
+        Args:
+            node: Node ID
+            message: Status message (truncated to 200 chars)
+            state: Node state (active, inactive)
+        """
+        update = {"node": node, "state": state, "message": message[:200]}
+        with self._ready:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(update)
+            self._ready.notify()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Send what is still queued and stop the sender thread.
+
+        The connection belongs to the sender thread: if it is still sending
+        when the timeout expires, it closes the connection itself on exit.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        with self._ready:
+            self._closing = True
+            self._ready.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._close_connection()
+
+    def stats(self) -> dict[str, int]:
+        """Get counters for sent, dropped and failed transitions."""
+        with self._ready:
+            return {
+                "sent": self.sent,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "requests": self.requests,
+                "connections": self.connections,
+                "queued": len(self._queue),
+            }
+
+    def _run(self) -> None:
+        """Sender loop: gather a batch, post it, repeat until closed."""
+        try:
+            self._send_until_closed()
+        finally:
+            self._close_connection()
+
+    def _send_until_closed(self) -> None:
+        while True:
+            with self._ready:
+                while not self._queue and not self._closing:
+                    self._ready.wait()
+                if not self._queue and self._closing:
+                    return
+            # Give a burst a moment to accumulate into one request
+            if not self._closing and len(self._queue) < self.batch_size:
+                time.sleep(self.flush_interval)
+            with self._ready:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+            if batch:
+                self._post(batch)
+
+    def _post(self, batch: list[dict[str, Any]]) -> None:
+        """
+        POST a batch as NDJSON, retrying once if it was not sent.
+
+        A failure while connecting or sending (for example a keep-alive
+        connection the server already closed) is retried on a new
+        connection. A failure after the request was sent is not: the server
+        may have applied the batch, and resending it would apply it twice.
+        """
+        body = "\n".join(json.dumps(update) for update in batch).encode()
+        headers = {"Content-Type": "application/x-ndjson", "Connection": "keep-alive"}
+        for attempt in range(2):
+            sent = False
+            try:
+                conn = self._connection()
+                conn.request("POST", self._path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                response.read()
+                with self._ready:
+                    self.requests += 1
+                    if response.status < 400:
+                        self.sent += len(batch)
+                    else:
+                        self.failed += len(batch)
+                return
+            except (OSError, http.client.HTTPException):
+                self._close_connection()
+                if sent or attempt == 1:
+                    with self._ready:
+                        self.failed += len(batch)
+                    return
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Get the persistent connection, reopening it if the server closed it."""
+        sock = self._conn.sock if self._conn is not None else None
+        # An idle keep-alive socket is only readable once the server closed it;
+        # catching that here keeps a batch from going out on a dead connection
+        if sock is not None and select.select([sock], [], [], 0)[0]:
+            self._close_connection()
+        if self._conn is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._conn = connection_class(self._host, self._port, timeout=self.timeout)
+            self.connections += 1
+        return self._conn
+
+
+def monitor_lines(
+    lines: Iterable[str],
+    client: MonitorClient,
+    matcher: NodeMatcher,
+    output: IO[str] | None = None,
+) -> None:
+    """
+    Echo output lines and report detected node transitions.
+
+    Args:
+        lines: Agent output lines
+        client: Client receiving transitions
+        matcher: Node matcher
+        output: Stream to echo lines to (None to skip echoing)
+    """
+    for line in lines:
+        if output is not None:
+            output.write(line)
+            output.flush()
+        text = line.rstrip("\n")
+        if not text:
+            continue
+        node = matcher.detect(text)
+        if node:
+            client.send(node, text)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a command (or read stdin) and stream its transitions to the monitor."""
+    parser = argparse.ArgumentParser(
+        description="Report Claude Code workflow transitions to the monitor API."
+    )
+    parser.add_argument(
+        "--url",
+        default=os.environ.get("MONITOR_API_URL", DEFAULT_API_URL),
+        help="Monitor API URL (base, /state or /batch)",
+    )
+    parser.add_argument(
+        "--session",
+        default=os.environ.get("MONITOR_SESSION_ID"),
+        help="Monitor session ID, so parallel agent loops stay apart",
+    )
+    parser.add_argument("--max-queue", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("command", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    command = args.command
+    if command and command[0] == "--":
+        command = command[1:]
+
+    client = MonitorClient(
+        args.url,
+        max_queue=args.max_queue,
+        batch_size=args.batch_size,
+        session=args.session,
+    )
+    matcher = NodeMatcher()
+    exit_code = 0
+    try:
+        if command:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+            monitor_lines(process.stdout, client, matcher, sys.stdout)
+            exit_code = process.wait()
+        else:
+            monitor_lines(sys.stdin, client, matcher, sys.stdout)
+    finally:
+        client.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,32 +3,298 @@ Monitoring API routes for real-time Claude Code workflow monitoring.
 
 Provides REST endpoints and WebSocket support for streaming workflow state updates
 to connected dashboard clients.
+
+Mutations are broadcast as small versioned ``state_delta`` messages. Clients
+receive a full ``state_update`` snapshot on connect, on ``request_state`` and
+periodically from a resync loop, so a client that misses a delta recovers on
+its own. Snapshots are sent as pre-encoded JSON text cached per version.
+Deltas pass through a BroadcastCoalescer so bursts of updates go out as one
+merged message.
+
+Read-only clients can instead follow ``GET /api/monitor/stream``, a
+Server-Sent Events stream of the same deltas that resumes from the
+``Last-Event-ID`` (state version) after a reconnect.
+
+Several agent loops can report at once: every request may name a session
+(``session`` query parameter, ``X-Monitor-Session`` header or ``session``
+field in the JSON body). Each session has its own MonitorService and
+broadcaster, held in a SessionRegistry that evicts idle sessions. Requests
+without a session use the default session. With a shared state backend each
+session's state is stored under its ID, and a worker that has not seen a
+session yet creates it from the backend on first use. An evicted session's
+stored state is deleted unless another worker has updated it since.
+
+Socket.IO emits go to rooms, never namespace-wide. Each session has a room
+per channel (full state, events, task, one per node), plus the same rooms
+for ``*`` (all sessions). Clients follow the default session's full state
+until they ``subscribe`` to other sessions, channels or nodes; a delta is
+split into per-channel messages and each is only encoded and sent when its
+rooms have listeners.
+
+Clients may negotiate a compact encoding (interned node IDs, epoch-ms
+timestamps, short keys; see compact.py): Socket.IO clients pass
+``{"encoding": "compact"|"msgpack"}`` in the connect auth or ``subscribe``,
+SSE clients add ``?encoding=compact``. Every room exists once per encoding,
+so each message is encoded once per encoding in use.
 """
 
+import json
+import time
 from datetime import datetime
-
-from flask import Blueprint, jsonify, request
-from flask_socketio import emit
+from functools import reduce
+
+from flask import Blueprint, Response, g, jsonify, request
+from flask_socketio import emit, join_room, leave_room, rooms
+from socketio import PubSubManager
+
+from src.sejfa.monitor.broadcast import BroadcastCoalescer, merge_deltas, split_delta
+from src.sejfa.monitor.compact import available_encodings, encode_message, negotiate
+from src.sejfa.monitor.monitor_service import MonitorService
+from src.sejfa.monitor.sessions import (
+    ALL_SESSIONS,
+    CHANNELS,
+    DEFAULT_SESSION,
+    REPLAY_ROOM,
+    MonitorSession,
+    SessionRegistry,
+    is_valid_session_id,
+    parse_session_room,
+    session_room,
+)
 
 # This will be injected from the main app
 monitor_service = None
 socketio = None
+broadcaster = None
+sessions = None
+
+# Negotiated message encoding per connected Socket.IO client (sid)
+_client_encodings: dict[str, str] = {}
+
+# Seconds between full-snapshot resync broadcasts
+DEFAULT_RESYNC_INTERVAL = 30.0
+
+# Server-Sent Events: idle keep-alive comment interval, and how often to
+# look for changes made by other processes when a shared backend is used
+SSE_HEARTBEAT_INTERVAL = 15.0
+SSE_BACKEND_POLL_INTERVAL = 1.0
+
+# History paging and replay limits
+MAX_HISTORY_PAGE = 1000
+MAX_REPLAY_GAP = 5.0
+_resync_started = False
+
+
+def _has_listeners(targets: list[str]) -> bool:
+    """Check whether any client is in one of the rooms."""
+    manager = socketio.server.manager
+    if isinstance(manager, PubSubManager):
+        # Listeners may be connected to another worker
+        return True
+    namespace_rooms = manager.rooms.get("/monitor", {})
+    return any(namespace_rooms.get(room) for room in targets)
+
+
+def emit_to_channel(
+    session_id: str, channel: str, event: str, payload, encode: bool = True
+) -> None:
+    """
+    Emit a message to one channel of a session and of ALL_SESSIONS.
+
+    The message is encoded once for each encoding that has listeners.
+
+    Args:
+        session_id: Session the message belongs to
+        channel: "state", "events", "task" or "node:<node id>"
+        event: Socket.IO event name
+        payload: Message payload in the default shape
+        encode: Encode the payload per encoding; False sends control
+            messages unchanged to every encoding's rooms
+    """
+    for encoding in available_encodings():
+        targets = [
+            session_room(session_id, channel, encoding),
+            session_room(ALL_SESSIONS, channel, encoding),
+        ]
+        if _has_listeners(targets):
+            socketio.emit(
+                event,
+                encode_message(payload, encoding) if encode else payload,
+                namespace="/monitor",
+                to=targets,
+            )
+
+
+def emit_snapshot(session: MonitorSession) -> None:
+    """Send a session's full snapshot to its full-state subscribers."""
+    for encoding in available_encodings():
+        targets = [
+            session_room(session.session_id, "state", encoding),
+            session_room(ALL_SESSIONS, "state", encoding),
+        ]
+        if _has_listeners(targets):
+            socketio.emit(
+                "state_update",
+                session.service.get_encoded_state(encoding),
+                namespace="/monitor",
+                to=targets,
+            )
+
+
+def broadcast_delta(session_id: str, delta: dict) -> None:
+    """Send a delta to full-state subscribers and its parts to the channels."""
+    emit_to_channel(session_id, "state", "state_delta", delta)
+    for channel, event, payload in split_delta(delta):
+        emit_to_channel(session_id, channel, event, payload)
+
+
+def find_session(session_id: str) -> MonitorSession | None:
+    """
+    Look up a session without creating a new one.
+
+    A session that another worker created (or that this worker evicted while
+    another worker kept it alive) is created here from the shared state
+    backend if the backend has it.
+
+    Args:
+        session_id: Session ID
+
+    Returns:
+        The session, or None if no worker has reported under this ID
+    """
+    session = sessions.get(session_id, create=False)
+    backend = monitor_service.backend
+    if session is None and backend is not None:
+        probe = backend.for_session(session_id)
+        try:
+            stored = probe.exists()
+        finally:
+            probe.close()
+        if stored:
+            session = sessions.get(session_id, create=True)
+    return session
+
 
+def publish_node_update(
+    node: str, state: str, message: str = "", session_id: str = DEFAULT_SESSION
+) -> dict | None:
+    """
+    Update a node from outside a request (e.g. a webhook worker) and broadcast it.
+
+    Args:
+        node: Node ID (one of MonitorService.VALID_NODES)
+        state: "active" or "inactive"
+        message: Status message shown on the node
+        session_id: Session to update
 
-def create_monitor_blueprint(service, socket_io):
+    Returns:
+        The delta, or None if the monitor blueprint is not registered
+    """
+    if sessions is None:
+        return None
+    session = sessions.get(session_id, create=True)
+    delta = session.service.update_node(node, state, message)
+    session.broadcaster.submit(delta)
+    return delta
+
+
+def create_monitor_blueprint(
+    service,
+    socket_io,
+    coalesce_window: float = 0.05,
+    coalesce_max_batch: int = 50,
+    max_sessions: int = 1000,
+    session_idle_ttl: float = 3600.0,
+):
     """
     Create the monitoring blueprint with injected dependencies.
 
     Args:
-        service: MonitorService instance
+        service: MonitorService instance for the default session
         socket_io: Flask-SocketIO instance
+        coalesce_window: Seconds to merge deltas before broadcasting (0 = off)
+        coalesce_max_batch: Pending deltas that force an early broadcast
+        max_sessions: Sessions kept before the least recently used is evicted
+        session_idle_ttl: Seconds without updates before a session is evicted
     """
-    global monitor_service, socketio
+    global monitor_service, socketio, broadcaster, sessions
     monitor_service = service
     socketio = socket_io
 
+    def make_broadcaster(session_id: str) -> BroadcastCoalescer:
+        return BroadcastCoalescer(
+            lambda delta: broadcast_delta(session_id, delta),
+            window=coalesce_window,
+            max_batch=coalesce_max_batch,
+        )
+
+    def create_session(session_id: str) -> MonitorSession:
+        # Extra sessions share the event store and keep their state in their
+        # own slot of the shared backend, so every worker sees the same state
+        backend = service.backend
+        session_service = MonitorService(
+            max_events=service.max_events,
+            backend=backend.for_session(session_id) if backend else None,
+            event_store=service.event_store,
+            session_id=session_id,
+            refresh_interval=service.refresh_interval,
+        )
+        return MonitorSession(session_id, session_service, make_broadcaster(session_id))
+
+    def evict_session(session_id: str, session: MonitorSession) -> None:
+        session.broadcaster.flush()
+        session_backend = session.service.backend
+        if session_backend is not None:
+            # Kept if another worker stored a newer version since
+            session_backend.delete(session.service.version)
+            session_backend.close()
+        emit_to_channel(
+            session_id,
+            "state",
+            "session_evicted",
+            {"session": session_id},
+            encode=False,
+        )
+
+    broadcaster = make_broadcaster(DEFAULT_SESSION)
+    sessions = SessionRegistry(
+        create_session,
+        max_sessions=max_sessions,
+        idle_ttl=session_idle_ttl,
+        on_evict=evict_session,
+    )
+    sessions.register(
+        DEFAULT_SESSION,
+        MonitorSession(DEFAULT_SESSION, service, broadcaster),
+        pinned=True,
+    )
+
     blueprint = Blueprint("monitor", __name__, url_prefix="/api/monitor")
 
+    @blueprint.before_request
+    def resolve_session():
+        """Look up the session named by the request (created on POST)."""
+        body = request.get_json(silent=True) if request.is_json else None
+        session_id = (
+            request.args.get("session")
+            or request.headers.get("X-Monitor-Session")
+            or (body.get("session") if isinstance(body, dict) else None)
+            or DEFAULT_SESSION
+        )
+        if not isinstance(session_id, str) or not is_valid_session_id(session_id):
+            err = {"success": False, "error": f"Invalid session: {session_id}"}
+            return jsonify(err), 400
+
+        if request.method == "POST":
+            session = sessions.get(session_id, create=True)
+        else:
+            session = find_session(session_id)
+        if session is None:
+            err = {"success": False, "error": f"Unknown session: {session_id}"}
+            return jsonify(err), 404
+        g.monitor_session = session
+        return None
+
     @blueprint.route("/state", methods=["POST"])
     def update_state():
         """
@@ -42,7 +308,7 @@ def create_monitor_blueprint(service, socket_io):
             }
 
         Returns:
-            JSON response with success status and current state
+            JSON response with success status, resulting version and delta
         """
         try:
             data = request.get_json()
@@ -56,34 +322,30 @@ def create_monitor_blueprint(service, socket_io):
             message = data.get("message", "")
 
             # Validate node
-            if node not in monitor_service.VALID_NODES:
+            if node not in MonitorService.VALID_NODES:
                 return (
                     jsonify(
                         {
                             "success": False,
                             "error": f"Invalid node: {node}. "
-                            f"Must be one of {monitor_service.VALID_NODES}",
+                            f"Must be one of {MonitorService.VALID_NODES}",
                         }
                     ),
                     400,
                 )
 
             # Update service
-            monitor_service.update_node(node, state, message)
+            session = g.monitor_session
+            delta = session.service.update_node(node, state, message)
 
-            # Get updated state
-            current_state = monitor_service.get_state()
+            # Broadcast only the change to the session's WebSocket clients
+            session.broadcaster.submit(delta)
 
-            # Broadcast to all connected WebSocket clients
-            socketio.emit(
-                "state_update",
-                current_state,
-                namespace="/monitor",
-                skip_sid=None,
+            return (
+                jsonify({"success": True, "version": delta["version"], "delta": delta}),
+                200,
             )
 
-            return jsonify({"success": True, "current_state": current_state}), 200
-
         except Exception as e:
             return (
                 jsonify({"success": False, "error": f"Server error: {str(e)}"}),
@@ -99,14 +361,331 @@ def create_monitor_blueprint(service, socket_io):
             JSON response with current workflow state
         """
         try:
-            state = monitor_service.get_state()
-            return jsonify(state), 200
+            serialized = g.monitor_session.service.get_serialized_state()
+            return Response(serialized.data, mimetype="application/json"), 200
+        except Exception as e:
+            return (
+                jsonify({"success": False, "error": f"Server error: {str(e)}"}),
+                500,
+            )
+
+    @blueprint.route("/batch", methods=["POST"])
+    def ingest_batch():
+        """
+        Apply a batch of node and task updates and broadcast them once.
+
+        Accepts either a JSON array (or {"updates": [...]}) or an NDJSON
+        body (Content-Type application/x-ndjson) with one update per line.
+        Node updates use the /state body, task updates the /task body.
+
+        Returns:
+            JSON response with the number of applied updates and the
+            resulting version
+        """
+        try:
+            if request.mimetype == "application/x-ndjson":
+                lines = request.get_data(as_text=True).splitlines()
+                updates = [json.loads(line) for line in lines if line.strip()]
+            else:
+                updates = request.get_json(silent=True)
+                if isinstance(updates, dict):
+                    updates = updates.get("updates")
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Invalid NDJSON: {e}"}), 400
+
+        if not isinstance(updates, list) or not updates:
+            err = {"success": False, "error": "No updates provided"}
+            return jsonify(err), 400
+
+        for update in updates:
+            if not isinstance(update, dict):
+                continue
+            if "node" in update:
+                update["node"] = str(update["node"]).lower()
+                update["state"] = str(update.get("state", "active")).lower()
+            elif update.get("status") == "running" and not update.get("start_time"):
+                update["start_time"] = datetime.utcnow().isoformat() + "Z"
+
+        try:
+            delta = g.monitor_session.service.apply_batch(updates)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
         except Exception as e:
             return (
                 jsonify({"success": False, "error": f"Server error: {str(e)}"}),
                 500,
             )
 
+        g.monitor_session.broadcaster.submit(delta)
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "applied": len(updates),
+                    "version": delta["version"],
+                }
+            ),
+            200,
+        )
+
+    @blueprint.route("/history", methods=["GET"])
+    def get_history():
+        """
+        Page through the durable event history.
+
+        Query parameters:
+            task: Only events for this task title (optional)
+            after: Return events with a sequence number above this (default 0)
+            since: Only events at or after this epoch-ms timestamp (optional)
+            limit: Page size (default 100, max 1000)
+
+        Returns:
+            JSON response with events and the cursor for the next page
+        """
+        store = monitor_service.event_store
+        if store is None:
+            return jsonify({"success": False, "error": "Event store disabled"}), 404
+
+        try:
+            after = int(request.args.get("after", 0))
+            limit = min(int(request.args.get("limit", 100)), MAX_HISTORY_PAGE)
+            since = request.args.get("since")
+            since_ms = int(since) if since else None
+        except ValueError:
+            err = {"success": False, "error": "after, limit and since must be integers"}
+            return jsonify(err), 400
+        if after < 0 or limit < 1:
+            err = {"success": False, "error": "after must be >= 0 and limit >= 1"}
+            return jsonify(err), 400
+
+        events = store.read(
+            after_seq=after,
+            limit=limit,
+            task=request.args.get("task"),
+            since_ms=since_ms,
+        )
+        next_after = events[-1]["seq"] if len(events) == limit else None
+        return jsonify({"events": events, "next_after": next_after}), 200
+
+    @blueprint.route("/history/tasks", methods=["GET"])
+    def get_history_tasks():
+        """
+        List tasks with stored history.
+
+        Returns:
+            JSON response mapping task title to number of stored events
+        """
+        store = monitor_service.event_store
+        if store is None:
+            return jsonify({"success": False, "error": "Event store disabled"}), 404
+        return jsonify({"tasks": store.tasks()}), 200
+
+    @blueprint.route("/replay", methods=["POST"])
+    def replay_history():
+        """
+        Replay a stored run to connected dashboards at accelerated speed.
+
+        Request JSON:
+            {
+                "task": "task title",
+                "speed": 10,
+                "after": 0,
+                "limit": 1000
+            }
+
+        Emits replay_started, one replay_event per stored event (spaced by
+        the original gaps divided by speed, capped at 5 s) and
+        replay_finished to clients subscribed to replays.
+
+        Returns:
+            JSON response with the number of events being replayed
+        """
+        store = monitor_service.event_store
+        if store is None:
+            return jsonify({"success": False, "error": "Event store disabled"}), 404
+
+        data = request.get_json(silent=True) or {}
+        task = data.get("task")
+        try:
+            speed = float(data.get("speed", 10))
+            after = int(data.get("after", 0))
+            limit = min(int(data.get("limit", MAX_HISTORY_PAGE)), MAX_HISTORY_PAGE)
+        except (TypeError, ValueError):
+            err = {"success": False, "error": "speed, after and limit must be numbers"}
+            return jsonify(err), 400
+        if speed <= 0:
+            err = {"success": False, "error": "speed must be positive"}
+            return jsonify(err), 400
+        if after < 0 or limit < 1:
+            err = {"success": False, "error": "after must be >= 0 and limit >= 1"}
+            return jsonify(err), 400
+
+        events = store.read(after_seq=after, limit=limit, task=task)
+        if not events:
+            return jsonify({"success": False, "error": "No events to replay"}), 404
+
+        def run_replay():
+            socketio.emit(
+                "replay_started",
+                {"task": task, "count": len(events), "speed": speed},
+                namespace="/monitor",
+                to=REPLAY_ROOM,
+            )
+            previous_ts = events[0]["ts"]
+            for event in events:
+                gap = (event["ts"] - previous_ts) / 1000 / speed
+                if gap > 0:
+                    socketio.sleep(min(gap, MAX_REPLAY_GAP))
+                socketio.emit(
+                    "replay_event", event, namespace="/monitor", to=REPLAY_ROOM
+                )
+                previous_ts = event["ts"]
+            socketio.emit(
+                "replay_finished", {"task": task}, namespace="/monitor", to=REPLAY_ROOM
+            )
+
+        socketio.start_background_task(run_replay)
+
+        return jsonify({"success": True, "events": len(events)}), 202
+
+    @blueprint.route("/metrics", methods=["GET"])
+    def get_metrics():
+        """
+        Get workflow timing metrics (dwell time per node, cycle time).
+
+        Returns the Prometheus text format by default, so scrapers sending
+        ``*/*`` or no Accept header get it. JSON with ``?format=json`` or an
+        Accept header that prefers ``application/json`` over ``text/plain``.
+
+        Returns:
+            Prometheus text or JSON response
+        """
+        metrics = g.monitor_session.service.metrics
+        output = request.args.get("format")
+        if output is None:
+            best = request.accept_mimetypes.best_match(
+                ["text/plain", "application/json"], default="text/plain"
+            )
+            output = "json" if best == "application/json" else "prometheus"
+        if output == "json":
+            return jsonify(metrics.to_dict()), 200
+        return Response(
+            metrics.to_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    @blueprint.route("/broadcast-stats", methods=["GET"])
+    def get_broadcast_stats():
+        """
+        Get broadcast coalescing metrics.
+
+        Returns:
+            JSON response with updates in versus emits out
+        """
+        return jsonify(g.monitor_session.broadcaster.stats()), 200
+
+    @blueprint.route("/sessions", methods=["GET"])
+    def list_sessions():
+        """
+        List live monitoring sessions.
+
+        Returns:
+            JSON response with one summary per session and registry counters
+        """
+        idle = sessions.idle_seconds()
+        summaries = []
+        for session_id, session in sessions.items():
+            task_info = session.service.get_task_info()
+            summaries.append(
+                {
+                    "session": session_id,
+                    "version": session.service.version,
+                    "current_node": session.service.current_node,
+                    "task_title": task_info["title"],
+                    "task_status": task_info["status"],
+                    "idle_seconds": round(idle.get(session_id, 0.0), 3),
+                }
+            )
+        return jsonify({"sessions": summaries, "stats": sessions.stats()}), 200
+
+    @blueprint.route("/stream", methods=["GET"])
+    def stream_state():
+        """
+        Stream state changes as Server-Sent Events.
+
+        The stream starts with a ``snapshot`` event unless the client resumes
+        with a ``Last-Event-ID`` header (or ``last_event_id`` query parameter)
+        whose version is still covered by the delta history; then only the
+        missed changes are sent. Each ``delta`` event's id is the state
+        version it leads to. Pending deltas are merged into one event.
+
+        With ``?encoding=compact`` snapshots and deltas are sent in the
+        compact form (see compact.py).
+
+        Returns:
+            text/event-stream response
+        """
+        encoding = negotiate(request.args.get("encoding"), ("json", "compact"))
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_event_id"
+        )
+        try:
+            resume_version = int(last_event_id) if last_event_id else None
+        except ValueError:
+            resume_version = None
+
+        service = g.monitor_session.service
+        poll_interval = (
+            SSE_HEARTBEAT_INTERVAL
+            if service.backend is None
+            else min(SSE_BACKEND_POLL_INTERVAL, SSE_HEARTBEAT_INTERVAL)
+        )
+
+        def frame(event: str, data: dict, version: int) -> str:
+            payload = json.dumps(encode_message(data, encoding), separators=(",", ":"))
+            return f"id: {version}\nevent: {event}\ndata: {payload}\n\n"
+
+        def snapshot_frame() -> tuple[str, int]:
+            if encoding == "json":
+                serialized = service.get_serialized_state()
+                version, text = serialized.version, serialized.text
+            else:
+                compact = service.get_encoded_state(encoding)
+                version = compact["v"]
+                text = json.dumps(compact, separators=(",", ":"))
+            return f"id: {version}\nevent: snapshot\ndata: {text}\n\n", version
+
+        def generate():
+            yield "retry: 3000\n\n"
+            version = resume_version
+            deltas = None if version is None else service.deltas_since(version)
+            last_sent = time.monotonic()
+            while True:
+                if deltas is None:
+                    text, version = snapshot_frame()
+                    yield text
+                    last_sent = time.monotonic()
+                elif deltas:
+                    merged = reduce(merge_deltas, deltas)
+                    version = merged["version"]
+                    yield frame("delta", merged, version)
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= SSE_HEARTBEAT_INTERVAL:
+                    yield ": keep-alive\n\n"
+                    last_sent = time.monotonic()
+
+                if service.wait_for_change(version, poll_interval):
+                    deltas = service.deltas_since(version)
+                else:
+                    deltas = []
+
+        return Response(
+            generate(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @blueprint.route("/reset", methods=["POST"])
     def reset_monitoring():
         """
@@ -116,11 +695,15 @@ def create_monitor_blueprint(service, socket_io):
             JSON response confirming reset
         """
         try:
-            monitor_service.reset()
-            state = monitor_service.get_state()
+            session = g.monitor_session
+            session.service.reset()
+            state = session.service.get_state()
+
+            # Send pending deltas first so clients see them before the snapshot
+            session.broadcaster.flush()
 
-            # Broadcast reset to all connected clients
-            socketio.emit("state_update", state, namespace="/monitor", skip_sid=None)
+            # Broadcast reset to the session's full-state clients
+            emit_snapshot(session)
 
             return (
                 jsonify(
@@ -151,7 +734,7 @@ def create_monitor_blueprint(service, socket_io):
             }
 
         Returns:
-            JSON response with updated state
+            JSON response with the resulting version and delta
         """
         try:
             data = request.get_json()
@@ -168,14 +751,16 @@ def create_monitor_blueprint(service, socket_io):
             if status == "running" and not start_time:
                 start_time = datetime.utcnow().isoformat() + "Z"
 
-            monitor_service.set_task_info(title, status, start_time)
+            session = g.monitor_session
+            delta = session.service.set_task_info(title, status, start_time)
 
-            state = monitor_service.get_state()
+            # Broadcast only the task diff; status changes flush immediately
+            session.broadcaster.submit(delta)
 
-            # Broadcast to all connected clients
-            socketio.emit("state_update", state, namespace="/monitor", skip_sid=None)
-
-            return jsonify({"success": True, "current_state": state}), 200
+            return (
+                jsonify({"success": True, "version": delta["version"], "delta": delta}),
+                200,
+            )
 
         except Exception as e:
             return (
@@ -186,28 +771,173 @@ def create_monitor_blueprint(service, socket_io):
     return blueprint
 
 
-def init_socketio_events():
-    """Initialize SocketIO event handlers for the monitoring namespace."""
+def init_socketio_events(resync_interval: float = DEFAULT_RESYNC_INTERVAL):
+    """Initialize SocketIO event handlers for the monitoring namespace.
+
+    Args:
+        resync_interval: Seconds between periodic full-snapshot broadcasts.
+            Zero or negative disables the resync loop.
+    """
+
+    def resync_loop():
+        """Periodically broadcast full snapshots and evict idle sessions."""
+        while True:
+            socketio.sleep(resync_interval)
+            try:
+                sessions.evict_idle()
+                for _, session in sessions.items():
+                    emit_snapshot(session)
+            except Exception as e:
+                print(f"Error on resync broadcast: {str(e)}")
+
+    def subscribed_session() -> str:
+        """Session the current client follows (ALL_SESSIONS for all)."""
+        for room in rooms(namespace="/monitor"):
+            parsed = parse_session_room(room)
+            if parsed is not None:
+                return parsed[0]
+        return DEFAULT_SESSION
+
+    def emit_initial(
+        session_id: str, channels: list[str], nodes: list[str] | None = None
+    ) -> None:
+        """Send the client the current state of the channels it subscribed to.
+
+        Args:
+            session_id: Session ID, or ALL_SESSIONS for every session
+            channels: Subscribed channels
+            nodes: Subscribed node IDs
+        """
+        if session_id == ALL_SESSIONS:
+            targets = [session for _, session in sessions.items()]
+        else:
+            session = find_session(session_id)
+            targets = [] if session is None else [session]
+        encoding = _client_encodings.get(request.sid, "json")
+        wanted = {*channels, *(f"node:{node}" for node in nodes or ())}
+        for session in targets:
+            if "state" in channels:
+                emit("state_update", session.service.get_encoded_state(encoding))
+            state = session.service.get_state()
+            current = {
+                "session": state["session"],
+                "version": state["version"],
+                "nodes": {node: state["nodes"][node] for node in nodes or ()},
+                "events": state["event_log"],
+                "task_info": state["task_info"],
+            }
+            for channel, event, payload in split_delta(current):
+                if channel in wanted:
+                    emit(event, encode_message(payload, encoding))
 
     @socketio.on("connect", namespace="/monitor")
-    def handle_connect():
-        """Handle new client connection - send current state immediately."""
+    def handle_connect(auth=None):
+        """Handle new client connection - send current state immediately.
+
+        Args:
+            auth: Optional {"session": id, "encoding": "json"|"compact"|
+                "msgpack"} to follow a session other than the default one
+                and to receive compact messages from the start
+        """
+        global _resync_started
+        auth = auth if isinstance(auth, dict) else {}
+        session_id = str(auth.get("session") or DEFAULT_SESSION)
+        if session_id != ALL_SESSIONS and not is_valid_session_id(session_id):
+            session_id = DEFAULT_SESSION
+        encoding = negotiate(auth.get("encoding"))
+        _client_encodings[request.sid] = encoding
         try:
-            state = monitor_service.get_state()
-            emit("state_update", state)
+            join_room(session_room(session_id, encoding=encoding))
+            join_room(REPLAY_ROOM)
+            emit_initial(session_id, ["state"])
         except Exception as e:
             print(f"Error on WebSocket connect: {str(e)}")
 
+        # Start the resync loop lazily once the first dashboard connects
+        if resync_interval > 0 and not _resync_started:
+            _resync_started = True
+            socketio.start_background_task(resync_loop)
+
     @socketio.on("disconnect", namespace="/monitor")
     def handle_disconnect():
         """Handle client disconnection."""
-        pass
+        _client_encodings.pop(request.sid, None)
+
+    @socketio.on("subscribe", namespace="/monitor")
+    def handle_subscribe(data=None):
+        """Replace the client's subscription.
+
+        Request:
+            {
+                "session": "session ID or * (default: current session)",
+                "channels": ["state", "events", "task", "replay"],
+                "nodes": ["jira", ...],
+                "encoding": "json", "compact" or "msgpack" (default: current)
+            }
+
+        Without channels and nodes the client gets full state and replays.
+        "state" delivers state_update/state_delta, "events" monitor_events,
+        "task" task_update and each node node_update messages.
+
+        Returns:
+            Acknowledgement with the resulting subscription
+        """
+        data = data or {}
+        if not isinstance(data, dict):
+            return {"success": False, "error": "Subscription must be an object"}
+        session_id = data.get("session") or subscribed_session()
+        nodes = data.get("nodes") or []
+        channels = data.get("channels") or ([] if nodes else ["state", "replay"])
+        if not isinstance(session_id, str) or (
+            session_id != ALL_SESSIONS and not is_valid_session_id(session_id)
+        ):
+            return {"success": False, "error": f"Invalid session: {session_id}"}
+        if not isinstance(channels, list) or not isinstance(nodes, list):
+            return {"success": False, "error": "channels and nodes must be lists"}
+        unknown = [c for c in channels if c not in CHANNELS] + [
+            n for n in nodes if n not in MonitorService.VALID_NODES
+        ]
+        if unknown:
+            return {"success": False, "error": f"Unknown channels or nodes: {unknown}"}
+        if session_id != ALL_SESSIONS and find_session(session_id) is None:
+            return {"success": False, "error": f"Unknown session: {session_id}"}
+
+        encoding = _client_encodings.get(request.sid, "json")
+        if "encoding" in data:
+            encoding = negotiate(data["encoding"])
+            _client_encodings[request.sid] = encoding
+
+        for room in rooms(namespace="/monitor"):
+            if room == REPLAY_ROOM or parse_session_room(room) is not None:
+                leave_room(room)
+        for channel in channels:
+            join_room(
+                REPLAY_ROOM
+                if channel == "replay"
+                else session_room(session_id, channel, encoding)
+            )
+        for node in nodes:
+            join_room(session_room(session_id, f"node:{node}", encoding))
+
+        emit_initial(session_id, channels, nodes)
+        return {
+            "success": True,
+            "session": session_id,
+            "channels": channels,
+            "nodes": nodes,
+            "encoding": encoding,
+        }
 
     @socketio.on("request_state", namespace="/monitor")
-    def handle_request_state():
-        """Handle client request for current state."""
+    def handle_request_state(data=None):
+        """Handle client request for current state.
+
+        Args:
+            data: Optional {"session": id}; defaults to the followed session
+        """
         try:
-            state = monitor_service.get_state()
-            emit("state_update", state)
+            data = data if isinstance(data, dict) else {}
+            session_id = data.get("session") or subscribed_session()
+            emit_initial(session_id, ["state"])
         except Exception as e:
             print(f"Error on state request: {str(e)}")
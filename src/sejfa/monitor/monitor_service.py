@@ -4,11 +4,46 @@ MonitorService: Manages workflow state and event logging for Claude Code monitor
 Tracks which node is currently active in the agentic loop
 (JIRA, CLAUDE, GITHUB, JULES, ACTIONS) and maintains a real-time
 event log for dashboard visualization.
+
+Every mutation bumps a monotonically increasing state version and returns a
+delta describing only what changed, so broadcasters can push small messages
+instead of the full snapshot. Clients apply a delta only when its
+``base_version`` matches the version they hold, and request a snapshot
+otherwise.
+
+An optional StateBackend shares the state between processes (for example
+gunicorn workers): mutations run as read-modify-write transactions on the
+backend and reads refresh from it when another process has moved ahead.
+Reads check the backend without taking the service lock, and at most once
+per ``refresh_interval``; in between they may serve state that is up to
+that many seconds older than what another process has written.
+
+All mutations run under the service lock and bump the version atomically.
+Readers do not take the lock: the event log and task info are replaced
+rather than modified in place (copy-on-write), so a snapshot built once per
+version can be shared as-is and a reader always sees one consistent
+version, never a half-applied update. Snapshots are also serialized to JSON
+at most once per version and cached, so any number of readers (HTTP,
+Socket.IO, SSE) share the same encoded bytes.
+
+An optional EventStore keeps the full event history on disk; stored events
+carry the sequence number assigned by the store.
 """
 
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
+
+from src.sejfa.monitor.compact import encode_message
+from src.sejfa.monitor.event_store import EventStore
+from src.sejfa.monitor.metrics import WorkflowMetrics
+from src.sejfa.monitor.state_backend import StateBackend
 
 
 @dataclass
@@ -20,20 +55,61 @@ class WorkflowNode:
     message: str = ""
 
 
+class SerializedState(NamedTuple):
+    """A state snapshot encoded as JSON, valid for one state version."""
+
+    version: int
+    text: str
+    data: bytes
+
+
 class MonitorService:
     """Manages real-time monitoring state for the Claude Code agentic loop."""
 
     # Valid node IDs in the workflow
     VALID_NODES = {"jira", "claude", "github", "jules", "actions"}
 
-    def __init__(self, max_events: int = 100):
+    def __init__(
+        self,
+        max_events: int = 100,
+        backend: StateBackend | None = None,
+        event_store: EventStore | None = None,
+        delta_history: int = 1000,
+        session_id: str = "default",
+        refresh_interval: float = 0.0,
+    ):
         """
         Initialize the monitor service.
 
         Args:
             max_events: Maximum number of events to retain in the log
+            backend: Optional shared state backend; None keeps state local
+            event_store: Optional durable store receiving every event
+            delta_history: Number of recent deltas kept for resuming readers
+            session_id: ID of the monitored agent loop, sent with every
+                snapshot and delta
+            refresh_interval: Seconds reads serve local state before checking
+                the backend for newer state again (0 = on every read)
         """
+        self.session_id = session_id
         self.max_events = max_events
+        self.backend = backend
+        self.event_store = event_store
+        self.refresh_interval = refresh_interval
+        # Monotonic time before which reads skip the backend check
+        self._next_refresh = 0.0
+        self._lock = threading.RLock()
+        # Notified on every mutation; readers wait on it for new versions
+        self._changed = threading.Condition(self._lock)
+        self._deltas: deque[dict[str, Any]] = deque(maxlen=delta_history)
+        self._serialized: SerializedState | None = None
+        # Snapshot shared by readers; rebuilt at most once per version
+        self._published: dict[str, Any] | None = None
+        # Compact encodings of the published snapshot, keyed by encoding
+        self._encoded: dict[str, tuple[dict[str, Any], Any]] = {}
+        # Dwell/cycle timings, updated on every transition handled here
+        self.metrics = WorkflowMetrics()
+        self.version = 0
         self.current_node: str | None = None
         self.nodes: dict[str, WorkflowNode] = {
             node_id: WorkflowNode() for node_id in self.VALID_NODES
@@ -45,7 +121,9 @@ class MonitorService:
             "start_time": None,
         }
 
-    def update_node(self, node_id: str, state: str, message: str = "") -> bool:
+    def update_node(
+        self, node_id: str, state: str, message: str = ""
+    ) -> dict[str, Any] | None:
         """
         Update the active node and log the transition.
 
@@ -55,16 +133,110 @@ class MonitorService:
             message: Status message for the node
 
         Returns:
-            True if update was successful, False otherwise
+            Versioned delta describing the change, or None if node_id is invalid
         """
         if node_id not in self.VALID_NODES:
-            return False
+            return None
+
+        with self._mutation():
+            changed_nodes, event = self._apply_node_update(node_id, state, message)
+            return self._make_delta(
+                nodes=self._serialize_nodes(changed_nodes), events=[event]
+            )
+
+    def apply_batch(self, updates: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Apply a batch of node and task updates in order as one mutation.
+
+        Each update is either a node transition ({"node", "state", "message"})
+        or a task update ({"title", "status", "start_time"}); an update is a
+        node transition when it has a "node" key. The whole batch is validated
+        first, applied under one lock and produces a single version bump.
+
+        Args:
+            updates: Node and task updates in the order they happened
+
+        Returns:
+            Versioned delta covering the whole batch
+
+        Raises:
+            ValueError: If an update is not a dict, names an invalid node or
+                has a field of the wrong type
+        """
+        updates = list(updates)
+        for index, update in enumerate(updates):
+            self._validate_update(index, update)
+
+        with self._mutation():
+            changed_nodes: dict[str, None] = {}
+            events: list[dict[str, Any]] = []
+            task_diff: dict[str, Any] = {}
+            for update in updates:
+                if "node" in update:
+                    nodes, event = self._apply_node_update(
+                        update["node"],
+                        update.get("state", "active"),
+                        update.get("message", ""),
+                    )
+                    changed_nodes.update(dict.fromkeys(nodes))
+                    events.append(event)
+                else:
+                    task_diff.update(
+                        self._apply_task_update(
+                            update.get("title", ""),
+                            update.get("status", ""),
+                            update.get("start_time"),
+                        )
+                    )
+            return self._make_delta(
+                nodes=self._serialize_nodes(changed_nodes),
+                events=events,
+                task_info=task_diff,
+            )
+
+    def _validate_update(self, index: int, update: Any) -> None:
+        """
+        Check one batch update so that applying it cannot fail halfway.
+
+        Raises:
+            ValueError: If the update is not a dict, names an invalid node or
+                has a field of the wrong type
+        """
+        if not isinstance(update, dict):
+            raise ValueError(f"Update {index} is not an object")
+        if "node" in update:
+            node = update["node"]
+            if not isinstance(node, str) or node not in self.VALID_NODES:
+                raise ValueError(
+                    f"Update {index}: invalid node {node!r}. "
+                    f"Must be one of {self.VALID_NODES}"
+                )
+            fields = ("state", "message")
+        else:
+            fields = ("title", "status")
+            if not isinstance(update.get("start_time"), str | None):
+                raise ValueError(f"Update {index}: start_time must be a string")
+        for name in fields:
+            if not isinstance(update.get(name, ""), str):
+                raise ValueError(f"Update {index}: {name} must be a string")
+
+    def _apply_node_update(
+        self, node_id: str, state: str, message: str
+    ) -> tuple[list[str], dict[str, Any]]:
+        """
+        Apply a node transition to local state.
 
+        Returns:
+            IDs of the nodes that changed and the logged event
+        """
         is_active = state.lower() == "active"
+        changed_nodes = [node_id]
+        self.metrics.observe(node_id, is_active)
 
         # Deactivate previous node if different
         if is_active and self.current_node and self.current_node != node_id:
             self.nodes[self.current_node].active = False
+            changed_nodes.append(self.current_node)
 
         # Update node
         self.nodes[node_id].active = is_active
@@ -74,57 +246,148 @@ class MonitorService:
         self.nodes[node_id].message = message[:200]  # Truncate message to 200 chars
 
         # Add to event log
-        self.add_event(node_id, message)
+        event = self.add_event(node_id, message)
 
-        return True
+        return changed_nodes, event
 
     def get_state(self) -> dict[str, Any]:
         """
         Get the current workflow state snapshot.
 
+        The snapshot is shared between readers of the same version and must
+        be treated as read-only. With a backend, it may lag state written by
+        another process by up to ``refresh_interval`` seconds.
+
         Returns:
             Dict with current node, nodes status, event log, and task info
         """
+        self._refresh()
+        published = self._published
+        if published is not None and published["version"] == self.version:
+            return published
+        with self._lock:
+            published = self._published
+            if published is None or published["version"] != self.version:
+                published = self._snapshot()
+                self._published = published
+            return published
+
+    def get_serialized_state(self) -> SerializedState:
+        """
+        Get the current snapshot as pre-encoded JSON.
+
+        The encoding is cached per state version, so serialization happens
+        once per mutation no matter how many readers ask for it. With a
+        backend, it may lag state written by another process by up to
+        ``refresh_interval`` seconds.
+
+        Returns:
+            SerializedState with the version, JSON text and UTF-8 bytes
+        """
+        self._refresh()
+        cached = self._serialized
+        if cached is not None and cached.version == self.version:
+            return cached
+        with self._lock:
+            cached = self._serialized
+            if cached is None or cached.version != self.version:
+                state = self.get_state()
+                text = json.dumps(state, separators=(",", ":"))
+                cached = SerializedState(state["version"], text, text.encode())
+                self._serialized = cached
+            return cached
+
+    def get_encoded_state(self, encoding: str = "json") -> Any:
+        """
+        Get the current snapshot in a negotiated encoding.
+
+        Each encoding is computed at most once per published snapshot.
+
+        Args:
+            encoding: "json", "compact" or "msgpack"
+
+        Returns:
+            JSON text, the compact dict or MessagePack bytes
+        """
+        if encoding == "json":
+            return self.get_serialized_state().text
+        state = self.get_state()
+        cached = self._encoded.get(encoding)
+        if cached is None or cached[0] is not state:
+            cached = (state, encode_message(state, encoding))
+            self._encoded[encoding] = cached
+        return cached[1]
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Serialize the local state without consulting the backend."""
         return {
+            "session": self.session_id,
+            "version": self.version,
             "current_node": self.current_node,
             "nodes": {node_id: asdict(node) for node_id, node in self.nodes.items()},
             "event_log": self.event_log,
             "task_info": self.task_info,
         }
 
-    def add_event(self, node_id: str, message: str) -> None:
+    def add_event(self, node_id: str, message: str) -> dict[str, Any]:
         """
         Add an event to the event log.
 
         Args:
             node_id: Node identifier
             message: Event message
+
+        Returns:
+            The logged event
         """
         event = {
             "timestamp": self._get_timestamp(),
             "node": node_id,
             "message": message[:200],  # Truncate to 200 chars
         }
-        self.event_log.append(event)
+        with self._lock:
+            if self.event_store is not None:
+                event["seq"] = self.event_store.append(
+                    event, task=self.task_info["title"]
+                )
+
+            # Copy-on-write: published snapshots keep the previous list
+            event_log = [*self.event_log, event]
 
-        # Keep log size manageable
-        if len(self.event_log) > self.max_events:
-            self.event_log = self.event_log[-self.max_events :]
+            # Keep log size manageable
+            if len(event_log) > self.max_events:
+                event_log = event_log[-self.max_events :]
+            self.event_log = event_log
+
+            # Events added outside a mutation do not bump the version
+            self._published = None
+            self._serialized = None
+
+        return event
 
     def reset(self) -> None:
-        """Reset all monitoring state."""
-        self.current_node = None
-        self.nodes = {node_id: WorkflowNode() for node_id in self.VALID_NODES}
-        self.event_log = []
-        self.task_info = {
-            "title": "Waiting for task...",
-            "status": "idle",
-            "start_time": None,
-        }
+        """Reset all monitoring state.
+
+        The version keeps counting so clients holding an older state notice
+        the gap and resynchronise from a snapshot.
+        """
+        with self._mutation():
+            self.version += 1
+            self.metrics.reset()
+            self._deltas.clear()
+            self._changed.notify_all()
+            self.current_node = None
+            self.nodes = {node_id: WorkflowNode() for node_id in self.VALID_NODES}
+            self.event_log = []
+            self.task_info = {
+                "title": "Waiting for task...",
+                "status": "idle",
+                "start_time": None,
+            }
 
     def set_task_info(
         self, title: str = "", status: str = "", start_time: str | None = None
-    ) -> None:
+    ) -> dict[str, Any]:
         """
         Update task information.
 
@@ -132,18 +395,183 @@ class MonitorService:
             title: Task title
             status: Task status (idle, running, completed, failed)
             start_time: ISO timestamp when task started
+
+        Returns:
+            Versioned delta carrying only the task fields that changed
         """
+        with self._mutation():
+            task_diff = self._apply_task_update(title, status, start_time)
+            return self._make_delta(task_info=task_diff)
+
+    def _apply_task_update(
+        self, title: str, status: str, start_time: str | None
+    ) -> dict[str, Any]:
+        """
+        Apply a task update to local state.
+
+        Returns:
+            Task fields whose value changed
+        """
+        updates: dict[str, Any] = {}
         if title:
-            self.task_info["title"] = title[:100]  # Truncate to 100 chars
+            updates["title"] = title[:100]  # Truncate to 100 chars
         if status:
-            self.task_info["status"] = status
+            updates["status"] = status
         if start_time:
-            self.task_info["start_time"] = start_time
+            updates["start_time"] = start_time
+
+        task_diff = {
+            key: value
+            for key, value in updates.items()
+            if self.task_info.get(key) != value
+        }
+        if task_diff:
+            self.task_info = {**self.task_info, **task_diff}
+        return task_diff
 
     def get_task_info(self) -> dict[str, Any]:
         """Get current task information."""
+        self._refresh()
         return self.task_info.copy()
 
+    def deltas_since(self, version: int) -> list[dict[str, Any]] | None:
+        """
+        Get the deltas that lead from a version to the current state.
+
+        Args:
+            version: Version the reader already holds
+
+        Returns:
+            Consecutive deltas after that version (empty if up to date), or
+            None if they are no longer available and the reader needs a
+            snapshot
+        """
+        with self._lock:
+            if version == self.version:
+                return []
+            if version > self.version:
+                return None
+            deltas = [delta for delta in self._deltas if delta["version"] > version]
+            expected = version
+            for delta in deltas:
+                if delta["base_version"] != expected:
+                    return None
+                expected = delta["version"]
+            if expected != self.version:
+                return None
+            return deltas
+
+    def wait_for_change(self, version: int, timeout: float) -> bool:
+        """
+        Block until the state moves past a version or the timeout expires.
+
+        Args:
+            version: Version the reader already holds
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the current version differs from the given one
+        """
+        with self._changed:
+            if self._changed.wait_for(lambda: self.version != version, timeout):
+                return True
+        # Changes made by other processes are only visible through the backend
+        self._refresh()
+        return self.version != version
+
+    @contextmanager
+    def _mutation(self) -> Iterator[None]:
+        """
+        Run a mutation against the latest shared state.
+
+        Mutations are serialized by the service lock. With a backend, the
+        stored state is also loaded under the backend's write lock, the
+        mutation is applied locally and the result is stored before the
+        lock is released.
+        """
+        with self._lock:
+            if self.backend is None:
+                yield
+                return
+
+            with self.backend.transaction() as stored:
+                if stored is not None and stored["version"] != self.version:
+                    self._restore(stored)
+                yield
+                self.backend.store(self._snapshot())
+
+    def _refresh(self) -> None:
+        """
+        Pull newer state written by another process, if any.
+
+        The backend is queried without the service lock, so reads never wait
+        for a mutation in progress; the lock is only taken to apply state
+        that is newer than the local one.
+        """
+        if self.backend is None:
+            return
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return
+        self._next_refresh = now + self.refresh_interval
+        stored = self.backend.load_if_newer(self.version)
+        if stored is None:
+            return
+        with self._lock:
+            # A local mutation may have moved past it while we were reading
+            if stored["version"] > self.version:
+                self._restore(stored)
+
+    def _restore(self, stored: dict[str, Any]) -> None:
+        """Replace local state with a snapshot loaded from the backend."""
+        self._changed.notify_all()
+        self.version = stored["version"]
+        self.current_node = stored["current_node"]
+        self.nodes = {
+            node_id: WorkflowNode(**node) for node_id, node in stored["nodes"].items()
+        }
+        self.event_log = stored["event_log"]
+        self.task_info = stored["task_info"]
+
+    def _serialize_nodes(self, node_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Serialize the given nodes for a delta."""
+        return {node_id: asdict(self.nodes[node_id]) for node_id in node_ids}
+
+    def _make_delta(
+        self,
+        nodes: dict[str, dict[str, Any]] | None = None,
+        events: list[dict[str, Any]] | None = None,
+        task_info: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Bump the state version and build a delta message for the change.
+
+        Args:
+            nodes: Serialized nodes that changed, keyed by node ID
+            events: Events appended to the log by this change
+            task_info: Task fields that changed
+
+        Returns:
+            Delta dict with base_version, version and the changed parts only
+        """
+        base_version = self.version
+        self.version += 1
+        delta: dict[str, Any] = {
+            "session": self.session_id,
+            "base_version": base_version,
+            "version": self.version,
+            "current_node": self.current_node,
+        }
+        if nodes:
+            delta["nodes"] = nodes
+        if events:
+            delta["events"] = events
+        if task_info:
+            delta["task_info"] = task_info
+        self._deltas.append(delta)
+        self._changed.notify_all()
+        return delta
+
     @staticmethod
     def _get_timestamp() -> str:
         """Get current timestamp in ISO format."""
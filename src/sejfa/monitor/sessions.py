@@ -0,0 +1,244 @@
+"""
+Session registry for monitoring several agent loops at once.
+
+Each monitored loop reports under its own session ID and gets its own
+MonitorService (with its own lock), so concurrent loops neither overwrite
+each other's state nor contend on one global lock. The registry lock is only
+taken to create, evict or list sessions; looking up an existing session is a
+plain dict read.
+
+Idle sessions are evicted after ``idle_ttl`` seconds without updates, and the
+least recently used session is evicted when ``max_sessions`` is exceeded.
+Pinned sessions (the default session) are never evicted.
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from src.sejfa.monitor.broadcast import BroadcastCoalescer
+from src.sejfa.monitor.monitor_service import MonitorService
+
+# Session used by clients that do not send a session ID
+DEFAULT_SESSION = "default"
+
+# Socket.IO room receiving updates from every session
+ALL_SESSIONS = "*"
+
+# Message channels a client can subscribe to, besides per-node updates:
+# full state (snapshots and deltas), new events, task changes and replays
+CHANNELS = ("state", "events", "task", "replay")
+
+# Replays come from the shared event store, not from one session
+REPLAY_ROOM = "replay"
+
+_SESSION_ID_PATTERN = re.compile(r"[A-Za-z0-9_.:-]{1,64}")
+
+
+class MonitorSession(NamedTuple):
+    """State and broadcaster of one monitored agent loop."""
+
+    session_id: str
+    service: MonitorService
+    broadcaster: BroadcastCoalescer
+
+
+class _Entry:
+    """Registry slot holding a session value and its last use."""
+
+    __slots__ = ("value", "last_used", "pinned")
+
+    def __init__(self, value: Any, pinned: bool):
+        self.value = value
+        self.last_used = time.monotonic()
+        self.pinned = pinned
+
+
+def is_valid_session_id(session_id: str) -> bool:
+    """Check that a session ID is 1-64 characters of [A-Za-z0-9_.:-]."""
+    return bool(_SESSION_ID_PATTERN.fullmatch(session_id))
+
+
+def session_room(
+    session_id: str, channel: str = "state", encoding: str = "json"
+) -> str:
+    """
+    Socket.IO room name for one channel of a session in one encoding.
+
+    Args:
+        session_id: Session ID, or ALL_SESSIONS
+        channel: "state", "events", "task" or "node:<node id>"
+        encoding: Message encoding of the clients in the room
+
+    Returns:
+        Room name; "/" and "~" cannot occur in session IDs, so they separate
+        the channel and the encoding
+    """
+    room = f"session:{session_id}"
+    if channel != "state":
+        room = f"{room}/{channel}"
+    return room if encoding == "json" else f"{room}~{encoding}"
+
+
+def parse_session_room(room: str) -> tuple[str, str, str] | None:
+    """
+    Split a room name from session_room into its parts.
+
+    Returns:
+        (session_id, channel, encoding), or None for other rooms
+    """
+    prefix = "session:"
+    if not room.startswith(prefix):
+        return None
+    room, _, encoding = room[len(prefix) :].partition("~")
+    session_id, _, channel = room.partition("/")
+    return session_id, channel or "state", encoding or "json"
+
+
+class SessionRegistry:
+    """Sessions keyed by ID with lazy creation and LRU/idle-time eviction."""
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any],
+        max_sessions: int = 1000,
+        idle_ttl: float = 3600.0,
+        on_evict: Callable[[str, Any], None] | None = None,
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            factory: Creates the value for a new session ID
+            max_sessions: Sessions kept before the least recently used is evicted
+            idle_ttl: Seconds without use after which a session is evicted
+                (zero or negative disables idle eviction)
+            on_evict: Called with (session_id, value) after a session is evicted
+        """
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + self._sweep_interval()
+        self.created = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    def register(self, session_id: str, value: Any, pinned: bool = False) -> None:
+        """
+        Add an existing value as a session.
+
+        Args:
+            session_id: Session ID
+            value: Session value
+            pinned: Never evict this session
+        """
+        with self._lock:
+            self._entries[session_id] = _Entry(value, pinned)
+
+    def get(self, session_id: str, create: bool = True) -> Any | None:
+        """
+        Look up a session and mark it as used.
+
+        Args:
+            session_id: Session ID
+            create: Create the session with the factory if it does not exist
+
+        Returns:
+            The session value, or None if it does not exist and create is False
+        """
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            if entry.last_used >= self._next_sweep:
+                self.evict_idle()
+            return entry.value
+        if not create:
+            return None
+
+        evicted: list[tuple[str, Any]] = []
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                entry = _Entry(self.factory(session_id), pinned=False)
+                self._entries[session_id] = entry
+                self.created += 1
+                evicted = self._evict_over_capacity()
+        self._notify_evicted(evicted)
+        return entry.value
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Get (session_id, value) pairs for all live sessions."""
+        with self._lock:
+            return [(sid, entry.value) for sid, entry in self._entries.items()]
+
+    def idle_seconds(self) -> dict[str, float]:
+        """Get the seconds since each session was last used."""
+        now = time.monotonic()
+        with self._lock:
+            return {sid: now - entry.last_used for sid, entry in self._entries.items()}
+
+    def evict_idle(self) -> list[str]:
+        """
+        Evict every unpinned session idle for longer than idle_ttl.
+
+        Returns:
+            IDs of the evicted sessions
+        """
+        now = time.monotonic()
+        evicted: list[tuple[str, Any]] = []
+        with self._lock:
+            self._next_sweep = now + self._sweep_interval()
+            if self.idle_ttl > 0:
+                cutoff = now - self.idle_ttl
+                for sid, entry in list(self._entries.items()):
+                    if not entry.pinned and entry.last_used < cutoff:
+                        evicted.append((sid, self._entries.pop(sid).value))
+                self.evicted += len(evicted)
+        self._notify_evicted(evicted)
+        return [sid for sid, _ in evicted]
+
+    def stats(self) -> dict[str, int]:
+        """Get counters for live, created and evicted sessions."""
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "created": self.created,
+                "evicted": self.evicted,
+            }
+
+    def _evict_over_capacity(self) -> list[tuple[str, Any]]:
+        """Evict least recently used sessions beyond max_sessions. Caller locks."""
+        evicted = []
+        while len(self._entries) > self.max_sessions:
+            candidates = [
+                (entry.last_used, sid)
+                for sid, entry in self._entries.items()
+                if not entry.pinned
+            ]
+            if not candidates:
+                break
+            _, sid = min(candidates)
+            evicted.append((sid, self._entries.pop(sid).value))
+        self.evicted += len(evicted)
+        return evicted
+
+    def _sweep_interval(self) -> float:
+        """Seconds between idle sweeps triggered by lookups."""
+        return max(self.idle_ttl / 10, 1.0) if self.idle_ttl > 0 else float("inf")
+
+    def _notify_evicted(self, evicted: list[tuple[str, Any]]) -> None:
+        """Run the eviction callback outside the registry lock."""
+        if self.on_evict is None:
+            return
+        for sid, value in evicted:
+            self.on_evict(sid, value)
@@ -0,0 +1,268 @@
+"""
+Pluggable shared state backends for MonitorService.
+
+Gunicorn runs several worker processes, each with its own MonitorService.
+A backend stores the serialized monitor state outside the process so that
+every worker applies mutations to, and serves reads from, the same state.
+
+- InMemoryStateBackend shares state between services in one process.
+- SqliteStateBackend shares state between processes on one host through a
+  SQLite database in WAL mode (readers never block the single writer).
+
+Each monitoring session has its own state. A backend holds one session's
+state; for_session() returns the backend of another session, so a worker
+that never saw a session can still load it from the shared store. A
+session's state is deleted when the session is evicted.
+"""
+
+import copy
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
+
+
+class StateBackend(ABC):
+    """Interface for storing the monitor state snapshot."""
+
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager[dict[str, Any] | None]:
+        """
+        Hold the state exclusively for a read-modify-write cycle.
+
+        Yields:
+            The stored state, or None if nothing has been stored yet.
+            Call store() before leaving the block to persist changes.
+        """
+
+    @abstractmethod
+    def store(self, state: dict[str, Any]) -> None:
+        """
+        Persist a new state. Must be called inside transaction().
+
+        Args:
+            state: State snapshot including its "version"
+        """
+
+    @abstractmethod
+    def load_if_newer(self, version: int) -> dict[str, Any] | None:
+        """
+        Load the stored state if its version differs from the caller's.
+
+        Args:
+            version: Version the caller already holds
+
+        Returns:
+            The stored state, or None if the caller is up to date
+        """
+
+    @abstractmethod
+    def for_session(self, session_id: str) -> "StateBackend":
+        """
+        Get the backend holding another session's state in the same store.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Backend for that session
+        """
+
+    @abstractmethod
+    def delete(self, version: int) -> bool:
+        """
+        Delete this session's stored state, e.g. when the session is evicted.
+
+        Args:
+            version: Version the caller holds; a newer state stored by
+                another process (still using the session) is kept
+
+        Returns:
+            True if the state was deleted
+        """
+
+    def exists(self) -> bool:
+        """Check whether a state has been stored for this backend's session."""
+        return self.load_if_newer(-1) is not None
+
+    def close(self) -> None:
+        """Release what this session's backend holds (default: nothing)."""
+        return None
+
+
+class InMemoryStateBackend(StateBackend):
+    """Shares state between MonitorService instances in one process."""
+
+    def __init__(self, session_id: str = "default"):
+        """
+        Initialize an empty in-memory store.
+
+        Args:
+            session_id: Session this backend holds the state of
+        """
+        self.session_id = session_id
+        self._lock = threading.RLock()
+        self._state: dict[str, Any] | None = None
+        self._sessions: dict[str, InMemoryStateBackend] = {session_id: self}
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any] | None]:
+        """Hold the store lock for a read-modify-write cycle."""
+        with self._lock:
+            yield self._state
+
+    def store(self, state: dict[str, Any]) -> None:
+        """Replace the stored state."""
+        with self._lock:
+            self._state = json.loads(json.dumps(state))
+
+    def load_if_newer(self, version: int) -> dict[str, Any] | None:
+        """Return a copy of the state if its version differs."""
+        with self._lock:
+            if self._state is None or self._state["version"] == version:
+                return None
+            return json.loads(json.dumps(self._state))
+
+    def for_session(self, session_id: str) -> "InMemoryStateBackend":
+        """Return the same backend for a session on every call."""
+        with self._lock:
+            backend = self._sessions.get(session_id)
+            if backend is None:
+                backend = InMemoryStateBackend(session_id)
+                backend._sessions = self._sessions
+                self._sessions[session_id] = backend
+            return backend
+
+    def delete(self, version: int) -> bool:
+        """Forget the session's state unless a newer one was stored."""
+        with self._lock:
+            if self._state is None or self._state["version"] > version:
+                return False
+            self._state = None
+            self._sessions.pop(self.session_id, None)
+            return True
+
+
+class SqliteStateBackend(StateBackend):
+    """Shares state between processes through a SQLite database in WAL mode.
+
+    Every session's backend has its own connection and lock, so sessions
+    only wait for each other inside SQLite's write lock, which a mutation
+    holds just long enough to read and write one row.
+    """
+
+    def __init__(self, path: str, timeout: float = 10.0, session_id: str = "default"):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            path: Path to the SQLite database file
+            timeout: Seconds to wait for another writer's lock
+            session_id: Session whose state row this backend reads and writes
+        """
+        self.path = path
+        self.timeout = timeout
+        self.session_id = session_id
+        # The session's connection, guarded by a lock for thread safety
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS monitor_sessions ("
+            "session_id TEXT PRIMARY KEY, "
+            "version INTEGER NOT NULL, "
+            "state TEXT NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """The session's connection, opened on first use. Caller holds the lock."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any] | None]:
+        """Take the database write lock for a read-modify-write cycle."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT state FROM monitor_sessions WHERE session_id = ?",
+                    (self.session_id,),
+                ).fetchone()
+                yield json.loads(row[0]) if row else None
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def store(self, state: dict[str, Any]) -> None:
+        """Write the state row inside the current transaction."""
+        with self._lock:
+            self._connection().execute(
+                "INSERT INTO monitor_sessions (session_id, version, state) "
+                "VALUES (?, ?, ?) ON CONFLICT(session_id) DO UPDATE SET "
+                "version = excluded.version, state = excluded.state",
+                (self.session_id, state["version"], json.dumps(state)),
+            )
+
+    def load_if_newer(self, version: int) -> dict[str, Any] | None:
+        """Read the state row only if its version differs."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT state FROM monitor_sessions "
+                    "WHERE session_id = ? AND version != ?",
+                    (self.session_id, version),
+                )
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+
+    def exists(self) -> bool:
+        """Check for the session's row without loading its state."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT 1 FROM monitor_sessions WHERE session_id = ?",
+                    (self.session_id,),
+                )
+                .fetchone()
+            )
+        return row is not None
+
+    def delete(self, version: int) -> bool:
+        """Delete the session's row unless a newer state was stored."""
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM monitor_sessions WHERE session_id = ? AND version <= ?",
+                (self.session_id, version),
+            )
+        return cursor.rowcount > 0
+
+    def for_session(self, session_id: str) -> "SqliteStateBackend":
+        """Return a backend for another session with its own connection."""
+        backend = copy.copy(self)
+        backend.session_id = session_id
+        backend._lock = threading.RLock()
+        backend._conn = None
+        return backend
+
+    def close(self) -> None:
+        """Close the session's connection (reopened if used again)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,226 @@
+"""Tests for the asyncio Jira client against a local async stub server."""
+
+import asyncio
+import time
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from src.sejfa.integrations.async_jira_client import AsyncJiraClient  # noqa: E402
+from src.sejfa.integrations.jira_client import (  # noqa: E402
+    JiraAPIError,
+    JiraConfig,
+)
+
+LATENCY = 0.05
+
+
+class _StubJira:
+    """aiohttp app standing in for Jira; tracks concurrency and connections."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.ports: set[int] = set()
+        self.comments: list[dict] = []
+        self.issue_reads = 0
+        self.app = web.Application()
+        self.app.router.add_get("/rest/api/3/issue/{key}", self.get_issue)
+        self.app.router.add_post("/rest/api/3/issue/{key}/comment", self.comment)
+        self.app.router.add_post("/rest/api/3/issue/bulk", self.bulk)
+        self.app.router.add_post("/rest/api/3/search", self.search)
+
+    async def _enter(self, request: web.Request) -> None:
+        self.ports.add(request.transport.get_extra_info("peername")[1])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(LATENCY)
+        self.in_flight -= 1
+
+    async def get_issue(self, request: web.Request) -> web.Response:
+        await self._enter(request)
+        self.issue_reads += 1
+        key = request.match_info["key"]
+        if key == "GE-404":
+            return web.json_response({"errorMessages": ["Not found"]}, status=404)
+        return web.json_response(
+            {
+                "key": key,
+                "fields": {
+                    "summary": f"Summary of {key}",
+                    "issuetype": {"name": "Task"},
+                    "status": {"name": "To Do"},
+                },
+            }
+        )
+
+    async def comment(self, request: web.Request) -> web.Response:
+        await self._enter(request)
+        self.comments.append(await request.json())
+        return web.json_response({"id": str(len(self.comments))}, status=201)
+
+    async def bulk(self, request: web.Request) -> web.Response:
+        await self._enter(request)
+        updates = (await request.json())["issueUpdates"]
+        return web.json_response(
+            {"issues": [{"key": f"GE-{100 + i}"} for i in range(len(updates))]},
+            status=201,
+        )
+
+    async def search(self, request: web.Request) -> web.Response:
+        await self._enter(request)
+        payload = await request.json()
+        start = payload["startAt"]
+        keys = [f"GE-{i}" for i in range(start, min(start + payload["maxResults"], 3))]
+        return web.json_response(
+            {
+                "startAt": start,
+                "total": 3,
+                "issues": [{"key": key, "fields": {"summary": key}} for key in keys],
+            }
+        )
+
+
+async def _with_stub(test, **client_kwargs):
+    """Run test(stub, client) against a stub server on a free port."""
+    stub = _StubJira()
+    runner = web.AppRunner(stub.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    config = JiraConfig(url=f"http://127.0.0.1:{port}", email="e", api_token="t")
+    try:
+        async with AsyncJiraClient(
+            config, max_concurrency=5, **client_kwargs
+        ) as client:
+            return await test(stub, client)
+    finally:
+        await runner.cleanup()
+
+
+class TestAsyncJiraClient:
+    """Tests for bounded-concurrency fan-out."""
+
+    def test_gather_is_concurrent_and_bounded(self) -> None:
+        """30 reads overlap, never more than max_concurrency at once."""
+
+        async def test(stub, client):
+            started = time.monotonic()
+            issues = await client.gather(client.get_issue(f"GE-{i}") for i in range(30))
+            return stub, issues, time.monotonic() - started
+
+        stub, issues, elapsed = asyncio.run(_with_stub(test))
+
+        assert [issue.key for issue in issues] == [f"GE-{i}" for i in range(30)]
+        assert stub.max_in_flight == 5
+        # Sequential would take 30 * LATENCY; bounded fan-out about 6 * LATENCY
+        assert elapsed < 30 * LATENCY / 2
+        assert len(stub.ports) <= 5  # connections come from one shared pool
+
+    def test_errors_returned_in_place(self) -> None:
+        """Failed calls become JiraAPIError results without stopping the rest."""
+
+        async def test(stub, client):
+            return await client.gather(
+                [client.get_issue("GE-1"), client.get_issue("GE-404")]
+            )
+
+        ok, error = asyncio.run(_with_stub(test))
+
+        assert ok.key == "GE-1"
+        assert isinstance(error, JiraAPIError)
+        assert error.status_code == 404
+        assert "Not found" in error.response
+
+    def test_search_pages_and_drops_raw_by_default(self) -> None:
+        """Search pages through every result and keeps raw only on request."""
+
+        async def test(stub, client):
+            lean = [
+                issue async for issue in client.iter_issues("project = GE", page_size=2)
+            ]
+            full = await client.search_issues("project = GE", keep_raw=True)
+            return lean, full
+
+        lean, full = asyncio.run(_with_stub(test))
+
+        assert [issue.key for issue in lean] == ["GE-0", "GE-1", "GE-2"]
+        assert all(issue.raw is None for issue in lean)
+        assert [issue.raw["key"] for issue in full] == ["GE-0", "GE-1", "GE-2"]
+
+    def test_add_comment_sends_adf(self) -> None:
+        async def test(stub, client):
+            await client.add_comment("GE-1", "Hello")
+            return stub
+
+        stub = asyncio.run(_with_stub(test))
+
+        assert stub.comments[0]["body"]["content"][0]["content"][0]["text"] == "Hello"
+
+    def test_bulk_create_chunks_concurrently(self) -> None:
+        """Bulk chunks are sent in parallel and indexes stay global."""
+
+        async def test(stub, client):
+            items = [
+                {"project_key": "GE", "summary": f"S{i}", "issue_type": "Task"}
+                for i in range(6)
+            ]
+            return stub, await client.create_issues_bulk(items, chunk_size=2)
+
+        stub, result = asyncio.run(_with_stub(test))
+
+        assert sorted(result.issues) == list(range(6))
+        assert result.issues[5].summary == "S5"
+        assert stub.max_in_flight == 3
+
+    def test_response_cache_and_invalidation(self) -> None:
+        """Repeated reads are cached; a comment drops the issue's entry."""
+        from src.sejfa.integrations.response_cache import ResponseCache
+
+        async def test(stub, client):
+            await client.get_issue("GE-1")
+            await client.get_issue("GE-1")
+            await client.add_comment("GE-1", "Hello")
+            await client.get_issue("GE-1")
+            return stub, client.stats()["cache"]
+
+        stub, stats = asyncio.run(_with_stub(test, cache=ResponseCache(ttl=60)))
+
+        assert stub.issue_reads == 2
+        assert stats["hits"] == 1
+        assert stats["invalidations"] == 1
+
+    def test_cancelled_trial_call_releases_breaker(self) -> None:
+        """Cancelling the half-open probe lets the next call probe again."""
+        from src.sejfa.integrations.retry import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        async def test(stub, client):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.get_issue("GE-1"), LATENCY / 5)
+            return (await client.get_issue("GE-2")).key
+
+        assert asyncio.run(_with_stub(test, breaker=breaker)) == "GE-2"
+        assert breaker.state == "closed"
+
+    def test_connection_error(self) -> None:
+        """Unreachable hosts raise JiraAPIError without a status code."""
+        from src.sejfa.integrations.retry import RetryPolicy
+
+        async def run():
+            config = JiraConfig(url="http://127.0.0.1:1", email="e", api_token="t")
+            async with AsyncJiraClient(
+                config, retry_policy=RetryPolicy(max_attempts=1)
+            ) as client:
+                await client.get_issue("GE-1")
+
+        with pytest.raises(JiraAPIError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.status_code is None
+        assert str(exc_info.value).startswith("Connection error:")
@@ -0,0 +1,217 @@
+"""Tests for the local fake Jira server, driven through JiraClient."""
+
+import time
+
+import pytest
+
+from scripts.fake_jira import FakeJira, FakeJiraServer, FaultProfile
+from scripts.jules_to_jira import create_tasks, parse_findings
+from src.sejfa.integrations.jira_client import JiraAPIError, JiraClient
+from src.sejfa.integrations.response_cache import ResponseCache
+from src.sejfa.integrations.retry import RetryPolicy
+
+
+@pytest.fixture
+def fake():
+    with FakeJiraServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(fake: FakeJiraServer) -> JiraClient:
+    with JiraClient(fake.config(), retry_policy=RetryPolicy(max_attempts=1)) as jira:
+        yield jira
+
+
+class TestFakeJiraEndpoints:
+    """The client's calls round-trip through the fake."""
+
+    def test_connection_and_projects(self, client: JiraClient) -> None:
+        assert client.test_connection()
+        assert client.get_projects() == [{"key": "GE", "name": "GE"}]
+
+    def test_create_and_get(self, client: JiraClient) -> None:
+        created = client.create_issue(
+            "GE", "First", issue_type="Task", labels=["automated"]
+        )
+
+        assert created.key == "GE-1"
+        assert created.status == "To Do"
+        assert client.get_issue("GE-1").labels == ["automated"]
+
+    def test_create_validation_error(self, client: JiraClient) -> None:
+        with pytest.raises(JiraAPIError) as exc_info:
+            client.create_issue("NOPE", "Bad project", issue_type="Task")
+
+        assert exc_info.value.status_code == 400
+        assert "project" in exc_info.value.response
+
+    def test_missing_issue_is_404(self, client: JiraClient) -> None:
+        with pytest.raises(JiraAPIError) as exc_info:
+            client.get_issue("GE-999")
+
+        assert exc_info.value.status_code == 404
+
+    def test_transition_follows_workflow(self, client: JiraClient) -> None:
+        client.create_issue("GE", "Work", issue_type="Task")
+
+        client.transition_issue("GE-1", "In Progress")
+        client.transition_issue("GE-1", "In Review")
+
+        assert client.get_issue("GE-1").status == "In Review"
+        with pytest.raises(JiraAPIError, match="not found"):
+            client.transition_issue("GE-1", "To Do")
+
+    def test_comment(self, client: JiraClient, fake: FakeJiraServer) -> None:
+        client.create_issue("GE", "Work", issue_type="Task")
+        client.add_comment("GE-1", "Looks good")
+
+        body = fake.jira.comments["GE-1"][0]["body"]
+        assert body["content"][0]["content"][0]["text"] == "Looks good"
+
+    def test_search_jql_subset_and_paging(self, client: JiraClient) -> None:
+        for i in range(120):
+            labels = ["even"] if i % 2 == 0 else []
+            client.create_issues_bulk(
+                [
+                    {
+                        "project_key": "GE",
+                        "summary": f"S{i}",
+                        "issue_type": "Task",
+                        "labels": labels,
+                    }
+                ]
+            )
+
+        evens = list(client.iter_issues('project = GE AND labels = "even"'))
+        picked = client.search_issues("key in (GE-1, GE-3) ORDER BY created DESC")
+
+        assert len(evens) == 60
+        assert [issue.key for issue in picked] == ["GE-1", "GE-3"]
+
+    def test_unsupported_jql_is_400(self, client: JiraClient) -> None:
+        with pytest.raises(JiraAPIError) as exc_info:
+            client.search_issues("summary ~ 'x'")
+
+        assert exc_info.value.status_code == 400
+
+    def test_etag_revalidation(self, fake: FakeJiraServer) -> None:
+        """An unchanged issue revalidates with 304; a comment changes it."""
+        client = JiraClient(fake.config(), cache=ResponseCache(ttl=0))
+        client.create_issue("GE", "Work", issue_type="Task")
+        client.get_issue("GE-1")
+        client.get_issue("GE-1")
+
+        assert client.cache.stats()["revalidated"] >= 1
+
+    def test_jules_to_jira_creates_tasks(self, client: JiraClient) -> None:
+        client.create_issue("GE", "Origin", issue_type="Task")
+        findings = parse_findings(
+            "[HIGH] app.py:1 — Bad\n[MEDIUM] db.py:2 — Worse\n[LOW] a.md:3 — Meh\n"
+        )
+
+        created = create_tasks(client, "GE-1", findings)
+
+        assert created == ["GE-2", "GE-3"]
+        assert client.get_issue("GE-2").labels == [
+            "jules-review",
+            "automated",
+            findings[0].label,
+        ]
+
+    def test_jules_to_jira_rerun_creates_only_new(
+        self, client: JiraClient, fake: FakeJiraServer
+    ) -> None:
+        """A rerun with one new finding costs one search and one create."""
+        client.create_issue("GE", "Origin", issue_type="Task")
+        review = "[HIGH] app.py:1 — Bad\n[MEDIUM] db.py:2 — Worse\n"
+        create_tasks(client, "GE-1", parse_findings(review))
+        before = fake.stats()["requests"]
+
+        rerun = parse_findings(
+            review.replace("app.py:1", "app.py:7") + "[HIGH] x.py:3 — New\n"
+        )
+        created = create_tasks(client, "GE-1", rerun)
+        after = fake.stats()["requests"]
+
+        assert created == ["GE-4"]
+        assert after["search"] - before["search"] == 1
+        assert after["bulk_create"] - before["bulk_create"] == 1
+
+    def test_jules_to_jira_done_task_does_not_count(self, client: JiraClient) -> None:
+        client.create_issue("GE", "Origin", issue_type="Task")
+        findings = parse_findings("[HIGH] app.py:1 — Bad\n")
+        (key,) = create_tasks(client, "GE-1", findings)
+        for status in ("In Progress", "In Review", "Done"):
+            client.transition_issue(key, status)
+
+        assert create_tasks(client, "GE-1", findings) == ["GE-3"]
+
+    def test_jules_to_jira_closed_task_does_not_count(self) -> None:
+        """Any status in the Done category ends a task, not just "Done"."""
+        jira = FakeJira(
+            workflow={"To Do": ["Won't Do"], "Won't Do": []},
+            categories={"To Do": "To Do", "Won't Do": "Done"},
+        )
+        with FakeJiraServer(jira) as fake, JiraClient(fake.config()) as client:
+            client.create_issue("GE", "Origin", issue_type="Task")
+            findings = parse_findings("[HIGH] app.py:1 — Bad\n")
+            (key,) = create_tasks(client, "GE-1", findings)
+            client.transition_issue(key, "Won't Do")
+
+            assert create_tasks(client, "GE-1", findings) == ["GE-3"]
+
+
+class TestFaultInjection:
+    """Latency, 503s and 429s from the FaultProfile."""
+
+    def test_throttle_then_retry(self) -> None:
+        """Every request is throttled: the client retries, then gives up."""
+        faults = FaultProfile(throttle_rate=1.0, retry_after=0)
+        with FakeJiraServer(faults=faults) as fake:
+            client = JiraClient(
+                fake.config(), retry_policy=RetryPolicy(max_attempts=3, base_delay=0)
+            )
+            with pytest.raises(JiraAPIError) as exc_info:
+                client.get_projects()
+
+            assert exc_info.value.status_code == 429
+            assert exc_info.value.retry_after == 0
+            assert fake.stats()["throttled"] == 3
+            assert client.stats()["retries"] == 2
+
+    def test_error_rate_is_seeded(self) -> None:
+        """The same seed injects the same faults."""
+
+        def run() -> int:
+            faults = FaultProfile(error_rate=0.5, seed=7)
+            with FakeJiraServer(faults=faults) as fake:
+                client = JiraClient(
+                    fake.config(), retry_policy=RetryPolicy(max_attempts=1)
+                )
+                for _ in range(20):
+                    client.test_connection()
+                return fake.stats()["errors"]
+
+        errors = run()
+        assert 0 < errors < 20
+        assert run() == errors
+
+    def test_latency(self) -> None:
+        with FakeJiraServer(faults=FaultProfile(latency=0.05)) as fake:
+            client = JiraClient(fake.config())
+            started = time.monotonic()
+            client.test_connection()
+
+            assert time.monotonic() - started >= 0.05
+
+    def test_state_can_be_prepared(self) -> None:
+        jira = FakeJira(projects=("GE", "OPS"))
+        jira.create(
+            {"project": {"key": "OPS"}, "summary": "x", "issuetype": {"name": "Bug"}}
+        )
+
+        with FakeJiraServer(jira) as fake:
+            issue = JiraClient(fake.config()).get_issue("OPS-1")
+
+        assert issue.issue_type == "Bug"
@@ -0,0 +1,173 @@
+"""Tests for the keep-alive connection pool used by JiraClient."""
+
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.sejfa.integrations.http_pool import ConnectionPool
+from src.sejfa.integrations.jira_client import JiraAPIError, JiraClient, JiraConfig
+from src.sejfa.integrations.retry import RetryPolicy
+
+
+class _StubJiraHandler(BaseHTTPRequestHandler):
+    """Minimal Jira API stand-in that records the client port per request."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self, status: int, payload: dict | None) -> None:
+        # Read before replying: the test may reset it once the body arrives
+        drop = self.server.drop_after_reply
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.server.close_after_reply:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        # Simulate an idle timeout: drop the connection without telling
+        self.close_connection = self.close_connection or drop
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.ports.append(self.client_address[1])
+        if self.path.endswith("/MISSING-1"):
+            self._reply(404, {"errorMessages": ["Issue does not exist"]})
+        else:
+            self._reply(200, {"key": self.path.rsplit("/", 1)[-1], "fields": {}})
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.server.ports.append(self.client_address[1])
+        length = int(self.headers.get("Content-Length") or 0)
+        self.server.bodies.append(json.loads(self.rfile.read(length) or b"null"))
+        if self.server.lose_reply:
+            # Handled, but the connection drops before the response is sent
+            self.close_connection = True
+            return
+        self._reply(204, None)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP/1.1 keep-alive server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubJiraHandler)
+    server.ports = []
+    server.bodies = []
+    server.close_after_reply = False
+    server.drop_after_reply = False
+    server.lose_reply = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub_server) -> JiraClient:
+    """JiraClient pointed at the stub server."""
+    config = JiraConfig(
+        url=f"http://127.0.0.1:{stub_server.server_address[1]}",
+        email="test@example.com",
+        api_token="test-token",
+    )
+    with JiraClient(config=config) as jira:
+        yield jira
+
+
+class TestConnectionPool:
+    """Tests for connection reuse and thread safety."""
+
+    def test_requests_reuse_one_connection(self, client, stub_server) -> None:
+        """Sequential calls share a single keep-alive connection."""
+        for key in ("GE-1", "GE-2", "GE-3"):
+            assert client.get_issue(key).key == key
+
+        assert len(set(stub_server.ports)) == 1
+        assert client.pool.stats() == {"opened": 1, "reused": 2, "idle": 1}
+
+    def test_server_closed_connection_is_replaced(self, client, stub_server) -> None:
+        """A connection the server closed is not reused."""
+        stub_server.close_after_reply = True
+        client.get_issue("GE-1")
+        client.get_issue("GE-2")
+
+        assert len(set(stub_server.ports)) == 2
+        assert client.pool.stats()["idle"] == 0
+
+    def test_stale_idle_connection_is_retried(self, stub_server) -> None:
+        """A request on a connection dropped while idle is resent once."""
+        pool = ConnectionPool()
+        url = f"http://127.0.0.1:{stub_server.server_address[1]}/issue/GE-1"
+        stub_server.drop_after_reply = True
+        pool.request("GET", url)
+        stub_server.drop_after_reply = False
+
+        response = pool.request("GET", url)
+
+        assert response.status == 200
+        assert pool.stats()["opened"] == 2
+        pool.close()
+
+    def test_lost_post_response_is_not_resent(self, stub_server) -> None:
+        """A POST the server may have handled is left to the retry policy."""
+        pool = ConnectionPool()
+        url = f"http://127.0.0.1:{stub_server.server_address[1]}/issue"
+        pool.request("GET", url + "/GE-1")
+        stub_server.lose_reply = True
+
+        with pytest.raises(http.client.RemoteDisconnected):
+            pool.request("POST", url, body=b"{}")
+
+        assert stub_server.bodies == [{}]
+        assert pool.stats()["opened"] == 1
+        pool.close()
+
+    def test_concurrent_checkout(self, client, stub_server) -> None:
+        """Threads never share a connection and idle connections are capped."""
+        client.pool.max_per_host = 4
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            keys = list(
+                executor.map(lambda i: client.get_issue(f"GE-{i}").key, range(64))
+            )
+
+        assert keys == [f"GE-{i}" for i in range(64)]
+        stats = client.pool.stats()
+        assert stats["opened"] + stats["reused"] == 64
+        assert stats["idle"] <= 4
+
+
+class TestJiraClientTransport:
+    """Tests that JiraClient keeps its error semantics over the pool."""
+
+    def test_http_error_raises_jira_api_error(self, client) -> None:
+        """Error statuses raise JiraAPIError with code and body."""
+        with pytest.raises(JiraAPIError) as exc_info:
+            client.get_issue("MISSING-1")
+
+        assert exc_info.value.status_code == 404
+        assert "does not exist" in exc_info.value.response
+        assert str(exc_info.value) == "Jira API error 404: Not Found"
+
+    def test_empty_response_returns_empty_dict(self, client, stub_server) -> None:
+        """A 204 reply parses as an empty dict and sends the JSON body."""
+        assert client.add_comment("GE-1", "hello") == {}
+        assert stub_server.bodies[0]["body"]["type"] == "doc"
+
+    def test_connection_error_raises_jira_api_error(self) -> None:
+        """Unreachable hosts raise JiraAPIError without a status code."""
+        config = JiraConfig(url="http://127.0.0.1:1", email="e", api_token="t")
+        no_retry = RetryPolicy(max_attempts=1)
+
+        with pytest.raises(JiraAPIError) as exc_info:
+            JiraClient(config=config, retry_policy=no_retry).get_issue("GE-1")
+
+        assert exc_info.value.status_code is None
+        assert str(exc_info.value).startswith("Connection error:")
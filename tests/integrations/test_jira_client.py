@@ -117,6 +117,42 @@ class TestJiraIssue:
         assert issue.priority is None
         assert issue.assignee is None
 
+    def test_discard_raw_keeps_only_needed_fields(self) -> None:
+        """keep_raw=False drops the response but every attribute still works."""
+        api_response = {
+            "key": "PROJ-1",
+            "expand": "renderedFields",
+            "fields": {
+                "summary": "Big issue",
+                "issuetype": {"name": "Bug", "iconUrl": "https://x/bug.svg"},
+                "status": {"name": "Done", "statusCategory": {"key": "done"}},
+                "assignee": {"displayName": "John Doe", "avatarUrls": {"48": "u"}},
+                "labels": ["backend"],
+                "comment": {"comments": [{"body": "long"}]},
+            },
+        }
+
+        issue = JiraIssue.from_api_response(api_response, keep_raw=False)
+
+        assert issue.raw is None
+        assert issue.assignee == "John Doe"
+        assert issue.labels == ["backend"]
+        assert issue == JiraIssue.from_api_response(api_response)
+        assert issue._fields == {
+            "labels": ["backend"],
+            "assignee": {"displayName": "John Doe"},
+        }
+
+    def test_slots_and_repr(self) -> None:
+        issue = JiraIssue("GE-1", "Title", "Task", "To Do")
+
+        assert not hasattr(issue, "__dict__")
+        assert issue.labels == []
+        assert issue.raw is None
+        assert repr(issue) == (
+            "JiraIssue(key='GE-1', summary='Title', issue_type='Task', status='To Do')"
+        )
+
 
 class TestJiraClient:
     """Tests for JiraClient."""
@@ -245,6 +281,97 @@ class TestJiraClient:
             assert client.test_connection() is False
 
 
+class TestTransitionCache:
+    """Tests for cached, optimistic workflow transitions."""
+
+    ISSUE = {
+        "key": "GE-1",
+        "fields": {"issuetype": {"name": "Task"}, "status": {"name": "To Do"}},
+        "transitions": [
+            {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+            {"id": "31", "name": "Done", "to": {"name": "Done"}},
+        ],
+    }
+
+    @pytest.fixture
+    def client(self) -> JiraClient:
+        return JiraClient(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token",
+            )
+        )
+
+    def _jira(self, calls: list, reject: set[str] = frozenset()):
+        """_request stand-in; POSTs of transition IDs in reject get a 400."""
+
+        def request(method: str, endpoint: str, data: dict = None):
+            calls.append((method, endpoint))
+            if method == "GET":
+                return self.ISSUE
+            if data["transition"]["id"] in reject:
+                raise JiraAPIError("Jira API error 400", status_code=400)
+            return {}
+
+        return request
+
+    def test_steady_state_is_one_request(self, client: JiraClient) -> None:
+        """A second issue in the same workflow status needs only the POST."""
+        calls: list = []
+        with patch.object(client, "_request", side_effect=self._jira(calls)):
+            client.transition_issue("GE-1", "In Progress")
+            client.transitions.remember_issue("GE-2", "Task", "To Do")
+            calls.clear()
+
+            client.transition_issue("GE-2", "In Progress")
+
+        assert calls == [("POST", "/rest/api/3/issue/GE-2/transitions")]
+        assert client.transitions.issue_state("GE-2") == ("Task", "In Progress")
+
+    def test_get_issue_seeds_issue_state(self, client: JiraClient) -> None:
+        """A fetched issue can be transitioned with a single POST."""
+        calls: list = []
+        client.transitions.store("GE", "Task", "To Do", self.ISSUE["transitions"])
+
+        with patch.object(client, "_request", side_effect=self._jira(calls)):
+            client.get_issue("GE-1")
+            client.transition_issue("GE-1", "Done")
+
+        assert [method for method, _ in calls] == ["GET", "POST"]
+        assert client.transitions.stats()["hits"] == 1
+
+    def test_rejected_cached_id_refreshes(self, client: JiraClient) -> None:
+        """A cached ID Jira rejects is dropped and transitions refetched."""
+        calls: list = []
+        client.transitions.remember_issue("GE-1", "Task", "To Do")
+        client.transitions.store(
+            "GE", "Task", "To Do", [{"id": "99", "name": "In Progress"}]
+        )
+
+        with patch.object(
+            client, "_request", side_effect=self._jira(calls, reject={"99"})
+        ):
+            assert client.transition_issue("GE-1", "In Progress") is True
+
+        assert [method for method, _ in calls] == ["POST", "GET", "POST"]
+        assert client.transitions.lookup("GE", "Task", "To Do", "In Progress")[0] == (
+            "21"
+        )
+        assert client.transitions.stats()["invalidations"] == 1
+
+    def test_other_errors_propagate(self, client: JiraClient) -> None:
+        """Errors other than a rejected transition are not swallowed."""
+        client.transitions.remember_issue("GE-1", "Task", "To Do")
+        client.transitions.store("GE", "Task", "To Do", self.ISSUE["transitions"])
+
+        with patch.object(
+            client, "_request", side_effect=JiraAPIError("Forbidden", status_code=403)
+        ):
+            with pytest.raises(JiraAPIError):
+                client.transition_issue("GE-1", "Done")
+
+
 class TestJiraAPIError:
     """Tests for JiraAPIError."""
 
@@ -162,3 +162,114 @@ class TestCreateIssue:
                 summary="Test",
                 description="Custom description",
             )
+
+
+class TestCreateIssuesBulk:
+    """Tests for create_issues_bulk."""
+
+    @pytest.fixture
+    def client(self) -> JiraClient:
+        return JiraClient(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token",
+            )
+        )
+
+    @staticmethod
+    def _items(count: int) -> list[dict]:
+        return [
+            {
+                "project_key": "GE",
+                "summary": f"Finding {i}",
+                "issue_type": "Task",
+                "labels": ["jules-review"],
+            }
+            for i in range(count)
+        ]
+
+    def test_single_request_without_refetch(self, client: JiraClient) -> None:
+        """Ten issues take one POST and no GETs."""
+        calls = []
+
+        def mock_request(method: str, endpoint: str, data: dict = None):
+            calls.append((method, endpoint))
+            count = len(data["issueUpdates"])
+            return {"issues": [{"id": str(i), "key": f"GE-{i}"} for i in range(count)]}
+
+        with patch.object(client, "_request", side_effect=mock_request):
+            result = client.create_issues_bulk(self._items(10))
+
+        assert calls == [("POST", "/rest/api/3/issue/bulk")]
+        assert [result.issues[i].key for i in range(10)] == [
+            f"GE-{i}" for i in range(10)
+        ]
+        assert result.issues[3].summary == "Finding 3"
+        assert result.issues[3].issue_type == "Task"
+        assert result.issues[3].labels == ["jules-review"]
+        assert result.errors == []
+
+    def test_chunks_requests(self, client: JiraClient) -> None:
+        """Items are sent in chunks and indexes stay global."""
+        sizes = []
+
+        def mock_request(method: str, endpoint: str, data: dict = None):
+            sizes.append(len(data["issueUpdates"]))
+            return {"issues": [{"key": "GE-1"}] * len(data["issueUpdates"])}
+
+        with patch.object(client, "_request", side_effect=mock_request):
+            result = client.create_issues_bulk(self._items(7), chunk_size=3)
+
+        assert sizes == [3, 3, 1]
+        assert sorted(result.issues) == list(range(7))
+
+    def test_partial_failure_reported_per_item(self, client: JiraClient) -> None:
+        """Rejected items are reported; the rest map to the right index."""
+        response = {
+            "issues": [{"key": "GE-10"}, {"key": "GE-12"}],
+            "errors": [
+                {
+                    "status": 400,
+                    "failedElementNumber": 1,
+                    "elementErrors": {"errors": {"summary": "Summary is required"}},
+                }
+            ],
+        }
+
+        with patch.object(client, "_request", return_value=response):
+            result = client.create_issues_bulk(self._items(3))
+
+        assert {i: issue.key for i, issue in result.issues.items()} == {
+            0: "GE-10",
+            2: "GE-12",
+        }
+        (error,) = result.errors
+        assert (error.index, error.status_code) == (1, 400)
+        assert error.message == "summary: Summary is required"
+
+    def test_all_failed_response_parsed(self, client: JiraClient) -> None:
+        """A 400 with per-item errors is reported per item."""
+        body = (
+            '{"issues": [], "errors": [{"status": 400, "failedElementNumber": 0,'
+            ' "elementErrors": {"errorMessages": ["Bad project"]}}]}'
+        )
+        error = JiraAPIError("Jira API error 400", status_code=400, response=body)
+
+        with patch.object(client, "_request", side_effect=error):
+            result = client.create_issues_bulk(self._items(1))
+
+        assert result.issues == {}
+        assert result.errors[0].message == "Bad project"
+
+    def test_chunk_failure_marks_every_item(self, client: JiraClient) -> None:
+        """An error without item details fails every item in the chunk."""
+        error = JiraAPIError("Jira API error 500", status_code=500)
+
+        with patch.object(client, "_request", side_effect=error):
+            result = client.create_issues_bulk(self._items(2))
+
+        assert [(e.index, e.status_code) for e in result.errors] == [
+            (0, 500),
+            (1, 500),
+        ]
@@ -0,0 +1,262 @@
+"""Tests for JiraClient retries, Retry-After handling and circuit breaker."""
+
+from http.client import HTTPMessage
+from unittest.mock import patch
+
+import pytest
+
+from src.sejfa.integrations.http_pool import PooledResponse
+from src.sejfa.integrations.jira_client import (
+    CircuitOpenError,
+    JiraAPIError,
+    JiraClient,
+    JiraConfig,
+)
+from src.sejfa.integrations.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def _response(status: int, body: str = "{}", **headers: str) -> PooledResponse:
+    message = HTTPMessage()
+    for name, value in headers.items():
+        message[name.replace("_", "-")] = value
+    return PooledResponse(status=status, reason="", headers=message, body=body.encode())
+
+
+class _FakePool:
+    """Returns scripted responses (or raises scripted errors) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls: list[str] = []
+
+    def request(self, method, url, body=None, headers=None):
+        self.calls.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def sleeps():
+    """Record sleeps instead of waiting."""
+    recorded: list[float] = []
+    with patch(
+        "src.sejfa.integrations.jira_client.time.sleep", side_effect=recorded.append
+    ):
+        yield recorded
+
+
+def _client(pool: _FakePool, **kwargs) -> JiraClient:
+    config = JiraConfig(url="https://test.atlassian.net", email="e", api_token="t")
+    return JiraClient(config=config, pool=pool, **kwargs)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self) -> None:
+        """HTTP dates are converted to a delay from now."""
+        delay = parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=10.0)
+
+        assert delay == 20.0
+
+    def test_invalid_or_missing(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    """Tests for retry decisions."""
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        """Delays stay within the exponential envelope and max_delay."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0, max_attempts=10)
+
+        delays = [policy.next_delay(attempt, 503, True) for attempt in range(6)]
+
+        for attempt, delay in enumerate(delays):
+            assert 0 <= delay <= min(4.0, 2**attempt)
+
+    def test_honors_retry_after(self) -> None:
+        """Retry-After is a lower bound on the delay."""
+        assert RetryPolicy().next_delay(0, 429, True, retry_after=5.0) >= 5.0
+
+    def test_gives_up_outside_budget_or_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.next_delay(2, 503, True) is None
+        assert policy.next_delay(0, 429, True, retry_after=10, remaining=5) is None
+
+    def test_non_idempotent_only_retried_on_429(self) -> None:
+        """POSTs may have been processed unless Jira throttled them."""
+        policy = RetryPolicy()
+
+        assert policy.next_delay(0, 429, False) is not None
+        assert policy.next_delay(0, 503, False) is None
+        assert policy.next_delay(0, None, False) is None
+
+    def test_client_errors_not_retried(self) -> None:
+        assert RetryPolicy().next_delay(0, 404, True) is None
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_after_threshold_and_probes(self) -> None:
+        """Consecutive failures open it; one trial call runs after the timeout."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open" and not breaker.allow()
+        now[0] = 10.0
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial at a time
+        breaker.record_failure()
+        assert breaker.state == "open" and breaker.trips == 2
+
+        now[0] = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed" and breaker.allow()
+
+    def test_release_frees_trial_call(self) -> None:
+        """A trial call that ends without an outcome lets the next one probe."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] = 10.0
+        assert breaker.allow()
+
+        breaker.release()
+
+        assert breaker.state == "half_open" and breaker.allow()
+
+
+class TestJiraClientRetries:
+    """Tests for retries in JiraClient._request."""
+
+    def test_retries_throttled_get(self, sleeps) -> None:
+        """A 429 with Retry-After is retried after at least that delay."""
+        pool = _FakePool(
+            _response(429, Retry_After="2"),
+            _response(200, '{"key": "GE-1", "fields": {}}'),
+        )
+        client = _client(pool)
+
+        assert client.get_issue("GE-1").key == "GE-1"
+        assert sleeps[0] >= 2
+        assert client.stats()["retries"] == 1
+
+    def test_create_issue_retried_on_429(self, sleeps) -> None:
+        """Throttled issue creation is retried instead of lost."""
+        pool = _FakePool(
+            _response(429),
+            _response(201, '{"key": "GE-7"}'),
+            _response(200, '{"key": "GE-7", "fields": {}}'),
+        )
+
+        issue = _client(pool).create_issue("GE", "Summary", issue_type="Task")
+
+        assert issue.key == "GE-7"
+        assert pool.calls == ["POST", "POST", "GET"]
+
+    def test_post_not_retried_on_server_error(self, sleeps) -> None:
+        """A 503 on a POST is not repeated; the issue may exist."""
+        pool = _FakePool(_response(503))
+
+        with pytest.raises(JiraAPIError) as exc_info:
+            _client(pool).add_comment("GE-1", "hi")
+
+        assert exc_info.value.status_code == 503
+        assert sleeps == []
+
+    def test_search_retried_as_idempotent(self, sleeps) -> None:
+        """Search is a read-only POST and is retried after a lost connection."""
+        pool = _FakePool(
+            ConnectionResetError("reset"), _response(200, '{"issues": []}')
+        )
+
+        assert _client(pool).search_issues("project = GE") == []
+        assert len(sleeps) == 1
+
+    def test_gives_up_after_max_attempts(self, sleeps) -> None:
+        pool = _FakePool(*[_response(503)] * 3)
+        client = _client(pool, retry_policy=RetryPolicy(max_attempts=3))
+
+        with pytest.raises(JiraAPIError):
+            client.get_issue("GE-1")
+
+        assert len(pool.calls) == 3
+        assert client.stats()["gave_up"] == 1
+
+    def test_breaker_fails_fast(self, sleeps) -> None:
+        """Once open, calls raise CircuitOpenError without touching Jira."""
+        pool = _FakePool(*[_response(503)] * 2)
+        client = _client(
+            pool,
+            retry_policy=RetryPolicy(max_attempts=1),
+            breaker=CircuitBreaker(failure_threshold=2),
+        )
+        for _ in range(2):
+            with pytest.raises(JiraAPIError):
+                client.get_issue("GE-1")
+
+        with pytest.raises(CircuitOpenError):
+            client.get_issue("GE-1")
+
+        assert len(pool.calls) == 2
+        stats = client.stats()
+        assert stats["breaker_state"] == "open"
+        assert (stats["breaker_trips"], stats["breaker_rejections"]) == (1, 1)
+
+    def test_unexpected_error_in_trial_call_releases_breaker(self, sleeps) -> None:
+        """A probe that raises something unexpected does not wedge the breaker."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=10, clock=lambda: now[0]
+        )
+        pool = _FakePool(
+            _response(503),
+            RuntimeError("bug"),
+            _response(200, '{"key": "GE-1", "fields": {}}'),
+        )
+        client = _client(
+            pool, retry_policy=RetryPolicy(max_attempts=1), breaker=breaker
+        )
+        with pytest.raises(JiraAPIError):
+            client.get_issue("GE-1")
+        now[0] = 10.0
+
+        with pytest.raises(RuntimeError):
+            client.get_issue("GE-1")
+
+        assert client.get_issue("GE-1").key == "GE-1"
+        assert breaker.state == "closed"
+
+    def test_throttling_does_not_trip_breaker(self, sleeps) -> None:
+        """429 means Jira is up, so it never opens the breaker."""
+        pool = _FakePool(*[_response(429)] * 5)
+        client = _client(pool, breaker=CircuitBreaker(failure_threshold=2))
+
+        with pytest.raises(JiraAPIError):
+            client.get_issue("GE-1")
+
+        assert client.stats()["breaker_state"] == "closed"
@@ -0,0 +1,168 @@
+"""Tests for paginated JQL search in JiraClient."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.sejfa.integrations.jira_client import JiraClient, JiraConfig, SearchPages
+
+
+def _fake_search(total: int, calls: list[dict], with_total: bool = True):
+    """Return a _request stand-in serving `total` issues page by page."""
+
+    def request(method: str, endpoint: str, data: dict = None, idempotent=None):
+        calls.append(dict(data))
+        start, size = data["startAt"], data["maxResults"]
+        issues = [
+            {"key": f"GE-{i}", "fields": {"summary": f"Issue {i}"}}
+            for i in range(start, min(start + size, total))
+        ]
+        page = {"startAt": start, "maxResults": size, "issues": issues}
+        if with_total:
+            page["total"] = total
+        return page
+
+    return request
+
+
+@pytest.fixture
+def client() -> JiraClient:
+    config = JiraConfig(
+        url="https://test.atlassian.net",
+        email="test@example.com",
+        api_token="test-token",
+    )
+    return JiraClient(config=config)
+
+
+class TestIterIssues:
+    """Tests for the lazy search iterator."""
+
+    def test_follows_all_pages(self, client: JiraClient) -> None:
+        """Every page is requested in order until total is reached."""
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(250, calls)):
+            keys = [issue.key for issue in client.iter_issues("project = GE")]
+
+        assert keys == [f"GE-{i}" for i in range(250)]
+        assert [c["startAt"] for c in calls] == [0, 100, 200]
+
+    def test_without_total_stops_on_short_page(self, client: JiraClient) -> None:
+        """Responses without total end at the first short page."""
+        calls: list[dict] = []
+        fake = _fake_search(30, calls, with_total=False)
+        with patch.object(client, "_request", side_effect=fake):
+            issues = list(client.iter_issues("project = GE", page_size=10))
+
+        assert len(issues) == 30
+        assert len(calls) == 4  # three full pages and an empty one
+
+    def test_fields_projection_and_page_size(self, client: JiraClient) -> None:
+        """fields and page size are sent with every page request."""
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(5, calls)):
+            issues = list(
+                client.iter_issues(
+                    "project = GE", fields=["summary", "status"], page_size=2
+                )
+            )
+
+        assert [i.summary for i in issues][:2] == ["Issue 0", "Issue 1"]
+        assert all(c["fields"] == ["summary", "status"] for c in calls)
+        assert all(c["maxResults"] == 2 for c in calls)
+
+    def test_is_lazy(self, client: JiraClient) -> None:
+        """Pages are only fetched as the caller consumes issues."""
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(500, calls)):
+            iterator = client.iter_issues("project = GE")
+            next(iterator)
+            iterator.close()
+
+        assert len(calls) == 1
+
+    def test_discards_responses_by_default(self, client: JiraClient) -> None:
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(3, calls)):
+            issues = list(client.iter_issues("project = GE"))
+
+        assert [i.summary for i in issues] == ["Issue 0", "Issue 1", "Issue 2"]
+        assert all(i.raw is None for i in issues)
+
+    def test_keep_raw_keeps_responses(self, client: JiraClient) -> None:
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(3, calls)):
+            issues = client.search_issues("project = GE", keep_raw=True)
+
+        assert [i.raw["key"] for i in issues] == ["GE-0", "GE-1", "GE-2"]
+
+    def test_limit_stops_early(self, client: JiraClient) -> None:
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(500, calls)):
+            issues = list(client.iter_issues("project = GE", limit=150))
+
+        assert len(issues) == 150
+        assert len(calls) == 2
+
+    def test_prefetch_fetches_next_page_during_processing(
+        self, client: JiraClient
+    ) -> None:
+        """With prefetch the next page is requested before the caller asks."""
+        calls: list[dict] = []
+        second_page_requested = threading.Event()
+        fake = _fake_search(200, calls)
+
+        def request(*args, **kwargs):
+            page = fake(*args, **kwargs)
+            if len(calls) == 2:
+                second_page_requested.set()
+            return page
+
+        with patch.object(client, "_request", side_effect=request):
+            iterator = client.iter_issues("project = GE", prefetch=True)
+            first = next(iterator)
+            assert second_page_requested.wait(timeout=5)
+            rest = list(iterator)
+
+        assert first.key == "GE-0"
+        assert len(rest) == 199
+        assert len(calls) == 2
+
+
+class TestSearchIssues:
+    """Tests for the list-returning search wrapper."""
+
+    def test_collects_beyond_first_page(self, client: JiraClient) -> None:
+        """max_results above the page cap is served over several pages."""
+        calls: list[dict] = []
+        with patch.object(client, "_request", side_effect=_fake_search(300, calls)):
+            issues = client.search_issues("project = GE", max_results=250)
+
+        assert len(issues) == 250
+        assert [c["startAt"] for c in calls] == [0, 100, 200]
+
+
+class TestSearchPages:
+    """Tests for the paging state shared by the sync and async clients."""
+
+    def test_limit_trims_last_page(self) -> None:
+        pages = SearchPages("project = GE", fields=["summary"], page_size=2, limit=3)
+
+        first, more = pages.advance({"issues": [{}, {}], "total": 10})
+        assert (len(first), more, pages.start_at) == (2, True, 2)
+        assert pages.payload(pages.start_at) == {
+            "jql": "project = GE",
+            "startAt": 2,
+            "maxResults": 2,
+            "fields": ["summary"],
+        }
+
+        second, more = pages.advance({"issues": [{}, {}], "total": 10})
+        assert (len(second), more) == (1, False)
+
+    def test_without_total_stops_on_short_page(self) -> None:
+        pages = SearchPages("project = GE", page_size=2)
+
+        assert pages.advance({"issues": [{}, {}]})[1] is True
+        assert pages.advance({"issues": [{}]})[1] is False
@@ -0,0 +1,344 @@
+"""Tests for the Jira webhook receiver and replay script."""
+
+import json
+
+import pytest
+from flask import Flask
+
+from app import create_app
+from scripts.fake_jira import FakeJiraServer
+from scripts.jira_webhook_replay import build_request, load_payloads
+from src.sejfa.integrations.jira_client import JiraClient, JiraConfig
+from src.sejfa.integrations.jira_webhook import (
+    SIGNATURE_HEADER,
+    WEBHOOK_PATH,
+    JiraWebhookProcessor,
+    create_jira_webhook_blueprint,
+    sign,
+    verify_signature,
+)
+from src.sejfa.integrations.response_cache import ResponseCache, SqliteCacheBackend
+
+SECRET = "s3cret"
+
+
+def _payload(
+    key: str = "GE-1",
+    event: str = "jira:issue_updated",
+    status: str = "In Progress",
+    category: str = "indeterminate",
+    timestamp: int = 1000,
+    changes: list[tuple[str, str]] = (("To Do", "In Progress"),),
+) -> dict:
+    return {
+        "webhookEvent": event,
+        "timestamp": timestamp,
+        "issue": {
+            "key": key,
+            "fields": {
+                "summary": "Pushed",
+                "issuetype": {"name": "Task"},
+                "status": {"name": status, "statusCategory": {"key": category}},
+            },
+        },
+        "changelog": {
+            "items": [
+                {"field": "status", "fromString": old, "toString": new}
+                for old, new in changes
+            ]
+        },
+    }
+
+
+class _Notify:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, state: str, message: str) -> None:
+        self.calls.append((state, message))
+
+
+class TestSignature:
+    def test_valid_signature(self) -> None:
+        body = b'{"a": 1}'
+        assert verify_signature(SECRET, body, sign(SECRET, body))
+
+    @pytest.mark.parametrize("header", [None, "", "sha256=00", sign("other", b"{}")])
+    def test_invalid_signature(self, header) -> None:
+        assert not verify_signature(SECRET, b"{}", header)
+
+
+class TestProcessor:
+    def test_status_change_notifies(self) -> None:
+        notify = _Notify()
+        processor = JiraWebhookProcessor(notify=notify)
+
+        processor.process(_payload())
+        processor.process(
+            _payload(status="Done", category="done", changes=[("In Review", "Done")])
+        )
+
+        assert notify.calls == [
+            ("active", "GE-1: To Do → In Progress"),
+            ("inactive", "GE-1: In Review → Done"),
+        ]
+        assert processor.stats()["transitions"] == 2
+
+    def test_other_changes_do_not_notify(self) -> None:
+        notify = _Notify()
+        processor = JiraWebhookProcessor(notify=notify)
+
+        processor.process(_payload(changes=[]))
+        processor.process({"webhookEvent": "project_created", "project": {}})
+
+        assert notify.calls == []
+        assert processor.stats()["processed"] == 2
+
+    def test_out_of_order_event_skipped(self) -> None:
+        notify = _Notify()
+        processor = JiraWebhookProcessor(notify=notify)
+
+        processor.process(_payload(timestamp=2000))
+        processor.process(_payload(timestamp=1000, changes=[("Backlog", "To Do")]))
+
+        assert len(notify.calls) == 1
+        assert processor.stats()["stale"] == 1
+
+    def test_pushed_issue_primes_cache(self) -> None:
+        """A pushed issue is served from the cache; a deleted one is dropped."""
+        with FakeJiraServer() as fake:
+            fake.jira.create(
+                {
+                    "project": {"key": "GE"},
+                    "summary": "Old",
+                    "issuetype": {"name": "Task"},
+                }
+            )
+            client = JiraClient(fake.config(), cache=ResponseCache(ttl=30))
+            processor = JiraWebhookProcessor(client=client)
+
+            processor.process(_payload())
+            issue = client.get_issue("GE-1")
+
+            assert issue.summary == "Pushed"
+            assert issue.status == "In Progress"
+            assert "get_issue" not in fake.stats()["requests"]
+
+            processor.process(_payload(event="jira:issue_deleted", timestamp=2000))
+            assert client.get_issue("GE-1").summary == "Old"
+
+    def test_default_ttl_keeps_validators(self) -> None:
+        """At ttl 0 a push leaves the ETag entry, so the next read is a 304."""
+        with FakeJiraServer() as fake:
+            fake.jira.create(
+                {
+                    "project": {"key": "GE"},
+                    "summary": "Old",
+                    "issuetype": {"name": "Task"},
+                }
+            )
+            client = JiraClient(fake.config(), cache=ResponseCache(ttl=0))
+            processor = JiraWebhookProcessor(client=client)
+
+            client.get_issue("GE-1")
+            processor.process(_payload())
+            client.get_issue("GE-1")
+
+            stats = client.stats()["cache"]
+            assert stats["misses"] == 1
+            assert stats["revalidated"] == 1
+
+    def test_worker_and_full_queue(self) -> None:
+        notify = _Notify()
+        processor = JiraWebhookProcessor(notify=notify, max_queue=1)
+
+        assert processor.submit(_payload())
+        assert not processor.submit(_payload(key="GE-2"))
+
+        processor.start()
+        processor.join()
+        processor.stop()
+
+        assert notify.calls == [("active", "GE-1: To Do → In Progress")]
+        assert processor.stats()["dropped"] == 1
+
+    def test_failing_payload_does_not_stop_worker(self) -> None:
+        def broken(state: str, message: str) -> None:
+            raise RuntimeError("boom")
+
+        processor = JiraWebhookProcessor(notify=broken)
+        processor.start()
+        processor.submit(_payload())
+        processor.submit(_payload(key="GE-2", changes=[]))
+        processor.join()
+        processor.stop()
+
+        assert processor.stats()["failed"] == 1
+        assert processor.stats()["processed"] == 1
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    monkeypatch.delenv("JIRA_URL", raising=False)
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "JIRA_WEBHOOK_SECRET": SECRET,
+            "JIRA_WEBHOOK_RECORD": str(tmp_path / "webhooks.jsonl"),
+        }
+    )
+    yield app
+    app.extensions["jira_webhook"].stop()
+
+
+def _post(client, payload: dict, secret: str = SECRET):
+    body = json.dumps(payload).encode()
+    return client.post(
+        WEBHOOK_PATH,
+        data=body,
+        content_type="application/json",
+        headers={SIGNATURE_HEADER: sign(secret, body)},
+    )
+
+
+class TestWebhookRoute:
+    def test_transition_reaches_monitor(self, app) -> None:
+        client = app.test_client()
+
+        response = _post(client, _payload())
+        app.extensions["jira_webhook"].join()
+
+        assert response.status_code == 202
+        jira = client.get("/api/monitor/state").get_json()["nodes"]["jira"]
+        assert jira["active"] is True
+        assert jira["message"] == "GE-1: To Do → In Progress"
+
+    def test_bad_signature_rejected(self, app) -> None:
+        response = _post(app.test_client(), _payload(), secret="wrong")
+
+        assert response.status_code == 401
+        assert app.extensions["jira_webhook"].stats()["received"] == 0
+
+    def test_invalid_json_rejected(self, app) -> None:
+        body = b"not json"
+        response = app.test_client().post(
+            WEBHOOK_PATH, data=body, headers={SIGNATURE_HEADER: sign(SECRET, body)}
+        )
+
+        assert response.status_code == 400
+
+    def test_stats_require_signature(self, app) -> None:
+        client = app.test_client()
+        stats_path = WEBHOOK_PATH + "/stats"
+
+        assert client.get(stats_path).status_code == 401
+        response = client.get(stats_path, headers={SIGNATURE_HEADER: sign(SECRET, b"")})
+
+        assert response.status_code == 200
+        assert response.get_json()["received"] == 0
+
+    def test_refused_payload_not_recorded(self, tmp_path) -> None:
+        """A payload refused with 503 is recorded once, when Jira resends it."""
+        record_path = tmp_path / "webhooks.jsonl"
+        processor = JiraWebhookProcessor(max_queue=1)
+        app = Flask(__name__)
+        app.register_blueprint(
+            create_jira_webhook_blueprint(processor, SECRET, str(record_path))
+        )
+        client = app.test_client()
+
+        statuses = [
+            _post(client, _payload(timestamp=1)).status_code,
+            _post(client, _payload(timestamp=2)).status_code,
+        ]
+        processor.start()
+        processor.join()
+        statuses.append(_post(client, _payload(timestamp=2)).status_code)
+        processor.stop()
+
+        assert statuses == [202, 503, 202]
+        assert [p["timestamp"] for p in load_payloads(str(record_path))] == [1, 2]
+
+    def test_no_cache_without_shared_path(self, monkeypatch, caplog) -> None:
+        """Without JIRA_CACHE_PATH only the monitor is updated, with a warning."""
+        monkeypatch.delenv("JIRA_CACHE_PATH", raising=False)
+        app = create_app(
+            {
+                "TESTING": True,
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "JIRA_WEBHOOK_SECRET": SECRET,
+            }
+        )
+        app.extensions["jira_webhook"].stop()
+
+        assert app.extensions["jira_webhook"].client is None
+        assert "JIRA_CACHE_PATH is not set" in caplog.text
+
+    def test_shared_cache_reaches_agent_loop(self, monkeypatch, tmp_path) -> None:
+        """Pushed and deleted issues reach a client in another process."""
+        cache_path = str(tmp_path / "jira.db")
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_EMAIL", "e")
+        monkeypatch.setenv("JIRA_API_TOKEN", "t")
+        monkeypatch.setenv("JIRA_CACHE_TTL", "30")
+        app = create_app(
+            {
+                "TESTING": True,
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "JIRA_WEBHOOK_SECRET": SECRET,
+                "JIRA_CACHE_PATH": cache_path,
+            }
+        )
+        processor = app.extensions["jira_webhook"]
+        # The agent loop has its own connection to the same cache file
+        agent = JiraClient(
+            JiraConfig(url="https://test.atlassian.net", email="e", api_token="t"),
+            cache=ResponseCache(SqliteCacheBackend(cache_path), ttl=30),
+        )
+        key = agent.cache_key("/rest/api/3/issue/GE-1")
+
+        _post(app.test_client(), _payload())
+        processor.join()
+        entry, fresh = agent.cache.lookup(key)
+
+        assert fresh
+        assert json.loads(entry.body)["fields"]["summary"] == "Pushed"
+
+        _post(app.test_client(), _payload(event="jira:issue_deleted", timestamp=2000))
+        processor.join()
+        processor.stop()
+
+        assert agent.cache.lookup(key) == (None, False)
+
+    def test_disabled_without_secret(self, monkeypatch) -> None:
+        monkeypatch.delenv("JIRA_WEBHOOK_SECRET", raising=False)
+        app = create_app(
+            {"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}
+        )
+
+        assert "jira_webhook" not in app.extensions
+        assert app.test_client().post(WEBHOOK_PATH, data=b"{}").status_code == 404
+
+
+class TestReplay:
+    def test_recorded_payloads_replay(self, app, tmp_path) -> None:
+        """Recorded bodies load back and are signed for the endpoint."""
+        client = app.test_client()
+        _post(client, _payload(timestamp=1))
+        _post(client, _payload(key="GE-2", timestamp=2))
+
+        payloads = load_payloads(app.config["JIRA_WEBHOOK_RECORD"])
+        request = build_request(payloads[1], "http://x" + WEBHOOK_PATH, SECRET)
+
+        assert [p["issue"]["key"] for p in payloads] == ["GE-1", "GE-2"]
+        assert verify_signature(
+            SECRET, request.data, request.get_header(SIGNATURE_HEADER.capitalize())
+        )
+
+    @pytest.mark.parametrize("as_array", [True, False])
+    def test_load_json_file(self, tmp_path, as_array: bool) -> None:
+        path = tmp_path / "payload.json"
+        path.write_text(json.dumps([_payload()] if as_array else _payload()))
+
+        assert load_payloads(str(path)) == [_payload()]
@@ -12,6 +12,12 @@ from scripts.jules_to_jira import (
     extract_project_key,
     parse_findings,
 )
+from src.sejfa.integrations.jira_client import (
+    BulkCreateError,
+    BulkCreateResult,
+    JiraAPIError,
+    JiraIssue,
+)
 
 
 class TestParseFindingsUnit:
@@ -133,10 +139,21 @@ class TestCreateTasks:
 
     @pytest.fixture
     def mock_client(self) -> MagicMock:
+        def create_bulk(issues):
+            issues = list(issues)
+            return BulkCreateResult(
+                issues={i: MagicMock(key=f"GE-{200 + i}") for i in range(len(issues))},
+                errors=[],
+            )
+
         client = MagicMock()
-        client.create_issue.return_value = MagicMock(key="GE-200")
+        client.create_issues_bulk.side_effect = create_bulk
         return client
 
+    @staticmethod
+    def _submitted(client: MagicMock) -> list[dict]:
+        return list(client.create_issues_bulk.call_args.args[0])
+
     def test_creates_actionable_findings(self, mock_client: MagicMock) -> None:
         """HIGH, CRITICAL, and MEDIUM create tasks; LOW does not."""
         findings = [
@@ -147,20 +164,22 @@ class TestCreateTasks:
 
         keys = create_tasks(mock_client, "GE-35", findings)
 
-        assert len(keys) == 2
-        assert mock_client.create_issue.call_count == 2
-        call_kwargs = mock_client.create_issue.call_args.kwargs
-        assert call_kwargs["issue_type"] == "Task"
-        assert "parent_key" not in call_kwargs
+        assert keys == ["GE-200", "GE-201"]
+        mock_client.create_issues_bulk.assert_called_once()
+        submitted = self._submitted(mock_client)
+        assert len(submitted) == 2
+        assert submitted[-1]["issue_type"] == "Task"
+        assert "parent_key" not in submitted[-1]
+        mock_client.create_issue.assert_not_called()
 
     def test_description_includes_origin(self, mock_client: MagicMock) -> None:
         findings = [Finding("HIGH", "a.py:1", "Bug")]
 
         create_tasks(mock_client, "GE-35", findings, pr_number="42")
 
-        call_kwargs = mock_client.create_issue.call_args.kwargs
-        assert "GE-35" in call_kwargs["description"]
-        assert "#42" in call_kwargs["description"]
+        (submitted,) = self._submitted(mock_client)
+        assert "GE-35" in submitted["description"]
+        assert "#42" in submitted["description"]
 
     def test_caps_at_max_tasks(self, mock_client: MagicMock) -> None:
         findings = [Finding("HIGH", f"f{i}.py:1", f"Bug {i}") for i in range(10)]
@@ -168,7 +187,7 @@ class TestCreateTasks:
         keys = create_tasks(mock_client, "GE-35", findings)
 
         assert len(keys) == 3  # MAX_TASKS
-        assert mock_client.create_issue.call_count == 3
+        assert len(self._submitted(mock_client)) == 3
 
     def test_includes_critical_severity(self, mock_client: MagicMock) -> None:
         findings = [Finding("CRITICAL", "db.py:99", "Hardcoded creds")]
@@ -187,26 +206,127 @@ class TestCreateTasks:
         keys = create_tasks(mock_client, "GE-35", findings)
 
         assert keys == []
-        mock_client.create_issue.assert_not_called()
+        mock_client.create_issues_bulk.assert_not_called()
 
     def test_handles_api_error_gracefully(self) -> None:
-        from src.sejfa.integrations.jira_client import JiraAPIError
+        """Items Jira rejects are skipped; the others are still created."""
+        client = MagicMock()
+        client.create_issues_bulk.return_value = BulkCreateResult(
+            issues={1: MagicMock(key="GE-201")},
+            errors=[BulkCreateError(0, "summary: too long", 400)],
+        )
+
+        findings = [Finding("HIGH", "a.py:1", "Bug"), Finding("HIGH", "b.py:2", "Bug")]
+        keys = create_tasks(client, "GE-35", findings)
+
+        assert keys == ["GE-201"]
+
+    def test_stops_when_circuit_open(self) -> None:
+        """An open circuit breaker skips task creation."""
+        from src.sejfa.integrations.jira_client import CircuitOpenError
 
         client = MagicMock()
-        client.create_issue.side_effect = JiraAPIError("Boom", status_code=500)
+        client.create_issues_bulk.side_effect = CircuitOpenError("Jira down")
 
-        findings = [Finding("HIGH", "a.py:1", "Bug")]
+        findings = [Finding("HIGH", f"f{i}.py:1", f"Bug {i}") for i in range(3)]
         keys = create_tasks(client, "GE-35", findings)
 
         assert keys == []
+        assert client.create_issues_bulk.call_count == 1
 
     def test_labels_include_jules_review(self, mock_client: MagicMock) -> None:
         findings = [Finding("HIGH", "x.py:1", "Issue")]
         create_tasks(mock_client, "GE-35", findings)
 
-        call_kwargs = mock_client.create_issue.call_args.kwargs
-        assert "jules-review" in call_kwargs["labels"]
-        assert "automated" in call_kwargs["labels"]
+        (submitted,) = self._submitted(mock_client)
+        assert "jules-review" in submitted["labels"]
+        assert "automated" in submitted["labels"]
+        assert findings[0].label in submitted["labels"]
+
+    def test_skips_findings_with_open_tasks(self, mock_client: MagicMock) -> None:
+        """All fingerprints are checked in one query; only new ones are created."""
+        findings = [Finding("HIGH", f"f{i}.py:1", f"Bug {i}") for i in range(5)]
+        mock_client.iter_issues.return_value = [
+            JiraIssue("GE-1", "", "Task", "To Do", fields={"labels": [f.label]})
+            for f in findings[:3]
+        ]
+
+        keys = create_tasks(mock_client, "GE-35", findings)
+
+        mock_client.iter_issues.assert_called_once()
+        jql = mock_client.iter_issues.call_args.args[0]
+        assert all(f.label in jql for f in findings)
+        assert "statusCategory != Done" in jql
+        assert len(keys) == 2
+        assert [s["summary"] for s in self._submitted(mock_client)] == [
+            findings[3].summary,
+            findings[4].summary,
+        ]
+
+    def test_all_known_findings_cost_no_create(self, mock_client: MagicMock) -> None:
+        findings = [Finding("HIGH", "a.py:1", "Bug")]
+        mock_client.iter_issues.return_value = [
+            JiraIssue(
+                "GE-1", "", "Task", "To Do", fields={"labels": [findings[0].label]}
+            )
+        ]
+
+        assert create_tasks(mock_client, "GE-35", findings) == []
+        mock_client.create_issues_bulk.assert_not_called()
+
+    def test_duplicates_within_review_created_once(
+        self, mock_client: MagicMock
+    ) -> None:
+        findings = [Finding("HIGH", "a.py:1", "Bug"), Finding("HIGH", "a.py:9", "Bug")]
+
+        create_tasks(mock_client, "GE-35", findings)
+
+        assert len(self._submitted(mock_client)) == 1
+
+    def test_failed_duplicate_check_creates_nothing(
+        self, mock_client: MagicMock
+    ) -> None:
+        """Without the duplicate check a rerun could duplicate every task."""
+        mock_client.iter_issues.side_effect = JiraAPIError("bad JQL", 400)
+        findings = [Finding("HIGH", "a.py:1", "Bug")]
+
+        assert create_tasks(mock_client, "GE-35", findings) == []
+        mock_client.create_issues_bulk.assert_not_called()
+
+
+class TestFingerprint:
+    """Tests for the finding fingerprint used for deduplication."""
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            Finding("high", "./src/app.py:40", "sql  injection in login."),
+            Finding("HIGH", "`src\\app.py#L12-L14`", "**SQL injection** in login"),
+            Finding("HIGH", "src/app.py:12:5", "SQL injection in login"),
+        ],
+    )
+    def test_stable_across_formatting(self, other: Finding) -> None:
+        finding = Finding("HIGH", "src/app.py:12", "SQL injection in login")
+        assert finding.fingerprint == other.fingerprint
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            Finding("MEDIUM", "src/app.py:12", "SQL injection in login"),
+            Finding("HIGH", "src/auth.py:12", "SQL injection in login"),
+            Finding("HIGH", "src/app.py:12", "XSS in login"),
+        ],
+    )
+    def test_differs_per_finding(self, other: Finding) -> None:
+        finding = Finding("HIGH", "src/app.py:12", "SQL injection in login")
+        assert finding.fingerprint != other.fingerprint
+
+    def test_label_and_body(self) -> None:
+        finding = Finding("HIGH", "a.py:1", "Bug")
+
+        assert finding.label == f"jules-fp-{finding.fingerprint}"
+        assert len(finding.fingerprint) == 16
+        assert f"Fingerprint: {finding.fingerprint}" in finding.body()
 
 
 class TestAddLowFindingsAsComment:
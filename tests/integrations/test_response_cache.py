@@ -0,0 +1,299 @@
+"""Tests for the Jira response cache and its use in JiraClient."""
+
+import http.client
+import json
+
+import pytest
+
+from src.sejfa.integrations.http_pool import PooledResponse
+from src.sejfa.integrations.jira_client import (
+    JiraAPIError,
+    JiraClient,
+    JiraConfig,
+    get_jira_client,
+)
+from src.sejfa.integrations.response_cache import (
+    CacheBackend,
+    CachedResponse,
+    MemoryCacheBackend,
+    ResponseCache,
+    SqliteCacheBackend,
+)
+from src.sejfa.integrations.retry import RetryPolicy
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _headers(**values: str) -> http.client.HTTPMessage:
+    message = http.client.HTTPMessage()
+    for name, value in values.items():
+        message[name.replace("_", "-")] = value
+    return message
+
+
+class _EtagPool:
+    """Serves issues with ETags, answering 304 to a matching If-None-Match."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {}
+        self.calls: list[tuple[str, str, dict]] = []
+
+    def request(self, method, url, body=None, headers=None):
+        path = url.split("/rest/api/3/", 1)[1]
+        self.calls.append((method, path, dict(headers or {})))
+        if method == "POST" and path == "issue":
+            return PooledResponse(201, "Created", _headers(), b'{"key": "GE-2"}')
+        if method == "POST":
+            key = path.split("/")[1]
+            self.versions[key] = self.versions.get(key, 0) + 1
+            return PooledResponse(201, "Created", _headers(), b'{"id": "1"}')
+        if path.endswith("MISSING-1"):
+            return PooledResponse(404, "Not Found", _headers(), b"{}")
+
+        key = path.split("/")[-1]
+        etag = f'"{key}-v{self.versions.get(key, 0)}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return PooledResponse(304, "Not Modified", _headers(ETag=etag), b"")
+        payload = {
+            "key": key,
+            "fields": {
+                "summary": f"v{self.versions.get(key, 0)}",
+                "status": {"name": "To Do"},
+                "issuetype": {"name": "Task"},
+            },
+        }
+        return PooledResponse(
+            200, "OK", _headers(ETag=etag), json.dumps(payload).encode()
+        )
+
+    def close(self) -> None:
+        pass
+
+    def gets(self) -> int:
+        return sum(1 for method, _, _ in self.calls if method == "GET")
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def pool() -> _EtagPool:
+    return _EtagPool()
+
+
+@pytest.fixture
+def client(pool: _EtagPool, clock: _Clock) -> JiraClient:
+    config = JiraConfig(url="https://test.atlassian.net", email="e", api_token="t")
+    cache = ResponseCache(ttl=30, clock=clock)
+    return JiraClient(
+        config=config,
+        pool=pool,
+        cache=cache,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+
+class TestBackends:
+    """Tests shared by the memory and SQLite backends."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def backend(self, request, tmp_path):
+        if request.param == "memory":
+            return MemoryCacheBackend()
+        return SqliteCacheBackend(str(tmp_path / "cache.db"))
+
+    def test_set_get_and_len(self, backend) -> None:
+        entry = CachedResponse(body="{}", etag='"1"', stored_at=5.0)
+        backend.set("a", entry)
+
+        assert backend.get("a") == entry
+        assert backend.get("b") is None
+        assert len(backend) == 1
+
+    def test_delete_resource_only_touches_that_issue(self, backend) -> None:
+        """GE-1 and its sub-resources go; GE-10 stays."""
+        for key in ("x/issue/GE-1", "x/issue/GE-1/comment", "x/issue/GE-1?f=s"):
+            backend.set(key, CachedResponse(body="{}"))
+        backend.set("x/issue/GE-10", CachedResponse(body="{}"))
+
+        assert backend.delete_resource("x/issue/GE-1") == 3
+        assert backend.get("x/issue/GE-10") is not None
+        assert len(backend) == 1
+
+    def test_clear(self, backend) -> None:
+        backend.set("a", CachedResponse(body="{}"))
+        backend.clear()
+        assert len(backend) == 0
+
+
+class TestBackendSpecifics:
+    def test_incomplete_backend_fails_on_instantiation(self) -> None:
+        """A backend missing an override is rejected before it is used."""
+
+        class NoDelete(CacheBackend):
+            def get(self, key: str):
+                return None
+
+            def set(self, key: str, entry: CachedResponse) -> None:
+                pass
+
+            def clear(self) -> None:
+                pass
+
+            def __len__(self) -> int:
+                return 0
+
+        with pytest.raises(TypeError, match="delete_resource"):
+            NoDelete()
+
+    def test_memory_evicts_least_recently_used(self) -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", CachedResponse(body="a"))
+        backend.set("b", CachedResponse(body="b"))
+        backend.get("a")
+        backend.set("c", CachedResponse(body="c"))
+
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+
+    def test_sqlite_shared_between_instances(self, tmp_path) -> None:
+        """A second process (here: connection) sees the first one's entries."""
+        path = str(tmp_path / "cache.db")
+        SqliteCacheBackend(path).set("a", CachedResponse(body="{}", etag='"1"'))
+
+        assert SqliteCacheBackend(path).get("a").etag == '"1"'
+
+
+class TestCachedClient:
+    """Tests for cached reads through JiraClient."""
+
+    def test_fresh_entry_served_without_request(
+        self, client: JiraClient, pool: _EtagPool
+    ) -> None:
+        first = client.get_issue("GE-1")
+        second = client.get_issue("GE-1")
+
+        assert first.summary == second.summary == "v0"
+        assert pool.gets() == 1
+        assert client.stats()["cache"]["hits"] == 1
+
+    def test_stale_entry_revalidated_with_etag(
+        self, client: JiraClient, pool: _EtagPool, clock: _Clock
+    ) -> None:
+        """After the TTL a conditional GET is sent and a 304 reuses the body."""
+        client.get_issue("GE-1")
+        clock.now += 31
+        issue = client.get_issue("GE-1")
+
+        assert issue.summary == "v0"
+        assert pool.calls[-1][2]["If-None-Match"] == '"GE-1-v0"'
+        assert client.stats()["cache"]["revalidated"] == 1
+
+        # The 304 restarted the TTL
+        client.get_issue("GE-1")
+        assert pool.gets() == 2
+
+    def test_changed_issue_refetched(
+        self, client: JiraClient, pool: _EtagPool, clock: _Clock
+    ) -> None:
+        client.get_issue("GE-1")
+        pool.versions["GE-1"] = 1  # changed by someone else
+        clock.now += 31
+
+        assert client.get_issue("GE-1").summary == "v1"
+        assert client.stats()["cache"]["misses"] == 2
+
+    def test_write_invalidates_that_issue_only(
+        self, client: JiraClient, pool: _EtagPool
+    ) -> None:
+        client.get_issue("GE-1")
+        client.get_issue("GE-10")
+        client.add_comment("GE-1", "Done")
+
+        assert client.get_issue("GE-1").summary == "v1"
+        client.get_issue("GE-10")
+        assert pool.gets() == 3
+        assert client.stats()["cache"]["invalidations"] == 1
+
+    def test_failed_write_still_invalidates(
+        self, client: JiraClient, pool: _EtagPool
+    ) -> None:
+        client.get_issue("GE-1")
+        pool.request = lambda *args, **kwargs: PooledResponse(
+            500, "Error", _headers(), b""
+        )
+
+        with pytest.raises(JiraAPIError):
+            client.add_comment("GE-1", "Done")
+
+        assert client.cache.stats()["entries"] == 0
+
+    def test_creating_subtask_invalidates_parent(
+        self, client: JiraClient, pool: _EtagPool
+    ) -> None:
+        client.get_issue("GE-1")
+        client.create_issue("GE", "Sub", parent_key="GE-1")
+        client.get_issue("GE-1")
+
+        assert [path for _, path, _ in pool.calls].count("issue/GE-1") == 2
+
+    def test_search_does_not_invalidate(self, client: JiraClient) -> None:
+        """Read-only POSTs such as search leave the cache alone."""
+        client.get_issue("GE-1")
+        client.pool.request = lambda *args, **kwargs: PooledResponse(
+            200, "OK", _headers(), b'{"issues": [], "total": 0}'
+        )
+
+        assert client.search_issues("project = GE", fields=["summary"]) == []
+        assert client.cache.stats()["entries"] == 1
+
+    def test_errors_not_cached(self, client: JiraClient, pool: _EtagPool) -> None:
+        for _ in range(2):
+            with pytest.raises(JiraAPIError):
+                client.get_issue("MISSING-1")
+
+        assert pool.gets() == 2
+
+    def test_without_cache_every_read_hits_jira(self, pool: _EtagPool) -> None:
+        config = JiraConfig(url="https://test.atlassian.net", email="e", api_token="t")
+        client = JiraClient(config=config, pool=pool)
+        client.get_issue("GE-1")
+        client.get_issue("GE-1")
+
+        assert pool.gets() == 2
+        assert "cache" not in client.stats()
+
+
+class TestGetJiraClient:
+    def test_revalidates_every_read_by_default(self, monkeypatch) -> None:
+        """Without JIRA_CACHE_TTL no read is served without asking Jira."""
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_EMAIL", "e")
+        monkeypatch.setenv("JIRA_API_TOKEN", "t")
+        monkeypatch.delenv("JIRA_CACHE_PATH", raising=False)
+        monkeypatch.delenv("JIRA_CACHE_TTL", raising=False)
+
+        client = get_jira_client()
+
+        assert isinstance(client.cache.backend, MemoryCacheBackend)
+        assert client.cache.ttl == 0
+
+    def test_sqlite_cache_from_env(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_EMAIL", "e")
+        monkeypatch.setenv("JIRA_API_TOKEN", "t")
+        monkeypatch.setenv("JIRA_CACHE_PATH", str(tmp_path / "jira.db"))
+        monkeypatch.setenv("JIRA_CACHE_TTL", "5")
+
+        client = get_jira_client()
+
+        assert isinstance(client.cache.backend, SqliteCacheBackend)
+        assert client.cache.ttl == 5
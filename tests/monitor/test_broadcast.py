@@ -0,0 +1,132 @@
+"""Tests for broadcast coalescing of monitor deltas."""
+
+import time
+
+from src.sejfa.monitor.broadcast import BroadcastCoalescer, merge_deltas, split_delta
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+class TestMergeDeltas:
+    """Tests for merging consecutive deltas."""
+
+    def test_merge_spans_both_versions(self) -> None:
+        """Merged delta covers older base_version through newer version."""
+        service = MonitorService()
+        first = service.update_node("jira", "active", "one")
+        second = service.update_node("claude", "active", "two")
+
+        merged = merge_deltas(first, second)
+
+        assert merged["base_version"] == 0
+        assert merged["version"] == 2
+        assert merged["current_node"] == "claude"
+        assert set(merged["nodes"]) == {"jira", "claude"}
+        assert merged["nodes"]["jira"]["active"] is False
+        assert [e["message"] for e in merged["events"]] == ["one", "two"]
+
+    def test_merge_out_of_order(self) -> None:
+        """Deltas submitted out of order are merged in version order."""
+        service = MonitorService()
+        first = service.update_node("jira", "active", "one")
+        second = service.update_node("jira", "active", "two")
+
+        merged = merge_deltas(second, first)
+
+        assert merged["base_version"] == 0
+        assert [e["message"] for e in merged["events"]] == ["one", "two"]
+
+
+class TestSplitDelta:
+    """Tests for splitting deltas into channel messages."""
+
+    def test_node_delta_splits_into_events_and_nodes(self) -> None:
+        """A transition yields an events message and one message per node."""
+        service = MonitorService()
+        service.update_node("jira", "active", "one")
+        delta = service.update_node("claude", "active", "two")
+
+        messages = {channel: payload for channel, _, payload in split_delta(delta)}
+
+        assert set(messages) == {"events", "node:claude", "node:jira"}
+        assert messages["node:claude"]["active"] is True
+        assert [e["message"] for e in messages["node:claude"]["events"]] == ["two"]
+        assert messages["node:jira"]["events"] == []
+        assert messages["events"]["version"] == delta["version"]
+
+    def test_task_delta_only_task_channel(self) -> None:
+        """A task change yields only a task message."""
+        delta = MonitorService().set_task_info(title="T")
+
+        assert [(c, e) for c, e, _ in split_delta(delta)] == [("task", "task_update")]
+
+
+class TestBroadcastCoalescer:
+    """Tests for BroadcastCoalescer."""
+
+    def test_zero_window_emits_each_update(self) -> None:
+        """With coalescing disabled every delta is emitted."""
+        emitted = []
+        coalescer = BroadcastCoalescer(emitted.append, window=0)
+        service = MonitorService()
+
+        coalescer.submit(service.update_node("jira", "active"))
+        coalescer.submit(service.update_node("claude", "active"))
+
+        assert len(emitted) == 2
+
+    def test_burst_is_merged_into_one_emit(self) -> None:
+        """Updates within the window are emitted as a single merged delta."""
+        emitted = []
+        coalescer = BroadcastCoalescer(emitted.append, window=0.05)
+        service = MonitorService()
+
+        for i in range(10):
+            coalescer.submit(service.update_node("claude", "active", f"line {i}"))
+        assert emitted == []
+
+        time.sleep(0.2)
+
+        assert len(emitted) == 1
+        assert emitted[0]["base_version"] == 0
+        assert emitted[0]["version"] == 10
+        assert len(emitted[0]["events"]) == 10
+        assert coalescer.stats() == {
+            "updates_in": 10,
+            "emits_out": 1,
+            "forced_flushes": 0,
+            "pending": 0,
+        }
+
+    def test_max_batch_forces_emit(self) -> None:
+        """Reaching max_batch emits without waiting for the window."""
+        emitted = []
+        coalescer = BroadcastCoalescer(emitted.append, window=10, max_batch=3)
+        service = MonitorService()
+
+        for _ in range(3):
+            coalescer.submit(service.update_node("claude", "active"))
+
+        assert len(emitted) == 1
+        assert coalescer.stats()["forced_flushes"] == 1
+
+    def test_task_status_change_flushes(self) -> None:
+        """A task status change is an important transition and flushes."""
+        emitted = []
+        coalescer = BroadcastCoalescer(emitted.append, window=10)
+        service = MonitorService()
+
+        coalescer.submit(service.update_node("claude", "active"))
+        coalescer.submit(service.set_task_info(status="completed"))
+
+        assert len(emitted) == 1
+        assert emitted[0]["task_info"] == {"status": "completed"}
+        assert len(emitted[0]["events"]) == 1
+
+    def test_flush_with_nothing_pending(self) -> None:
+        """Flushing an empty coalescer emits nothing."""
+        emitted = []
+        coalescer = BroadcastCoalescer(emitted.append)
+
+        coalescer.flush()
+
+        assert emitted == []
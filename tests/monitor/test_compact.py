@@ -0,0 +1,77 @@
+"""Tests for compact monitor message encodings."""
+
+import pytest
+
+from src.sejfa.monitor.compact import (
+    compact_message,
+    encode_message,
+    epoch_ms,
+    negotiate,
+)
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+class TestCompactMessage:
+    """Tests for the compact message form."""
+
+    def test_snapshot(self) -> None:
+        """Snapshots intern node IDs and convert timestamps to epoch ms."""
+        service = MonitorService(session_id="s1")
+        service.update_node("jules", "active", "review")
+
+        compact = compact_message(service.get_state())
+
+        assert (compact["v"], compact["s"], compact["c"]) == (1, "s1", 3)
+        jules = next(node for node in compact["n"] if node[0] == 3)
+        assert jules[1] == 1 and jules[3] == "review"
+        assert isinstance(jules[2], int)
+        assert compact["e"][0][1:] == [3, "review"]
+
+    def test_delta_keeps_base_version(self) -> None:
+        """Deltas carry base version and only the changed nodes."""
+        service = MonitorService()
+        delta = service.update_node("jira", "active", "start")
+
+        compact = compact_message(delta)
+
+        assert (compact["b"], compact["v"]) == (0, 1)
+        assert [node[0] for node in compact["n"]] == [0]
+
+    def test_unknown_node_kept_as_string(self) -> None:
+        """Node IDs without a code are sent verbatim."""
+        compact = compact_message({"version": 1, "current_node": "other"})
+
+        assert compact["c"] == "other"
+
+    def test_epoch_ms(self) -> None:
+        """Monitor timestamps convert to UTC epoch milliseconds."""
+        assert epoch_ms("1970-01-01T00:00:01.500000Z") == 1500
+        assert epoch_ms(None) is None
+        assert epoch_ms("not a date") is None
+
+
+class TestEncodeMessage:
+    """Tests for encoding and negotiation."""
+
+    def test_json_and_text_pass_through(self) -> None:
+        """JSON encoding and pre-serialized text are left unchanged."""
+        payload = {"version": 1}
+
+        assert encode_message(payload, "json") is payload
+        assert encode_message("text", "compact") == "text"
+
+    def test_msgpack_round_trip(self) -> None:
+        """msgpack output unpacks to the compact form."""
+        msgpack = pytest.importorskip("msgpack")
+        payload = {"version": 2, "current_node": "github"}
+
+        packed = encode_message(payload, "msgpack")
+
+        assert isinstance(packed, bytes)
+        assert msgpack.unpackb(packed) == compact_message(payload)
+
+    def test_negotiate(self) -> None:
+        """Only supported encodings are accepted."""
+        assert negotiate("compact") == "compact"
+        assert negotiate("msgpack", ("json", "compact")) == "json"
+        assert negotiate(None) == "json"
@@ -0,0 +1,184 @@
+"""Tests for the durable monitor event store."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.sejfa.monitor.event_store import (
+    EventStore,
+    EventStoreLockedError,
+    open_event_store,
+)
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+def _event(i: int, node: str = "claude") -> dict:
+    return {"timestamp": "2026-01-01T00:00:00Z", "node": node, "message": f"e{i}"}
+
+
+@pytest.fixture
+def store_dir(tmp_path: Path) -> str:
+    """Directory for a fresh event store."""
+    return str(tmp_path / "events")
+
+
+class TestEventStore:
+    """Tests for appending and paging events."""
+
+    def test_sequence_numbers_start_at_one(self, store_dir: str) -> None:
+        """Appends are numbered consecutively from 1."""
+        store = EventStore(store_dir)
+
+        seqs = [store.append(_event(i)) for i in range(3)]
+
+        assert seqs == [1, 2, 3]
+        assert store.last_seq == 3
+        assert store.get(2)["message"] == "e1"
+        assert store.get(4) is None
+        store.close()
+
+    def test_read_pages_by_sequence(self, store_dir: str) -> None:
+        """read() returns events after a cursor, up to a limit."""
+        store = EventStore(store_dir)
+        for i in range(10):
+            store.append(_event(i))
+
+        page = store.read(after_seq=3, limit=4)
+
+        assert [r["seq"] for r in page] == [4, 5, 6, 7]
+        store.close()
+
+    def test_read_filters_by_task(self, store_dir: str) -> None:
+        """Events can be paged per task."""
+        store = EventStore(store_dir)
+        for i in range(6):
+            store.append(_event(i), task="GE-1" if i % 2 else "GE-2")
+
+        page = store.read(task="GE-1", after_seq=2, limit=2)
+
+        assert [r["seq"] for r in page] == [4, 6]
+        assert store.tasks() == {"GE-2": 3, "GE-1": 3}
+        assert store.read(task="unknown") == []
+        store.close()
+
+    def test_read_since_timestamp(self, store_dir: str) -> None:
+        """Events can be located by timestamp."""
+        store = EventStore(store_dir)
+        for i in range(3):
+            store.append(_event(i))
+        cutoff = store.get(3)["ts"] + 1
+        time.sleep(0.01)
+        store.append(_event(3))
+
+        page = store.read(since_ms=cutoff)
+
+        assert [r["seq"] for r in page] == [4]
+        store.close()
+
+    def test_segments_roll_and_reload(self, store_dir: str) -> None:
+        """Small segments roll over, get indexed and reload after restart."""
+        store = EventStore(store_dir, segment_bytes=300)
+        for i in range(20):
+            store.append(_event(i), task="GE-5")
+        store.close()
+
+        assert any(name.endswith(".idx") for name in os.listdir(store_dir))
+
+        reopened = EventStore(store_dir, segment_bytes=300)
+        assert reopened.last_seq == 20
+        assert [r["message"] for r in reopened.read(after_seq=17)] == [
+            "e17",
+            "e18",
+            "e19",
+        ]
+        assert reopened.tasks() == {"GE-5": 20}
+        assert reopened.append(_event(20)) == 21
+        reopened.close()
+
+    def test_torn_record_is_dropped_on_reload(self, store_dir: str) -> None:
+        """A partial trailing record from a crash is truncated on open."""
+        store = EventStore(store_dir)
+        store.append(_event(0))
+        store.close()
+        segment = os.path.join(store_dir, sorted(os.listdir(store_dir))[0])
+        with open(segment, "ab") as f:
+            f.write(b'{"seq":2,"ts":')
+
+        reopened = EventStore(store_dir)
+
+        assert reopened.last_seq == 1
+        assert reopened.append(_event(1)) == 2
+        assert reopened.get(2)["message"] == "e1"
+        reopened.close()
+
+    def test_corrupt_line_is_skipped_and_counted(self, store_dir: str) -> None:
+        """A bad complete line keeps its seq but does not break the store."""
+        store = EventStore(store_dir)
+        store.append(_event(0))
+        store.close()
+        (segment,) = Path(store_dir).glob("*.log")
+        with open(segment, "ab") as f:
+            f.write(b"\x00garbage\n")
+        store = EventStore(store_dir)
+        store.append(_event(2))
+        store.close()
+
+        reopened = EventStore(store_dir)
+
+        assert reopened.corrupt_records == 1
+        assert reopened.get(2) is None
+        assert [r["message"] for r in reopened.read()] == ["e0", "e2"]
+        assert reopened.get(3)["seq"] == 3
+        reopened.close()
+
+    def test_second_writer_is_refused(self, store_dir: str) -> None:
+        """Only one process (here: open store) may write to a directory."""
+        store = EventStore(store_dir)
+
+        with pytest.raises(EventStoreLockedError, match="in this process"):
+            EventStore(store_dir)
+
+        store.close()
+        EventStore(store_dir).close()
+
+    def test_open_event_store_shares_one_store(self, store_dir: str) -> None:
+        """Callers in one process get the same open store."""
+        store = open_event_store(store_dir)
+
+        assert open_event_store(store_dir) is store
+        store.close()
+        store.close()  # closing twice (e.g. again at exit) is harmless
+        reopened = open_event_store(store_dir)
+        assert reopened is not store
+        reopened.close()
+
+    def test_fsync_is_batched(self, store_dir: str) -> None:
+        """Appends are synced in batches, not one by one."""
+        store = EventStore(store_dir, fsync_every=5, fsync_interval=3600)
+        for i in range(4):
+            store.append(_event(i))
+
+        assert store._unsynced == 4
+        store.append(_event(4))
+        assert store._unsynced == 0
+        store.close()
+
+
+class TestMonitorServiceEventStore:
+    """Tests for MonitorService writing through to the event store."""
+
+    def test_events_keep_history_beyond_log(self, store_dir: str) -> None:
+        """Events rolled out of the in-memory log stay in the store."""
+        store = EventStore(store_dir)
+        service = MonitorService(max_events=5, event_store=store)
+        service.set_task_info(title="GE-42")
+
+        for i in range(20):
+            delta = service.update_node("claude", "active", f"line {i}")
+
+        assert delta["events"][0]["seq"] == 20
+        assert len(service.get_state()["event_log"]) == 5
+        assert len(store.read(task="GE-42", limit=100)) == 20
+        store.close()
@@ -0,0 +1,148 @@
+"""Tests for incremental workflow timing metrics."""
+
+import pytest
+
+from src.sejfa.monitor.metrics import StreamingHistogram, WorkflowMetrics
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+class TestStreamingHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_empty_summary(self) -> None:
+        """An empty histogram only reports its count."""
+        histogram = StreamingHistogram()
+
+        assert histogram.summary() == {"count": 0}
+        assert histogram.quantile(0.5) is None
+
+    def test_summary_statistics(self) -> None:
+        """Count, sum, min, max and mean are exact."""
+        histogram = StreamingHistogram()
+        for value in (1.0, 2.0, 3.0, 4.0):
+            histogram.observe(value)
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 4
+        assert summary["sum"] == 10.0
+        assert summary["min"] == 1.0
+        assert summary["max"] == 4.0
+        assert summary["mean"] == 2.5
+
+    def test_quantiles_stay_within_observed_range(self) -> None:
+        """Quantile estimates are bounded by min and max."""
+        histogram = StreamingHistogram()
+        for value in range(1, 101):
+            histogram.observe(value / 10)
+
+        p50 = histogram.quantile(0.5)
+        p99 = histogram.quantile(0.99)
+
+        assert 2.5 <= p50 <= 10.0
+        assert p50 <= p99 <= 10.0
+
+
+class TestWorkflowMetrics:
+    """Tests for dwell and cycle time tracking."""
+
+    def test_dwell_time_per_node(self) -> None:
+        """Entering the next node closes the previous node's dwell."""
+        metrics = WorkflowMetrics()
+        metrics.observe("jira", True, at=0.0)
+        metrics.observe("claude", True, at=2.0)
+        metrics.observe("github", True, at=7.0)
+
+        dwell = metrics.to_dict()["dwell_seconds"]
+
+        assert dwell["jira"]["sum"] == pytest.approx(2.0)
+        assert dwell["claude"]["sum"] == pytest.approx(5.0)
+        assert dwell["github"] == {"count": 0}
+
+    def test_repeated_activation_continues_dwell(self) -> None:
+        """Re-activating the current node does not split its dwell."""
+        metrics = WorkflowMetrics()
+        metrics.observe("claude", True, at=0.0)
+        metrics.observe("claude", True, at=1.0)
+        metrics.observe("claude", False, at=3.0)
+
+        data = metrics.to_dict()
+
+        assert data["dwell_seconds"]["claude"]["count"] == 1
+        assert data["dwell_seconds"]["claude"]["sum"] == pytest.approx(3.0)
+        assert data["transitions"]["claude"] == 1
+        assert data["current_node"] is None
+
+    def test_cycle_time_between_jira_entries(self) -> None:
+        """A cycle is measured from one jira entry to the next."""
+        metrics = WorkflowMetrics()
+        metrics.observe("jira", True, at=0.0)
+        metrics.observe("actions", True, at=30.0)
+        metrics.observe("jira", True, at=45.0)
+
+        cycle = metrics.to_dict()["cycle_seconds"]
+
+        assert cycle["count"] == 1
+        assert cycle["sum"] == pytest.approx(45.0)
+
+    def test_reset_drops_open_intervals(self) -> None:
+        """After reset the next jira entry starts a fresh cycle."""
+        metrics = WorkflowMetrics()
+        metrics.observe("jira", True, at=0.0)
+        metrics.reset()
+        metrics.observe("jira", True, at=100.0)
+
+        data = metrics.to_dict()
+
+        assert data["cycle_seconds"] == {"count": 0}
+        assert data["dwell_seconds"]["jira"] == {"count": 0}
+        assert data["transitions"]["jira"] == 2
+
+    def test_prometheus_buckets_are_cumulative(self) -> None:
+        """Bucket counts in the exposition text are cumulative."""
+        metrics = WorkflowMetrics()
+        metrics.observe("jira", True, at=0.0)
+        metrics.observe("claude", True, at=0.05)
+        metrics.observe("jira", True, at=20.05)
+
+        text = metrics.to_prometheus()
+
+        assert 'sejfa_monitor_node_dwell_seconds_bucket{node="jira",le="0.1"} 1' in (
+            text
+        )
+        assert 'sejfa_monitor_node_dwell_seconds_bucket{node="claude",le="10.0"} 0' in (
+            text
+        )
+        assert 'sejfa_monitor_node_dwell_seconds_bucket{node="claude",le="+Inf"} 1' in (
+            text
+        )
+        assert "sejfa_monitor_cycle_seconds_count 1" in text
+
+
+class TestServiceMetrics:
+    """Tests for metrics fed by MonitorService updates."""
+
+    def test_updates_and_batches_feed_metrics(self) -> None:
+        """Single updates and batches both count transitions."""
+        service = MonitorService()
+        service.update_node("jira", "active")
+        service.apply_batch(
+            [
+                {"node": "claude", "state": "active"},
+                {"node": "github", "state": "active"},
+            ]
+        )
+
+        data = service.metrics.to_dict()
+
+        assert data["transitions"]["jira"] == 1
+        assert data["transitions"]["claude"] == 1
+        assert data["current_node"] == "github"
+        assert data["dwell_seconds"]["jira"]["count"] == 1
+
+    def test_invalid_node_not_observed(self) -> None:
+        """Rejected updates do not touch the metrics."""
+        service = MonitorService()
+        service.update_node("unknown", "active")
+
+        assert sum(service.metrics.to_dict()["transitions"].values()) == 0
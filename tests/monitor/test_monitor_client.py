@@ -0,0 +1,228 @@
+"""Tests for the native Python monitor client."""
+
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.sejfa.monitor.monitor_client import (
+    MonitorClient,
+    NodeMatcher,
+    batch_url,
+    main,
+    monitor_lines,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Records NDJSON batches and the client port of each request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.server.started = True
+        time.sleep(self.server.delay)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        updates = [json.loads(line) for line in body.decode().splitlines()]
+        self.server.batches.append((self.path, self.client_address[1], updates))
+        if self.server.drop_responses:
+            self.close_connection = True
+            return
+        payload = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # Close the keep-alive connection without announcing it
+        self.close_connection = self.server.close_idle
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP/1.1 server standing in for the monitor API."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.batches = []
+    server.started = False
+    server.delay = 0.0
+    server.drop_responses = False
+    server.close_idle = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/api/monitor/state"
+
+
+class TestNodeMatcher:
+    """Tests for transition detection."""
+
+    @pytest.mark.parametrize(
+        ("line", "node"),
+        [
+            ("git push origin main", "github"),
+            ("Running tests in tests/", "actions"),
+            ("Editing app.py", "claude"),
+            ("Code review started", "jules"),
+            ("Fetching GE-12 from Jira", "jira"),
+            ("nothing interesting", None),
+        ],
+    )
+    def test_detects_node(self, line: str, node: str | None) -> None:
+        """Each keyword family maps to its node."""
+        assert NodeMatcher().detect(line) == node
+
+    def test_priority_follows_cascade(self) -> None:
+        """When several nodes match, the earlier one in the cascade wins."""
+        matcher = NodeMatcher()
+
+        assert matcher.detect("Reading file before Editing it") == "claude"
+        assert matcher.detect("Writing test for review") == "actions"
+        assert matcher.detect("Editing then git commit") == "github"
+
+
+class TestBatchUrl:
+    """Tests for deriving the batch endpoint."""
+
+    def test_state_url(self) -> None:
+        assert (
+            batch_url("http://h:5000/api/monitor/state")
+            == "http://h:5000/api/monitor/batch"
+        )
+
+    def test_base_url(self) -> None:
+        assert batch_url("http://h/api/monitor/") == "http://h/api/monitor/batch"
+
+
+class TestMonitorClient:
+    """Tests for queued, batched delivery."""
+
+    def test_batches_in_order_over_one_connection(self, stub_server) -> None:
+        """Transitions arrive in order, batched, over a single connection."""
+        client = MonitorClient(_url(stub_server), batch_size=10)
+        for i in range(25):
+            client.send("claude", f"line {i}")
+        client.close()
+
+        messages = [u["message"] for _, _, batch in stub_server.batches for u in batch]
+        assert messages == [f"line {i}" for i in range(25)]
+        assert {path for path, _, _ in stub_server.batches} == {"/api/monitor/batch"}
+        assert len({port for _, port, _ in stub_server.batches}) == 1
+        assert len(stub_server.batches) < 25
+        assert client.stats()["sent"] == 25
+
+    def test_session_sent_as_query_parameter(self, stub_server) -> None:
+        """A session ID is added to the batch URL."""
+        client = MonitorClient(_url(stub_server), session="loop 7")
+        client.send("jira", "Fetching issue")
+        client.close()
+
+        assert stub_server.batches[0][0] == "/api/monitor/batch?session=loop%207"
+
+    def test_full_queue_drops_oldest(self, stub_server) -> None:
+        """Backpressure drops the oldest transitions, keeping the newest."""
+        client = MonitorClient(_url(stub_server), max_queue=3, autostart=False)
+        for i in range(5):
+            client.send("jira", f"line {i}")
+        client.start()
+        client.close()
+
+        messages = [u["message"] for _, _, batch in stub_server.batches for u in batch]
+        assert messages == ["line 2", "line 3", "line 4"]
+        assert client.stats()["dropped"] == 2
+
+    def test_close_timeout_leaves_connection_to_sender(self, stub_server) -> None:
+        """A close() that times out mid-request does not break the request."""
+        stub_server.delay = 0.3
+        client = MonitorClient(_url(stub_server), batch_size=1, flush_interval=0)
+        client.send("claude", "slow")
+        client.send("github", "after close")
+        while not stub_server.started:
+            threading.Event().wait(0.01)
+
+        client.close(timeout=0.01)
+        client._thread.join()
+
+        assert client.stats()["sent"] == 2
+        assert client.stats()["failed"] == 0
+        assert client.stats()["connections"] == 1
+        assert client._conn is None
+
+    def test_batch_lost_after_sending_is_not_resent(self, stub_server) -> None:
+        """A batch the server received is never posted twice."""
+        stub_server.drop_responses = True
+        client = MonitorClient(_url(stub_server), flush_interval=0)
+        client.send("jira", "Fetching")
+        client.close()
+
+        assert len(stub_server.batches) == 1
+        assert client.stats()["failed"] == 1
+
+    def test_closed_keep_alive_connection_is_reopened(self, stub_server) -> None:
+        """A batch after the server closed the idle connection still arrives."""
+        stub_server.close_idle = True
+        client = MonitorClient(_url(stub_server), flush_interval=0)
+        client.send("jira", "Fetching")
+        while client.stats()["requests"] < 1:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        client.send("claude", "Writing")
+        client.close()
+
+        assert [batch[0]["node"] for _, _, batch in stub_server.batches] == [
+            "jira",
+            "claude",
+        ]
+        assert client.stats()["sent"] == 2
+        assert client.stats()["connections"] == 2
+
+    def test_unreachable_server_counts_failures(self) -> None:
+        """Delivery failures never raise into the agent's output path."""
+        client = MonitorClient("http://127.0.0.1:9/api/monitor", timeout=0.5)
+        client.send("jira", "Fetching")
+        client.close()
+
+        assert client.stats()["failed"] == 1
+
+    def test_monitor_lines_echoes_and_detects(self, stub_server) -> None:
+        """Every line is echoed; only matching lines are sent."""
+        client = MonitorClient(_url(stub_server))
+        output = io.StringIO()
+
+        monitor_lines(
+            ["Reading spec\n", "\n", "plain text\n", "git push\n"],
+            client,
+            NodeMatcher(),
+            output,
+        )
+        client.close()
+
+        assert output.getvalue() == "Reading spec\n\nplain text\ngit push\n"
+        nodes = [u["node"] for _, _, batch in stub_server.batches for u in batch]
+        assert nodes == ["jira", "github"]
+
+
+class TestMain:
+    """Tests for the CLI wrapper."""
+
+    def test_runs_command_and_returns_exit_code(self, stub_server, capsys) -> None:
+        """The wrapped command's output is echoed and its exit code returned."""
+        script = "print('Editing app.py'); print('hello'); raise SystemExit(3)"
+
+        code = main(["--url", _url(stub_server), "--", sys.executable, "-c", script])
+
+        assert code == 3
+        assert "Editing app.py\nhello\n" in capsys.readouterr().out
+        nodes = [u["node"] for _, _, batch in stub_server.batches for u in batch]
+        assert nodes == ["claude"]
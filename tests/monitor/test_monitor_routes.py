@@ -0,0 +1,808 @@
+"""Tests for the monitoring REST API and Socket.IO broadcasts."""
+
+import json
+
+import pytest
+from flask import Flask
+from flask_socketio import SocketIO
+
+from src.sejfa.monitor import monitor_routes
+from src.sejfa.monitor.monitor_routes import (
+    create_monitor_blueprint,
+    init_socketio_events,
+)
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+@pytest.fixture
+def app_and_socketio() -> tuple[Flask, SocketIO]:
+    """Create a Flask app with the monitor blueprint and SocketIO."""
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    socketio = SocketIO(app)
+    service = MonitorService()
+    app.register_blueprint(
+        create_monitor_blueprint(service, socketio, coalesce_window=0)
+    )
+    init_socketio_events(resync_interval=0)
+    return app, socketio
+
+
+@pytest.fixture
+def client(app_and_socketio):
+    """Create an HTTP test client."""
+    app, _ = app_and_socketio
+    return app.test_client()
+
+
+@pytest.fixture
+def ws_client(app_and_socketio):
+    """Create a Socket.IO test client connected to /monitor."""
+    app, socketio = app_and_socketio
+    ws = socketio.test_client(app, namespace="/monitor")
+    yield ws
+    ws.disconnect(namespace="/monitor")
+
+
+class TestStateBroadcasts:
+    """Tests for delta and snapshot broadcasts."""
+
+    def test_connect_sends_snapshot(self, ws_client) -> None:
+        """A new client receives a full versioned snapshot."""
+        received = ws_client.get_received("/monitor")
+
+        assert [r["name"] for r in received] == ["state_update"]
+        snapshot = json.loads(received[0]["args"][0])
+        assert snapshot["version"] == 0
+        assert set(snapshot["nodes"]) == MonitorService.VALID_NODES
+
+    def test_state_post_broadcasts_delta(self, client, ws_client) -> None:
+        """POST /state emits a delta, not a full snapshot."""
+        ws_client.get_received("/monitor")
+
+        response = client.post(
+            "/api/monitor/state",
+            json={"node": "claude", "state": "active", "message": "Editing app.py"},
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["version"] == 1
+        received = ws_client.get_received("/monitor")
+        assert [r["name"] for r in received] == ["state_delta"]
+        delta = received[0]["args"][0]
+        assert delta["base_version"] == 0
+        assert list(delta["nodes"]) == ["claude"]
+        assert "event_log" not in delta
+
+    def test_task_post_broadcasts_task_diff(self, client, ws_client) -> None:
+        """POST /task emits only the changed task fields."""
+        ws_client.get_received("/monitor")
+
+        client.post("/api/monitor/task", json={"title": "GE-7"})
+
+        delta = ws_client.get_received("/monitor")[0]["args"][0]
+        assert delta["task_info"] == {"title": "GE-7"}
+        assert "nodes" not in delta
+
+    def test_request_state_sends_snapshot(self, client, ws_client) -> None:
+        """A client that detected a gap can request a fresh snapshot."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        ws_client.get_received("/monitor")
+
+        ws_client.emit("request_state", namespace="/monitor")
+
+        received = ws_client.get_received("/monitor")
+        assert received[0]["name"] == "state_update"
+        assert json.loads(received[0]["args"][0])["version"] == 1
+
+    def test_invalid_node_rejected(self, client) -> None:
+        """Unknown nodes return 400."""
+        response = client.post("/api/monitor/state", json={"node": "nope"})
+
+        assert response.status_code == 400
+
+
+class TestBroadcastStats:
+    """Tests for the coalescing metrics endpoint."""
+
+    def test_stats_count_updates_and_emits(self, client) -> None:
+        """Stats report updates received versus emits sent."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+
+        stats = client.get("/api/monitor/broadcast-stats").get_json()
+
+        assert stats["updates_in"] == 1
+        assert stats["emits_out"] == 1
+
+
+class TestBatchEndpoint:
+    """Tests for POST /api/monitor/batch."""
+
+    def test_json_array_broadcasts_once(self, client, ws_client) -> None:
+        """A JSON array batch is applied and broadcast as one delta."""
+        ws_client.get_received("/monitor")
+
+        response = client.post(
+            "/api/monitor/batch",
+            json=[
+                {"node": "jira", "message": "Fetching"},
+                {"node": "Claude", "state": "ACTIVE", "message": "Writing"},
+                {"status": "running"},
+            ],
+        )
+
+        assert response.status_code == 200
+        assert response.get_json() == {"success": True, "applied": 3, "version": 1}
+        received = ws_client.get_received("/monitor")
+        assert [r["name"] for r in received] == ["state_delta"]
+        delta = received[0]["args"][0]
+        assert delta["current_node"] == "claude"
+        assert delta["task_info"]["start_time"]
+
+    def test_ndjson_body(self, client) -> None:
+        """NDJSON bodies are parsed one update per line."""
+        body = '{"node": "github"}\n\n{"node": "jules", "message": "Review"}\n'
+
+        response = client.post(
+            "/api/monitor/batch", data=body, content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["applied"] == 2
+        state = client.get("/api/monitor/state").get_json()
+        assert state["current_node"] == "jules"
+
+    def test_wrapped_updates_object(self, client) -> None:
+        """An object with an "updates" list is accepted."""
+        response = client.post(
+            "/api/monitor/batch", json={"updates": [{"node": "actions"}]}
+        )
+
+        assert response.get_json()["version"] == 1
+
+    def test_invalid_ndjson_rejected(self, client) -> None:
+        """Malformed NDJSON returns 400."""
+        response = client.post(
+            "/api/monitor/batch", data="{oops", content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == 400
+
+    def test_invalid_node_rejected(self, client) -> None:
+        """A batch with an unknown node returns 400 and applies nothing."""
+        response = client.post(
+            "/api/monitor/batch", json=[{"node": "jira"}, {"node": "nope"}]
+        )
+
+        assert response.status_code == 400
+        assert client.get("/api/monitor/state").get_json()["version"] == 0
+
+    def test_mixed_valid_and_invalid_batch_rejected(self, client, ws_client) -> None:
+        """A bad field in a later update returns 400 before anything changes."""
+        ws_client.get_received("/monitor")
+
+        response = client.post(
+            "/api/monitor/batch",
+            json=[{"node": "claude", "message": "ok"}, {"node": "jira", "message": 5}],
+        )
+
+        assert response.status_code == 400
+        assert "message must be a string" in response.get_json()["error"]
+        state = client.get("/api/monitor/state").get_json()
+        assert state["version"] == 0
+        assert state["current_node"] is None
+        assert state["event_log"] == []
+        assert ws_client.get_received("/monitor") == []
+
+    def test_empty_batch_rejected(self, client) -> None:
+        """An empty batch returns 400."""
+        assert client.post("/api/monitor/batch", json=[]).status_code == 400
+
+
+class TestHistoryEndpoints:
+    """Tests for history paging and replay."""
+
+    @pytest.fixture
+    def history_app(self, tmp_path):
+        """App whose monitor service writes to an event store."""
+        from src.sejfa.monitor.event_store import EventStore
+
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        socketio = SocketIO(app)
+        store = EventStore(str(tmp_path / "events"))
+        service = MonitorService(event_store=store)
+        app.register_blueprint(
+            create_monitor_blueprint(service, socketio, coalesce_window=0)
+        )
+        init_socketio_events(resync_interval=0)
+        yield app, socketio
+        store.close()
+
+    def test_history_disabled_without_store(self, client) -> None:
+        """History endpoints return 404 when no store is configured."""
+        assert client.get("/api/monitor/history").status_code == 404
+        assert client.post("/api/monitor/replay", json={}).status_code == 404
+
+    def test_history_pages_per_task(self, history_app) -> None:
+        """History is paged per task with a cursor."""
+        app, _ = history_app
+        http = app.test_client()
+        http.post("/api/monitor/task", json={"title": "GE-1"})
+        for i in range(5):
+            http.post("/api/monitor/state", json={"node": "claude", "message": f"{i}"})
+
+        first = http.get("/api/monitor/history?task=GE-1&limit=3").get_json()
+        second = http.get(
+            f"/api/monitor/history?task=GE-1&limit=3&after={first['next_after']}"
+        ).get_json()
+
+        assert [e["message"] for e in first["events"]] == ["0", "1", "2"]
+        assert [e["message"] for e in second["events"]] == ["3", "4"]
+        assert second["next_after"] is None
+        tasks = http.get("/api/monitor/history/tasks").get_json()
+        assert tasks == {"tasks": {"GE-1": 5}}
+
+    def test_history_rejects_bad_cursor(self, history_app) -> None:
+        """Non-integer paging parameters return 400."""
+        app, _ = history_app
+
+        response = app.test_client().get("/api/monitor/history?after=abc")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("query", ["limit=0", "limit=-5", "after=-1"])
+    def test_history_rejects_out_of_range_cursor(self, history_app, query) -> None:
+        """A limit below 1 or a negative cursor returns 400, not a crash."""
+        app, _ = history_app
+        client = app.test_client()
+        client.post("/api/monitor/state", json={"node": "jira"})
+
+        response = client.get(f"/api/monitor/history?{query}")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("body", [{"limit": 0}, {"after": -1}])
+    def test_replay_rejects_out_of_range_cursor(self, history_app, body) -> None:
+        app, _ = history_app
+
+        response = app.test_client().post("/api/monitor/replay", json=body)
+
+        assert response.status_code == 400
+
+    def test_replay_emits_stored_events(self, history_app) -> None:
+        """Replay streams the stored run to connected dashboards."""
+        app, socketio = history_app
+        http = app.test_client()
+        ws = socketio.test_client(app, namespace="/monitor")
+        for node in ("jira", "claude", "github"):
+            http.post("/api/monitor/state", json={"node": node})
+        ws.get_received("/monitor")
+
+        response = http.post("/api/monitor/replay", json={"speed": 1000})
+        assert response.status_code == 202
+        assert response.get_json()["events"] == 3
+
+        received = []
+        for _ in range(50):
+            received += ws.get_received("/monitor")
+            if received and received[-1]["name"] == "replay_finished":
+                break
+            socketio.sleep(0.02)
+
+        names = [r["name"] for r in received]
+        assert names == [
+            "replay_started",
+            "replay_event",
+            "replay_event",
+            "replay_event",
+            "replay_finished",
+        ]
+        assert [r["args"][0]["node"] for r in received[1:4]] == [
+            "jira",
+            "claude",
+            "github",
+        ]
+        ws.disconnect(namespace="/monitor")
+
+
+def _read_frames(stream, count: int) -> list[str]:
+    """Read SSE frames from a streaming response iterator."""
+    return [next(stream).decode() for _ in range(count)]
+
+
+class TestEventStream:
+    """Tests for the Server-Sent Events endpoint."""
+
+    def test_stream_starts_with_snapshot(self, client) -> None:
+        """A new watcher gets a retry hint and a snapshot event."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+
+        response = client.get("/api/monitor/stream")
+        stream = iter(response.response)
+        retry, snapshot = _read_frames(stream, 2)
+
+        assert response.mimetype == "text/event-stream"
+        assert retry == "retry: 3000\n\n"
+        assert snapshot.startswith("id: 1\nevent: snapshot\ndata: ")
+        response.close()
+
+    def test_stream_pushes_deltas(self, client) -> None:
+        """Changes after connecting arrive as delta events."""
+        response = client.get("/api/monitor/stream")
+        stream = iter(response.response)
+        _read_frames(stream, 2)
+
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+        (frame,) = _read_frames(stream, 1)
+
+        assert frame.startswith("id: 1\nevent: delta\ndata: ")
+        data = json.loads(frame.split("data: ", 1)[1])
+        assert data["nodes"]["claude"]["active"] is True
+        response.close()
+
+    def test_stream_resumes_from_last_event_id(self, client) -> None:
+        """A reconnecting watcher gets only the missed changes, merged."""
+        for node in ("jira", "claude", "github"):
+            client.post("/api/monitor/state", json={"node": node, "state": "active"})
+
+        response = client.get("/api/monitor/stream", headers={"Last-Event-ID": "1"})
+        stream = iter(response.response)
+        _, frame = _read_frames(stream, 2)
+
+        assert frame.startswith("id: 3\nevent: delta\n")
+        data = json.loads(frame.split("data: ", 1)[1])
+        assert data["base_version"] == 1
+        assert [e["node"] for e in data["events"]] == ["claude", "github"]
+        response.close()
+
+    def test_stream_unknown_last_event_id_sends_snapshot(self, client) -> None:
+        """A version the server does not know triggers a snapshot."""
+        response = client.get("/api/monitor/stream?last_event_id=42")
+        stream = iter(response.response)
+        _, frame = _read_frames(stream, 2)
+
+        assert frame.startswith("id: 0\nevent: snapshot\n")
+        response.close()
+
+
+class TestGetState:
+    """Tests for GET /api/monitor/state."""
+
+    def test_returns_cached_json(self, client) -> None:
+        """The response body is the cached pre-encoded snapshot."""
+        client.post("/api/monitor/task", json={"title": "GE-2"})
+
+        response = client.get("/api/monitor/state")
+
+        assert response.status_code == 200
+        assert response.content_type == "application/json"
+        assert response.get_json()["task_info"]["title"] == "GE-2"
+        assert response.get_json()["version"] == 1
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /api/monitor/metrics."""
+
+    def test_json_metrics(self, client) -> None:
+        """Transitions posted to /state show up in the JSON metrics."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+
+        data = client.get("/api/monitor/metrics?format=json").get_json()
+
+        assert data["transitions"]["jira"] == 1
+        assert data["dwell_seconds"]["jira"]["count"] == 1
+        assert data["current_node"] == "claude"
+
+    @pytest.mark.parametrize("accept", [None, "*/*", "text/plain"])
+    def test_prometheus_by_default(self, client, accept) -> None:
+        """Scrapers get the text exposition format without asking for it."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        headers = {"Accept": accept} if accept else {}
+
+        response = client.get("/api/monitor/metrics", headers=headers)
+
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        text = response.get_data(as_text=True)
+        assert 'sejfa_monitor_node_transitions_total{node="jira"} 1' in text
+        assert "# TYPE sejfa_monitor_cycle_seconds histogram" in text
+
+    @pytest.mark.parametrize(
+        "accept", ["application/json", "application/json, text/plain;q=0.5"]
+    )
+    def test_accept_header_selects_json(self, client, accept) -> None:
+        """A client preferring application/json gets JSON."""
+        response = client.get("/api/monitor/metrics", headers={"Accept": accept})
+
+        assert response.content_type == "application/json"
+        assert "transitions" in response.get_json()
+
+
+class TestSessions:
+    """Tests for per-session state and subscriptions."""
+
+    def test_sessions_keep_separate_state(self, client) -> None:
+        """Updates in one session do not touch another."""
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "jira", "state": "active"},
+        )
+        client.post(
+            "/api/monitor/state",
+            json={"node": "github", "state": "active", "session": "loop-b"},
+        )
+
+        state_a = client.get("/api/monitor/state?session=loop-a").get_json()
+        state_b = client.get(
+            "/api/monitor/state", headers={"X-Monitor-Session": "loop-b"}
+        ).get_json()
+        default = client.get("/api/monitor/state").get_json()
+
+        assert (state_a["session"], state_a["current_node"]) == ("loop-a", "jira")
+        assert (state_b["session"], state_b["current_node"]) == ("loop-b", "github")
+        assert default["current_node"] is None
+
+    def test_unknown_session_read_is_404(self, client) -> None:
+        """Reading a session that never reported does not create it."""
+        response = client.get("/api/monitor/state?session=nope")
+
+        assert response.status_code == 404
+        listed = client.get("/api/monitor/sessions").get_json()
+        assert [s["session"] for s in listed["sessions"]] == ["default"]
+
+    def test_invalid_session_rejected(self, client) -> None:
+        """Malformed session IDs are rejected."""
+        response = client.post(
+            "/api/monitor/state?session=a/b", json={"node": "jira", "state": "active"}
+        )
+
+        assert response.status_code == 400
+
+    def test_batch_with_session(self, client) -> None:
+        """NDJSON batches pick the session from the query string."""
+        body = '{"node": "claude", "state": "active"}\n'
+        client.post(
+            "/api/monitor/batch?session=loop-c",
+            data=body,
+            content_type="application/x-ndjson",
+        )
+
+        listed = client.get("/api/monitor/sessions").get_json()
+        by_id = {s["session"]: s for s in listed["sessions"]}
+        assert by_id["loop-c"]["current_node"] == "claude"
+        assert listed["stats"]["created"] == 1
+
+    def test_default_clients_only_get_default_deltas(self, client, ws_client) -> None:
+        """Clients that did not subscribe follow the default session only."""
+        ws_client.get_received("/monitor")
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "jira", "state": "active"},
+        )
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+
+        deltas = [
+            r["args"][0]
+            for r in ws_client.get_received("/monitor")
+            if r["name"] == "state_delta"
+        ]
+        assert [d["session"] for d in deltas] == ["default"]
+
+    def test_subscribe_to_one_session(self, client, ws_client) -> None:
+        """Subscribing switches the client to another session's updates."""
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "jira", "state": "active"},
+        )
+        ws_client.get_received("/monitor")
+
+        ack = ws_client.emit(
+            "subscribe", {"session": "loop-a"}, namespace="/monitor", callback=True
+        )
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "github", "state": "active"},
+        )
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+
+        assert ack == {
+            "success": True,
+            "session": "loop-a",
+            "channels": ["state", "replay"],
+            "nodes": [],
+            "encoding": "json",
+        }
+        received = ws_client.get_received("/monitor")
+        snapshot = json.loads(received[0]["args"][0])
+        assert snapshot["session"] == "loop-a"
+        deltas = [r["args"][0] for r in received if r["name"] == "state_delta"]
+        assert [d["session"] for d in deltas] == ["loop-a"]
+
+    def test_subscribe_to_all_sessions(self, client, ws_client) -> None:
+        """Subscribing to * delivers updates from every session."""
+        ws_client.emit("subscribe", {"session": "*"}, namespace="/monitor")
+        ws_client.get_received("/monitor")
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "jira", "state": "active"},
+        )
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+
+        deltas = [
+            r["args"][0]
+            for r in ws_client.get_received("/monitor")
+            if r["name"] == "state_delta"
+        ]
+        assert sorted(d["session"] for d in deltas) == ["default", "loop-a"]
+
+    @pytest.mark.parametrize(
+        ("data", "error"),
+        [
+            ({"session": "never-reported"}, "Unknown session"),
+            (["state"], "must be an object"),
+            ({"channels": "state"}, "must be lists"),
+            ({"session": 7}, "Invalid session"),
+        ],
+    )
+    def test_bad_subscription_rejected(self, ws_client, data, error) -> None:
+        """Unknown sessions and malformed requests are refused, not raised."""
+        ws_client.get_received("/monitor")
+
+        ack = ws_client.emit("subscribe", data, namespace="/monitor", callback=True)
+
+        assert ack["success"] is False
+        assert error in ack["error"]
+        assert ws_client.get_received("/monitor") == []
+
+    def test_evicted_session_state_request_ignored(self, client, ws_client) -> None:
+        """Asking for the state of a session that is gone sends nothing."""
+        client.post(
+            "/api/monitor/state?session=loop-a",
+            json={"node": "jira", "state": "active"},
+        )
+        ws_client.emit("subscribe", {"session": "loop-a"}, namespace="/monitor")
+        monitor_routes.sessions.max_sessions = 0
+        monitor_routes.sessions.get("loop-b")
+        ws_client.get_received("/monitor")
+
+        ws_client.emit("request_state", namespace="/monitor")
+
+        received = ws_client.get_received("/monitor")
+        assert "state_update" not in [r["name"] for r in received]
+
+
+class TestSharedSessions:
+    """Tests for sessions shared between workers through a state backend."""
+
+    @pytest.fixture
+    def shared_app(self, tmp_path):
+        """App whose sessions are stored in a SQLite state database."""
+        from src.sejfa.monitor.state_backend import SqliteStateBackend
+
+        db_path = str(tmp_path / "state.db")
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        socketio = SocketIO(app)
+        service = MonitorService(backend=SqliteStateBackend(db_path))
+        app.register_blueprint(
+            create_monitor_blueprint(service, socketio, coalesce_window=0)
+        )
+        init_socketio_events(resync_interval=0)
+        return app, socketio, db_path
+
+    def test_session_from_other_worker_is_readable(self, shared_app) -> None:
+        """A session another worker created is loaded on first read."""
+        from src.sejfa.monitor.state_backend import SqliteStateBackend
+
+        app, _, db_path = shared_app
+        other_worker = MonitorService(
+            backend=SqliteStateBackend(db_path, session_id="loop-a"),
+            session_id="loop-a",
+        )
+        other_worker.update_node("jira", "active", "Fetching")
+
+        response = app.test_client().get("/api/monitor/state?session=loop-a")
+
+        assert response.status_code == 200
+        assert response.get_json()["current_node"] == "jira"
+        assert app.test_client().get("/api/monitor/state").get_json()["version"] == 0
+
+    def test_session_updates_reach_other_workers(self, shared_app) -> None:
+        """Updates posted here are stored under the session's own ID."""
+        from src.sejfa.monitor.state_backend import SqliteStateBackend
+
+        app, socketio, db_path = shared_app
+        app.test_client().post(
+            "/api/monitor/state?session=loop-b",
+            json={"node": "github", "state": "active"},
+        )
+        ws = socketio.test_client(app, namespace="/monitor")
+
+        ack = ws.emit(
+            "subscribe", {"session": "loop-b"}, namespace="/monitor", callback=True
+        )
+        other_worker = MonitorService(
+            backend=SqliteStateBackend(db_path, session_id="loop-b"),
+            session_id="loop-b",
+        )
+
+        assert ack["success"] is True
+        assert other_worker.get_state()["current_node"] == "github"
+        ws.disconnect(namespace="/monitor")
+
+    def test_evicted_session_state_is_deleted(self, tmp_path) -> None:
+        """Evicting a session removes its row from the shared database."""
+        from src.sejfa.monitor.state_backend import SqliteStateBackend
+
+        db_path = str(tmp_path / "state.db")
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        service = MonitorService(backend=SqliteStateBackend(db_path))
+        app.register_blueprint(
+            create_monitor_blueprint(
+                service, SocketIO(app), coalesce_window=0, max_sessions=2
+            )
+        )
+        client = app.test_client()
+
+        client.post("/api/monitor/state?session=loop-a", json={"node": "jira"})
+        client.post("/api/monitor/state?session=loop-b", json={"node": "jira"})
+
+        assert not SqliteStateBackend(db_path, session_id="loop-a").exists()
+        assert SqliteStateBackend(db_path, session_id="loop-b").exists()
+
+
+class TestChannelSubscriptions:
+    """Tests for per-channel and per-node rooms."""
+
+    def test_events_channel_gets_only_events(self, client, ws_client) -> None:
+        """An event-log client gets monitor_events, not deltas or task updates."""
+        ack = ws_client.emit(
+            "subscribe", {"channels": ["events"]}, namespace="/monitor", callback=True
+        )
+        ws_client.get_received("/monitor")
+
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        client.post("/api/monitor/task", json={"title": "T", "status": "running"})
+
+        received = ws_client.get_received("/monitor")
+        assert ack["channels"] == ["events"]
+        assert [r["name"] for r in received] == ["monitor_events"]
+        assert received[0]["args"][0]["events"][0]["node"] == "jira"
+
+    def test_subscribe_sends_current_channel_state(self, client, ws_client) -> None:
+        """Subscribing delivers the current task and event log, not a snapshot."""
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        client.post("/api/monitor/task", json={"title": "T", "status": "running"})
+        ws_client.get_received("/monitor")
+
+        ws_client.emit(
+            "subscribe", {"channels": ["events", "task"]}, namespace="/monitor"
+        )
+
+        received = ws_client.get_received("/monitor")
+        assert [r["name"] for r in received] == ["monitor_events", "task_update"]
+        assert received[1]["args"][0]["task_info"]["title"] == "T"
+
+    def test_node_channel_gets_only_that_node(self, client, ws_client) -> None:
+        """A node subscriber receives updates touching that node only."""
+        ws_client.get_received("/monitor")
+        ws_client.emit("subscribe", {"nodes": ["github"]}, namespace="/monitor")
+        initial = ws_client.get_received("/monitor")
+
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+        client.post(
+            "/api/monitor/state",
+            json={"node": "github", "state": "active", "message": "push"},
+        )
+
+        received = ws_client.get_received("/monitor")
+        assert [r["name"] for r in initial] == ["node_update"]
+        assert [r["name"] for r in received] == ["node_update"]
+        update = received[0]["args"][0]
+        assert (update["node"], update["active"]) == ("github", True)
+        assert [e["message"] for e in update["events"]] == ["push"]
+
+    def test_unknown_channel_rejected(self, ws_client) -> None:
+        """Unknown channels and nodes are refused in the acknowledgement."""
+        ack = ws_client.emit(
+            "subscribe", {"channels": ["bogus"]}, namespace="/monitor", callback=True
+        )
+
+        assert ack["success"] is False
+
+    def test_unwatched_channels_not_encoded(
+        self, client, ws_client, monkeypatch
+    ) -> None:
+        """Messages are only emitted to rooms that have listeners."""
+        emitted = []
+        socketio = monitor_routes.socketio
+        original = socketio.emit
+
+        def record(event, *args, **kwargs):
+            emitted.append(event)
+            return original(event, *args, **kwargs)
+
+        monkeypatch.setattr(socketio, "emit", record)
+        client.post("/api/monitor/state", json={"node": "jira", "state": "active"})
+
+        assert emitted == ["state_delta"]
+
+
+class TestCompactEncodings:
+    """Tests for negotiated compact and msgpack encodings."""
+
+    def test_msgpack_client_gets_binary_messages(
+        self, app_and_socketio, client
+    ) -> None:
+        """A msgpack client receives packed compact snapshots and deltas."""
+        msgpack = pytest.importorskip("msgpack")
+        app, socketio = app_and_socketio
+        ws = socketio.test_client(
+            app, namespace="/monitor", auth={"encoding": "msgpack"}
+        )
+        client.post("/api/monitor/state", json={"node": "github", "state": "active"})
+
+        received = ws.get_received("/monitor")
+        assert [r["name"] for r in received] == ["state_update", "state_delta"]
+        snapshot = msgpack.unpackb(received[0]["args"][0])
+        delta = msgpack.unpackb(received[1]["args"][0])
+        assert snapshot["v"] == 0 and len(snapshot["n"]) == 5
+        assert (delta["v"], delta["b"], delta["c"]) == (1, 0, 2)
+        assert delta["n"][0][:2] == [2, 1]
+        ws.disconnect(namespace="/monitor")
+
+    def test_json_and_compact_clients_side_by_side(
+        self, app_and_socketio, client, ws_client
+    ) -> None:
+        """Each client gets the encoding it negotiated for the same delta."""
+        app, socketio = app_and_socketio
+        compact = socketio.test_client(app, namespace="/monitor")
+        ack = compact.emit(
+            "subscribe",
+            {"channels": ["events"], "encoding": "compact"},
+            namespace="/monitor",
+            callback=True,
+        )
+        compact.get_received("/monitor")
+        ws_client.get_received("/monitor")
+
+        client.post(
+            "/api/monitor/state",
+            json={"node": "jira", "state": "active", "message": "hi"},
+        )
+
+        assert ack["encoding"] == "compact"
+        (verbose,) = ws_client.get_received("/monitor")
+        (short,) = compact.get_received("/monitor")
+        assert verbose["args"][0]["nodes"]["jira"]["message"] == "hi"
+        assert short["name"] == "monitor_events"
+        assert short["args"][0]["e"][0][1:3] == [0, "hi"]
+        compact.disconnect(namespace="/monitor")
+
+    def test_unknown_encoding_falls_back_to_json(self, app_and_socketio) -> None:
+        """Unsupported encodings are negotiated down to JSON."""
+        app, socketio = app_and_socketio
+        ws = socketio.test_client(
+            app, namespace="/monitor", auth={"encoding": "protobuf"}
+        )
+
+        (snapshot,) = ws.get_received("/monitor")
+        assert json.loads(snapshot["args"][0])["version"] == 0
+        ws.disconnect(namespace="/monitor")
+
+    def test_stream_compact_encoding(self, client) -> None:
+        """SSE watchers can ask for compact snapshots and deltas."""
+        response = client.get("/api/monitor/stream?encoding=compact")
+        stream = iter(response.response)
+        _, snapshot = _read_frames(stream, 2)
+
+        client.post("/api/monitor/state", json={"node": "claude", "state": "active"})
+        (frame,) = _read_frames(stream, 1)
+
+        assert snapshot.startswith("id: 0\nevent: snapshot\n")
+        assert json.loads(snapshot.split("data: ", 1)[1])["v"] == 0
+        delta = json.loads(frame.split("data: ", 1)[1])
+        assert (delta["v"], delta["c"]) == (1, 1)
+        response.close()
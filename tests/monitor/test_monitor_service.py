@@ -0,0 +1,291 @@
+"""Tests for MonitorService versioned state and deltas."""
+
+import json
+import random
+import threading
+
+import pytest
+
+from src.sejfa.monitor.monitor_service import MonitorService
+
+
+@pytest.fixture
+def service() -> MonitorService:
+    """Create a fresh monitor service."""
+    return MonitorService()
+
+
+class TestVersionedDeltas:
+    """Tests for delta messages returned by mutations."""
+
+    def test_initial_version_is_zero(self, service: MonitorService) -> None:
+        """A fresh service starts at version 0."""
+        assert service.get_state()["version"] == 0
+
+    def test_update_node_returns_delta(self, service: MonitorService) -> None:
+        """update_node returns only the changed node and the new event."""
+        delta = service.update_node("jira", "active", "Fetching ticket")
+
+        assert delta["base_version"] == 0
+        assert delta["version"] == 1
+        assert delta["current_node"] == "jira"
+        assert list(delta["nodes"]) == ["jira"]
+        assert delta["nodes"]["jira"]["active"] is True
+        assert [e["message"] for e in delta["events"]] == ["Fetching ticket"]
+        assert "task_info" not in delta
+
+    def test_update_node_invalid_returns_none(self, service: MonitorService) -> None:
+        """Unknown nodes are rejected without bumping the version."""
+        assert service.update_node("unknown", "active") is None
+        assert service.version == 0
+
+    def test_delta_includes_deactivated_node(self, service: MonitorService) -> None:
+        """Switching nodes reports the previously active node as changed."""
+        service.update_node("jira", "active")
+        delta = service.update_node("claude", "active")
+
+        assert set(delta["nodes"]) == {"claude", "jira"}
+        assert delta["nodes"]["jira"]["active"] is False
+
+    def test_task_delta_contains_only_changed_fields(
+        self, service: MonitorService
+    ) -> None:
+        """set_task_info returns the task diff only."""
+        service.set_task_info(title="GE-1", status="running")
+        delta = service.set_task_info(title="GE-1", status="completed")
+
+        assert delta["task_info"] == {"status": "completed"}
+
+    def test_versions_are_consecutive(self, service: MonitorService) -> None:
+        """Each delta's base_version is the previous delta's version."""
+        first = service.update_node("jira", "active")
+        second = service.set_task_info(status="running")
+
+        assert second["base_version"] == first["version"]
+
+    def test_reset_bumps_version(self, service: MonitorService) -> None:
+        """Reset keeps counting so stale clients detect the gap."""
+        service.update_node("jira", "active")
+        service.reset()
+
+        assert service.get_state()["version"] == 2
+
+    def test_delta_is_much_smaller_than_snapshot(self, service: MonitorService) -> None:
+        """With a full event log, a delta is over 10x smaller than a snapshot."""
+        for i in range(100):
+            service.update_node("claude", "active", f"Writing file {i} " * 5)
+
+        delta = service.update_node("github", "active", "git push")
+        snapshot = service.get_state()
+
+        assert len(json.dumps(snapshot)) > 10 * len(json.dumps(delta))
+
+
+class TestApplyBatch:
+    """Tests for applying batches of updates as one mutation."""
+
+    def test_batch_is_one_version(self, service: MonitorService) -> None:
+        """A batch produces a single delta and version bump."""
+        delta = service.apply_batch(
+            [
+                {"node": "jira", "state": "active", "message": "Fetching"},
+                {"title": "GE-3", "status": "running"},
+                {"node": "claude", "state": "active", "message": "Writing"},
+            ]
+        )
+
+        assert delta["base_version"] == 0
+        assert delta["version"] == 1
+        assert delta["current_node"] == "claude"
+        assert set(delta["nodes"]) == {"jira", "claude"}
+        assert [e["message"] for e in delta["events"]] == ["Fetching", "Writing"]
+        assert delta["task_info"] == {"title": "GE-3", "status": "running"}
+
+    def test_batch_applied_in_order(self, service: MonitorService) -> None:
+        """The last node transition in the batch wins."""
+        service.apply_batch(
+            [{"node": "github"}, {"node": "jules"}, {"node": "actions"}]
+        )
+
+        state = service.get_state()
+        assert state["current_node"] == "actions"
+        assert [n for n, v in state["nodes"].items() if v["active"]] == ["actions"]
+
+    def test_invalid_node_rejects_whole_batch(self, service: MonitorService) -> None:
+        """Validation happens before anything is applied."""
+        with pytest.raises(ValueError, match="invalid node"):
+            service.apply_batch([{"node": "jira"}, {"node": "bogus"}])
+
+        assert service.version == 0
+        assert service.get_state()["event_log"] == []
+
+    @pytest.mark.parametrize(
+        "bad",
+        [
+            {"node": "jira", "message": 5},
+            {"node": "jira", "state": None},
+            {"node": ["jira"]},
+            {"title": {"x": 1}},
+            {"status": 1},
+            {"start_time": 12},
+        ],
+    )
+    def test_bad_field_type_rejects_whole_batch(
+        self, service: MonitorService, bad: dict
+    ) -> None:
+        """A later update of the wrong type leaves earlier ones unapplied."""
+        with pytest.raises(ValueError, match="Update 1"):
+            service.apply_batch([{"node": "claude", "message": "ok"}, bad])
+
+        state = service.get_state()
+        assert service.version == 0
+        assert state["current_node"] is None
+        assert state["event_log"] == []
+
+
+class TestDeltaHistory:
+    """Tests for resuming readers from the delta history."""
+
+    def test_deltas_since_returns_missed_changes(self, service: MonitorService) -> None:
+        """A reader at version 1 gets the deltas for versions 2 and 3."""
+        for node in ("jira", "claude", "github"):
+            service.update_node(node, "active")
+
+        deltas = service.deltas_since(1)
+
+        assert [d["version"] for d in deltas] == [2, 3]
+        assert service.deltas_since(3) == []
+
+    def test_deltas_since_requires_snapshot_when_evicted(self) -> None:
+        """Versions older than the history need a snapshot."""
+        service = MonitorService(delta_history=2)
+        for node in ("jira", "claude", "github", "jules"):
+            service.update_node(node, "active")
+
+        assert service.deltas_since(1) is None
+        assert [d["version"] for d in service.deltas_since(2)] == [3, 4]
+
+    def test_deltas_since_after_reset_needs_snapshot(
+        self, service: MonitorService
+    ) -> None:
+        """Reset has no delta, so older readers must resync."""
+        service.update_node("jira", "active")
+        service.reset()
+
+        assert service.deltas_since(1) is None
+        assert service.deltas_since(99) is None
+
+    def test_wait_for_change(self, service: MonitorService) -> None:
+        """wait_for_change returns as soon as the version moves."""
+        assert service.wait_for_change(0, timeout=0.01) is False
+
+        service.update_node("jira", "active")
+
+        assert service.wait_for_change(0, timeout=0.01) is True
+
+
+class TestSerializedState:
+    """Tests for the version-keyed serialization cache."""
+
+    def test_serialized_matches_state(self, service: MonitorService) -> None:
+        """The cached JSON decodes to the current snapshot."""
+        service.update_node("jira", "active", "Fetching")
+
+        serialized = service.get_serialized_state()
+
+        assert serialized.version == 1
+        assert json.loads(serialized.data) == service.get_state()
+        assert serialized.data == serialized.text.encode()
+
+    def test_serialized_once_per_version(self, service: MonitorService) -> None:
+        """Readers of the same version share one encoding."""
+        first = service.get_serialized_state()
+
+        assert service.get_serialized_state() is first
+
+        service.set_task_info(title="GE-8")
+        second = service.get_serialized_state()
+        assert second is not first
+        assert second.version == 1
+        assert json.loads(second.text)["task_info"]["title"] == "GE-8"
+
+
+class TestConcurrentUpdates:
+    """Stress tests for atomic mutations and copy-on-write snapshots."""
+
+    WRITERS = 8
+    UPDATES_PER_WRITER = 500
+
+    @staticmethod
+    def _check_invariants(state: dict) -> None:
+        active = [node for node, info in state["nodes"].items() if info["active"]]
+        assert len(active) <= 1
+        if state["current_node"] is not None and active:
+            assert active == [state["current_node"]]
+        assert len(state["event_log"]) <= 100
+
+    def test_concurrent_updates_keep_invariants(self, service: MonitorService) -> None:
+        """Many writers never leave two nodes active or tear a snapshot."""
+        nodes = sorted(MonitorService.VALID_NODES)
+        stop = threading.Event()
+        errors: list[AssertionError] = []
+
+        def write(seed: int) -> None:
+            rng = random.Random(seed)
+            for i in range(self.UPDATES_PER_WRITER):
+                if i % 50 == 0:
+                    service.set_task_info(title=f"task {seed}", status="running")
+                else:
+                    service.update_node(rng.choice(nodes), "active", f"w{seed}")
+
+        def read() -> None:
+            last_version = -1
+            try:
+                while not stop.is_set():
+                    state = service.get_state()
+                    self._check_invariants(state)
+                    assert state["version"] >= last_version
+                    last_version = state["version"]
+                    snapshot = json.loads(service.get_serialized_state().text)
+                    self._check_invariants(snapshot)
+            except AssertionError as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writers = [
+            threading.Thread(target=write, args=(seed,)) for seed in range(self.WRITERS)
+        ]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert not errors, errors[0]
+        final = service.get_state()
+        self._check_invariants(final)
+        # set_task_info is a no-op delta when nothing changes but still bumps
+        assert final["version"] == self.WRITERS * self.UPDATES_PER_WRITER
+
+    def test_snapshot_not_changed_by_later_updates(
+        self, service: MonitorService
+    ) -> None:
+        """A snapshot keeps showing its own version after further updates."""
+        service.update_node("jira", "active", "first")
+        snapshot = service.get_state()
+
+        service.update_node("claude", "active", "second")
+        service.set_task_info(title="Later", status="running")
+
+        assert snapshot["current_node"] == "jira"
+        assert [e["message"] for e in snapshot["event_log"]] == ["first"]
+        assert snapshot["task_info"]["title"] == "Waiting for task..."
+        assert service.get_state()["current_node"] == "claude"
+
+    def test_snapshot_shared_within_version(self, service: MonitorService) -> None:
+        """Readers of the same version share one snapshot object."""
+        service.update_node("jira", "active")
+
+        assert service.get_state() is service.get_state()
@@ -0,0 +1,96 @@
+"""Tests for the monitor session registry."""
+
+import threading
+
+from src.sejfa.monitor.sessions import SessionRegistry, is_valid_session_id
+
+
+class TestSessionIds:
+    """Tests for session ID validation."""
+
+    def test_valid_ids(self) -> None:
+        """Short IDs of letters, digits and _.:- are accepted."""
+        assert is_valid_session_id("loop-1")
+        assert is_valid_session_id("host.example:42_a")
+
+    def test_invalid_ids(self) -> None:
+        """Empty, overlong and unusual IDs are rejected."""
+        assert not is_valid_session_id("")
+        assert not is_valid_session_id("x" * 65)
+        assert not is_valid_session_id("a/b")
+        assert not is_valid_session_id("*")
+
+
+class TestSessionRegistry:
+    """Tests for lazy creation and eviction."""
+
+    def test_creates_once_per_id(self) -> None:
+        """The factory runs once per session ID."""
+        registry = SessionRegistry(lambda sid: {"id": sid})
+
+        first = registry.get("a")
+
+        assert registry.get("a") is first
+        assert registry.get("b") is not first
+        assert registry.stats() == {"sessions": 2, "created": 2, "evicted": 0}
+
+    def test_get_without_create(self) -> None:
+        """Unknown sessions are not created when create is False."""
+        registry = SessionRegistry(lambda sid: sid)
+
+        assert registry.get("missing", create=False) is None
+        assert "missing" not in registry
+
+    def test_capacity_evicts_least_recently_used(self) -> None:
+        """Going over max_sessions evicts the least recently used session."""
+        evicted = []
+        registry = SessionRegistry(
+            lambda sid: sid,
+            max_sessions=2,
+            on_evict=lambda sid, value: evicted.append(sid),
+        )
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+        registry.get("c")
+
+        assert evicted == ["b"]
+        assert "a" in registry and "c" in registry
+
+    def test_pinned_session_never_evicted(self) -> None:
+        """Pinned sessions survive capacity and idle eviction."""
+        registry = SessionRegistry(lambda sid: sid, max_sessions=1, idle_ttl=0.01)
+        registry.register("default", "pinned", pinned=True)
+        registry.get("a")
+        registry.get("b")
+
+        assert "default" in registry
+        assert "a" not in registry
+
+    def test_idle_sessions_evicted(self) -> None:
+        """Sessions unused for longer than idle_ttl are evicted."""
+        registry = SessionRegistry(lambda sid: sid, idle_ttl=0.05)
+        registry.get("old")
+        for entry in registry._entries.values():
+            entry.last_used -= 1.0
+        registry.get("fresh")
+
+        assert registry.evict_idle() == ["old"]
+        assert "fresh" in registry
+
+    def test_concurrent_creation_is_single(self) -> None:
+        """Racing lookups of a new session share one created value."""
+        registry = SessionRegistry(lambda sid: object())
+        results = []
+
+        def lookup() -> None:
+            results.append(registry.get("shared"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(value) for value in results}) == 1
+        assert registry.stats()["created"] == 1
@@ -0,0 +1,238 @@
+"""Tests for shared monitor state backends."""
+
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.sejfa.monitor.monitor_service import MonitorService
+from src.sejfa.monitor.state_backend import (
+    InMemoryStateBackend,
+    SqliteStateBackend,
+    StateBackend,
+)
+
+NODES = ["jira", "claude", "github", "jules", "actions"]
+
+
+def _hammer(db_path: str, worker: int, updates: int) -> None:
+    """Apply updates from a separate process, like a gunicorn worker would."""
+    service = MonitorService(backend=SqliteStateBackend(db_path))
+    for i in range(updates):
+        service.update_node(NODES[(worker + i) % len(NODES)], "active", f"w{worker}")
+
+
+def test_incomplete_backend_fails_on_instantiation() -> None:
+    """A backend missing an override is rejected before it is used."""
+
+    class NoStore(StateBackend):
+        def transaction(self):
+            raise AssertionError("not called")
+
+        def load_if_newer(self, version: int):
+            return None
+
+    with pytest.raises(TypeError, match="store"):
+        NoStore()
+
+
+class TestInMemoryStateBackend:
+    """Tests for sharing state between services in one process."""
+
+    def test_services_share_state(self) -> None:
+        """A mutation on one service is visible through another."""
+        backend = InMemoryStateBackend()
+        writer = MonitorService(backend=backend)
+        reader = MonitorService(backend=backend)
+
+        writer.update_node("jules", "active", "Reviewing")
+
+        state = reader.get_state()
+        assert state["version"] == 1
+        assert state["current_node"] == "jules"
+
+    def test_reads_do_not_wait_for_the_service_lock(self) -> None:
+        """An up-to-date read does not queue behind a mutation in progress."""
+        backend = InMemoryStateBackend()
+        reader = MonitorService(backend=backend)
+        MonitorService(backend=backend).update_node("jira", "active")
+        reader.get_serialized_state()
+        holding, release = threading.Event(), threading.Event()
+
+        def hold_lock() -> None:
+            with reader._lock:
+                holding.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        holding.wait(5)
+        versions: list[int] = []
+        thread = threading.Thread(
+            target=lambda: versions.append(reader.get_serialized_state().version)
+        )
+        thread.start()
+        thread.join(2)
+        finished = list(versions)
+        release.set()
+        holder.join()
+        thread.join()
+
+        assert finished == [1]
+
+    def test_refresh_interval_limits_backend_reads(self) -> None:
+        """Between refreshes reads serve local state; mutations never do."""
+        backend = InMemoryStateBackend()
+        writer = MonitorService(backend=backend)
+        reader = MonitorService(backend=backend, refresh_interval=3600)
+        assert reader.get_state()["version"] == 0
+
+        writer.update_node("jira", "active")
+
+        assert reader.get_state()["version"] == 0
+        delta = reader.update_node("claude", "active")
+        assert (delta["base_version"], delta["version"]) == (1, 2)
+
+    def test_versions_continue_across_services(self) -> None:
+        """Deltas from different services form one version sequence."""
+        backend = InMemoryStateBackend()
+        first = MonitorService(backend=backend)
+        second = MonitorService(backend=backend)
+
+        first.update_node("jira", "active")
+        delta = second.update_node("claude", "active")
+
+        assert delta["base_version"] == 1
+        assert delta["version"] == 2
+        assert set(delta["nodes"]) == {"claude", "jira"}
+
+    def test_sessions_are_separate(self) -> None:
+        """Each session's backend holds its own state."""
+        backend = InMemoryStateBackend()
+        MonitorService(backend=backend.for_session("loop-a")).update_node(
+            "jira", "active"
+        )
+
+        assert backend.for_session("loop-a").exists()
+        assert backend.for_session("default") is backend
+        assert not backend.exists()
+
+    def test_delete_forgets_session(self) -> None:
+        backend = InMemoryStateBackend()
+        loop_a = backend.for_session("loop-a")
+        MonitorService(backend=loop_a).update_node("jira", "active")
+
+        assert loop_a.delete(1)
+        assert not backend.for_session("loop-a").exists()
+
+
+class TestSqliteStateBackend:
+    """Tests for sharing state between processes through SQLite."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path: Path) -> str:
+        """Path to a fresh state database."""
+        return str(tmp_path / "monitor_state.db")
+
+    def test_state_survives_new_service(self, db_path: str) -> None:
+        """A new service (e.g. a restarted worker) sees the stored state."""
+        MonitorService(backend=SqliteStateBackend(db_path)).set_task_info(
+            title="GE-9", status="running"
+        )
+
+        state = MonitorService(backend=SqliteStateBackend(db_path)).get_state()
+
+        assert state["task_info"]["title"] == "GE-9"
+        assert state["version"] == 1
+
+    def test_reset_is_shared(self, db_path: str) -> None:
+        """Reset on one service clears state for the others."""
+        first = MonitorService(backend=SqliteStateBackend(db_path))
+        second = MonitorService(backend=SqliteStateBackend(db_path))
+        first.update_node("jira", "active")
+
+        second.reset()
+
+        assert first.get_state()["current_node"] is None
+        assert first.get_state()["version"] == 2
+
+    def test_sessions_have_own_rows(self, db_path: str) -> None:
+        """Sessions in one database keep separate state and versions."""
+        backend = SqliteStateBackend(db_path)
+        MonitorService(backend=backend.for_session("loop-a")).update_node(
+            "jira", "active"
+        )
+        MonitorService(backend=backend).update_node("claude", "active")
+        MonitorService(backend=backend).update_node("github", "active")
+
+        loop_a = SqliteStateBackend(db_path, session_id="loop-a")
+        state = MonitorService(backend=loop_a).get_state()
+
+        assert (state["current_node"], state["version"]) == ("jira", 1)
+        assert not backend.for_session("loop-b").exists()
+
+    def test_sessions_do_not_share_a_lock(self, db_path: str) -> None:
+        """A session's open transaction does not block reads of another."""
+        backend = SqliteStateBackend(db_path)
+        MonitorService(backend=backend.for_session("loop-b")).update_node(
+            "jira", "active"
+        )
+        loop_a = backend.for_session("loop-a")
+        loop_b = backend.for_session("loop-b")
+        holding, release = threading.Event(), threading.Event()
+
+        def hold_transaction() -> None:
+            with loop_a.transaction():
+                holding.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_transaction)
+        holder.start()
+        holding.wait(5)
+        results: list[bool] = []
+        reader = threading.Thread(target=lambda: results.append(loop_b.exists()))
+        reader.start()
+        reader.join(2)
+        release.set()
+        holder.join()
+
+        assert results == [True]
+
+    def test_delete_keeps_newer_state(self, db_path: str) -> None:
+        """A state another process stored after the caller's version is kept."""
+        backend = SqliteStateBackend(db_path).for_session("loop-a")
+        service = MonitorService(backend=backend)
+        service.update_node("jira", "active")
+        MonitorService(
+            backend=SqliteStateBackend(db_path, session_id="loop-a")
+        ).update_node("claude", "active")
+
+        assert not backend.delete(service.version)
+        assert backend.delete(2)
+        assert not backend.exists()
+
+    @pytest.mark.slow
+    def test_multi_process_consistency(self, db_path: str) -> None:
+        """Concurrent writers in separate processes never lose updates."""
+        workers, updates = 4, 50
+        MonitorService(backend=SqliteStateBackend(db_path)).reset()
+
+        # Spawn fresh interpreters: SQLite connections must not cross a fork
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_hammer, args=(db_path, w, updates))
+            for w in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        state = MonitorService(backend=SqliteStateBackend(db_path)).get_state()
+        active = [nid for nid, node in state["nodes"].items() if node["active"]]
+
+        assert state["version"] == 1 + workers * updates
+        assert active == [state["current_node"]]
+        assert len(state["event_log"]) == 100
@@ -1,9 +1,13 @@
 """Tests for the Flask application."""
 
+import runpy
+from pathlib import Path
+
 import pytest
 from flask.testing import FlaskClient
 
 from app import create_app
+from src.sejfa.monitor.event_store import open_event_store
 
 
 @pytest.fixture
@@ -137,3 +141,76 @@ class TestAppCreation:
         assert "/api" in rules
         assert "/health" in rules
         assert "/version" in rules
+
+    def test_socketio_async_mode_from_config(self) -> None:
+        """SOCKETIO_ASYNC_MODE selects the Socket.IO server mode."""
+        app = create_app(
+            {
+                "TESTING": True,
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "SOCKETIO_ASYNC_MODE": "threading",
+            }
+        )
+        assert app.extensions["socketio"].async_mode == "threading"
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("MONITOR_RESYNC_INTERVAL", "5"),
+            ("MONITOR_COALESCE_WINDOW_MS", "20"),
+            ("MONITOR_COALESCE_MAX_BATCH", "10"),
+            ("MONITOR_MAX_SESSIONS", "3"),
+            ("MONITOR_SESSION_IDLE_TTL", "60"),
+            ("MONITOR_STATE_REFRESH_INTERVAL", "0.5"),
+        ],
+    )
+    def test_monitor_settings_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, name: str, value: str
+    ) -> None:
+        """Monitor deployment settings can be set through the environment."""
+        monkeypatch.setenv(name, value)
+        app = create_app(
+            {"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}
+        )
+        assert app.config[name] == value
+
+    def test_apps_share_event_store(self, tmp_path: Path) -> None:
+        """Several apps in one process share one store for a directory."""
+        directory = str(tmp_path / "events")
+        config = {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "MONITOR_EVENT_STORE_DIR": directory,
+        }
+        create_app(dict(config))
+        app = create_app(dict(config))
+        client = app.test_client()
+
+        client.post("/api/monitor/state", json={"node": "jira"})
+
+        assert len(client.get("/api/monitor/history").get_json()["events"]) == 1
+        open_event_store(directory).close()
+
+
+class TestGunicornConfig:
+    """Tests for gunicorn.conf.py."""
+
+    CONFIG = str(Path(__file__).resolve().parent.parent / "gunicorn.conf.py")
+
+    @pytest.mark.parametrize(
+        ("queue", "expected"), [(None, 1), ("redis://localhost:6379/0", 4)]
+    )
+    def test_workers_need_message_queue(
+        self, monkeypatch: pytest.MonkeyPatch, queue: str | None, expected: int
+    ) -> None:
+        """Several workers only run when a message queue fans out broadcasts."""
+        monkeypatch.setenv("GUNICORN_WORKERS", "4")
+        monkeypatch.setenv("SOCKETIO_ASYNC_MODE", "threading")
+        if queue:
+            monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", queue)
+        else:
+            monkeypatch.delenv("SOCKETIO_MESSAGE_QUEUE", raising=False)
+
+        config = runpy.run_path(self.CONFIG)
+
+        assert config["workers"] == expected